@@ -0,0 +1,87 @@
+"""
+Import-time budget check for Helldivers Numpad Macros
+Imports main.py in fresh interpreters, reports the median import time and
+fails when it exceeds the budget or when a deferred subsystem (settings
+window, update dialogs/checker, test environment, SVG optimizer) is imported
+eagerly at startup.
+
+Usage: python benchmarks/bench_import_time.py [--runs N] [--budget-ms MS]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_RUNS = 5
+DEFAULT_BUDGET_MS = 400.0
+
+# Modules that must only be imported on first use
+DEFERRED_MODULES = [
+    "src.ui.dialogs",
+    "src.managers.update_manager",
+    "src.managers.update_checker",
+    "src.core.svg_optimizer",
+    "packaging",
+    "urllib.request",
+]
+
+CHILD_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import main
+elapsed_ms = (time.perf_counter() - start) * 1000
+deferred = json.loads(sys.argv[1])
+print(json.dumps({"import_ms": elapsed_ms, "eager": [m for m in deferred if m in sys.modules]}))
+"""
+
+
+def measure_once():
+    """Import main.py in a fresh interpreter and return the child's measurements."""
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT, json.dumps(DEFERRED_MODULES)],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check main.py import time against a budget")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args()
+
+    # First run warms the OS file cache and bytecode; it is not counted
+    measure_once()
+    samples = [measure_once() for _ in range(max(1, args.runs))]
+    timings = [sample["import_ms"] for sample in samples]
+    eager = sorted({module for sample in samples for module in sample["eager"]})
+    median_ms = statistics.median(timings)
+
+    print(f"[Bench] import main: median {median_ms:.1f} ms, min {min(timings):.1f} ms, "
+          f"max {max(timings):.1f} ms over {len(timings)} runs (budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    if median_ms > args.budget_ms:
+        print(f"[Bench] FAIL: import time over budget by {median_ms - args.budget_ms:.1f} ms")
+        failed = True
+    if eager:
+        print(f"[Bench] FAIL: deferred modules imported at startup: {', '.join(eager)}")
+        failed = True
+    if not failed:
+        print("[Bench] OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Plugin discovery scaling benchmark for Helldivers Numpad Macros
+Synthesizes N plugin manifests in a temporary AppData plugin folder and times
+cold discovery (scan + parse) and warm discovery served from the manifest cache.
+Fails when discovery does not return every plugin in sorted precedence order.
+
+Usage: python benchmarks/bench_plugin_discovery.py [--counts 50 200 800] [--runs N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_COUNTS = [50, 200, 800]
+DEFAULT_RUNS = 5
+STRATAGEMS_PER_PLUGIN = 20
+DIRECTIONS = ["up", "down", "left", "right"]
+
+
+def write_plugins(plugins_dir, start, stop):
+    """Write plugins start..stop-1, alternating folder plugins and standalone manifests."""
+    os.makedirs(plugins_dir, exist_ok=True)
+    for index in range(start, stop):
+        plugin_id = f"bench_{index:05d}"
+        manifest = {
+            "id": plugin_id,
+            "name": f"Bench Plugin {index}",
+            "enabled": True,
+            "stratagems_by_department": {
+                f"Bench Department {index % 10}": {
+                    f"{plugin_id} Stratagem {s}": [DIRECTIONS[(index + s + step) % 4] for step in range(4 + s % 4)]
+                    for s in range(STRATAGEMS_PER_PLUGIN)
+                }
+            },
+            "themes": [{"name": f"{plugin_id} Theme", "base": "dark_default"}],
+        }
+        if index % 2:
+            manifest_path = os.path.join(plugins_dir, f"{plugin_id}.json")
+        else:
+            plugin_dir = os.path.join(plugins_dir, plugin_id)
+            os.makedirs(plugin_dir, exist_ok=True)
+            manifest_path = os.path.join(plugin_dir, "plugin.json")
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+
+def time_discovery(plugin_manager, runs, cold=True):
+    """Return (median ms, plugin ids) for repeated discovery runs."""
+    timings = []
+    plugin_ids = []
+    for _ in range(runs):
+        if cold:
+            plugin_manager._manifest_cache.clear()
+        start = time.perf_counter()
+        plugins = plugin_manager._discover_plugins(include_disabled=True)
+        timings.append((time.perf_counter() - start) * 1000)
+        plugin_ids = [plugin["id"] for plugin in plugins]
+    return statistics.median(timings), plugin_ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure plugin discovery scaling with manifest count")
+    parser.add_argument("--counts", type=int, nargs="+", default=DEFAULT_COUNTS)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="hdm-bench-") as temp_root:
+        # Point AppData and the local plugin root at the temp folder before importing the app
+        os.environ["APPDATA"] = temp_root
+        sys.path.insert(0, REPO_ROOT)
+        os.chdir(temp_root)
+        from src.config import PLUGINS_DIR
+        from src.managers.plugin_manager import PluginManager
+
+        print(f"[Bench] {STRATAGEMS_PER_PLUGIN} stratagems per plugin, median of {args.runs} runs")
+        print(f"{'Manifests':>10}{'Cold ms':>12}{'Cached ms':>12}")
+
+        failed = False
+        written = 0
+        for count in sorted(set(args.counts)):
+            # Counts are ascending, so only the missing manifests are added
+            write_plugins(PLUGINS_DIR, written, count)
+            written = count
+
+            cold_ms, plugin_ids = time_discovery(PluginManager, args.runs)
+            cached_ms, cached_ids = time_discovery(PluginManager, args.runs, cold=False)
+            print(f"{count:>10}{cold_ms:>12.1f}{cached_ms:>12.1f}")
+
+            expected_ids = [f"bench_{index:05d}" for index in range(count)]
+            if plugin_ids != expected_ids or cached_ids != expected_ids:
+                print(f"[Bench] FAIL: discovery of {count} manifests is incomplete or out of order")
+                failed = True
+
+        print("[Bench] OK" if not failed else "[Bench] FAIL")
+        return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,285 @@
+"""
+Plugin content scaling benchmark for Helldivers Numpad Macros
+Synthesizes N plugins with M stratagems each (plus icon overrides and themes)
+in a temporary AppData folder and times every stage that grows with plugin
+content: discovery, cold and snapshot loads of build_runtime_data, layer
+merging, sidebar population (_populate_icon_list, offscreen Qt), the in-place
+sidebar update when one plugin is removed or re-added (as on hot reload),
+search (filter_icons) and find_svg_path lookups. Prints one row per size and
+the fitted scaling exponent of each stage, and fails when an interactive stage
+(sidebar population, update or search) exceeds the budget or the updated
+sidebar rows differ from a full rebuild.
+
+Usage: python benchmarks/bench_plugin_scale.py [--plugins 10 50 200] [--stratagems 20]
+                                               [--format folder|package] [--runs N] [--budget-ms MS]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import types
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_PLUGINS = [10, 50, 200]
+DEFAULT_STRATAGEMS = [20]
+DEFAULT_RUNS = 3
+DEFAULT_BUDGET_MS = 100.0
+THEMES_PER_PLUGIN = 2
+DIRECTIONS = ["up", "down", "left", "right"]
+SEARCH_QUERIES = ["eagle", "bench 0001", "stratagem 7", "no such stratagem", ""]
+
+ICON_TEMPLATE = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 64 64">'
+    '<rect x="4" y="4" width="56" height="56" rx="{radius}" fill="#{color:06x}"/>'
+    '<path d="M16 32 L32 {peak} L48 32 Z" fill="#ffffff"/></svg>'
+)
+
+STAGES = ["discover", "cold_load", "snapshot_load", "merge", "populate", "update", "search", "find_svg_us"]
+STAGE_HEADERS = [
+    "Discover ms", "Cold load ms", "Snapshot ms", "Merge ms", "Sidebar ms", "Update ms", "Search ms", "find_svg us",
+]
+INTERACTIVE_STAGES = ["populate", "update", "search"]
+
+
+def write_plugins(plugins_dir, plugin_count, stratagem_count, base_names, as_packages):
+    """Write plugin_count plugins, every other stratagem with its own icon override.
+
+    The first stratagem of each plugin overrides a built-in one so merging sees conflicts.
+    """
+    from src.managers.plugin_package import build_package
+
+    os.makedirs(plugins_dir, exist_ok=True)
+    staging_dir = os.path.join(os.path.dirname(plugins_dir), "staging")
+    for index in range(plugin_count):
+        plugin_id = f"bench_{index:04d}"
+        plugin_dir = os.path.join(staging_dir if as_packages else plugins_dir, plugin_id)
+        os.makedirs(os.path.join(plugin_dir, "icons"), exist_ok=True)
+
+        stratagems = {}
+        icon_overrides = {}
+        for s in range(stratagem_count):
+            name = base_names[index % len(base_names)] if s == 0 else f"Bench {index:04d} Stratagem {s}"
+            stratagems[name] = [DIRECTIONS[(index + s + step) % 4] for step in range(3 + s % 5)]
+            if s % 2 == 0:
+                icon_file = f"icons/s{s}.svg"
+                with open(os.path.join(plugin_dir, icon_file), "w", encoding="utf-8") as f:
+                    f.write(ICON_TEMPLATE.format(radius=s % 9, color=(index * 7919 + s) % 0xFFFFFF, peak=8 + s % 16))
+                icon_overrides[name] = icon_file
+
+        manifest = {
+            "id": plugin_id,
+            "name": f"Bench Plugin {index}",
+            "enabled": True,
+            "stratagems_by_department": {f"Bench Department {index % 12}": stratagems},
+            "icon_overrides": icon_overrides,
+            "themes": [
+                {
+                    "name": f"{plugin_id} Theme {t}",
+                    "colors": {"background_color": "#111111", "border_color": "#333333", "accent_color": "#4a90e2"},
+                }
+                for t in range(THEMES_PER_PLUGIN)
+            ],
+        }
+        with open(os.path.join(plugin_dir, "plugin.json"), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+        if as_packages:
+            build_package(plugin_dir, os.path.join(plugins_dir, f"{plugin_id}.hdplugin"))
+
+    shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def median_ms(func, runs, setup=None):
+    """Median wall time of func() in ms; setup() runs untimed before each call."""
+    timings = []
+    result = None
+    for _ in range(runs):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), result
+
+
+def measure(args, plugin_count, stratagem_count):
+    """Run every stage for one (plugins, stratagems) size and return {stage: value}."""
+    from src.config import PLUGINS_DIR, CACHE_DIR, THEME_FILES
+    from src.config.config import find_svg_path, set_icon_overrides
+    from src.core.stratagem_data import STRATAGEMS_BY_DEPARTMENT
+    from src.managers import plugin_package
+    from src.managers.plugin_manager import PluginManager
+    from src.ui.sidebar import StratagemListView
+    import main
+
+    shutil.rmtree(PLUGINS_DIR, ignore_errors=True)
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+    base_names = [name for entries in STRATAGEMS_BY_DEPARTMENT.values() for name in entries]
+    write_plugins(PLUGINS_DIR, plugin_count, stratagem_count, base_names, args.format == "package")
+
+    def clear_manifest_cache():
+        PluginManager._manifest_cache.clear()
+        for package_path in list(plugin_package._open_packages):
+            plugin_package.close_package(package_path)
+
+    def cold_setup():
+        clear_manifest_cache()
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
+
+    results = {}
+    quiet = io.StringIO()
+    with contextlib.redirect_stdout(quiet):
+        results["discover"], plugins = median_ms(
+            lambda: PluginManager._discover_plugins(), args.runs, clear_manifest_cache
+        )
+        results["cold_load"], _ = median_ms(
+            lambda: PluginManager.build_runtime_data(STRATAGEMS_BY_DEPARTMENT, THEME_FILES), args.runs, cold_setup
+        )
+        results["snapshot_load"], runtime_data = median_ms(
+            lambda: PluginManager.build_runtime_data(STRATAGEMS_BY_DEPARTMENT, THEME_FILES), args.runs
+        )
+        layers = runtime_data["plugin_layers"]
+        results["merge"], _ = median_ms(
+            lambda: PluginManager._combine_layers(STRATAGEMS_BY_DEPARTMENT, THEME_FILES, layers), args.runs
+        )
+
+    # Only the attributes _populate_icon_list and filter_icons read on the app window
+    view = StratagemListView()
+    view.resize(320, 900)
+    host = types.SimpleNamespace(
+        stratagems_by_department=runtime_data["stratagems_by_department"],
+        department_expanded_state={},
+        icon_list=view,
+        toggle_all_collapsed=False,
+        update_toggle_all_button_state=lambda: None,
+    )
+    set_icon_overrides(dict(runtime_data["icon_overrides"]))
+
+    results["populate"], _ = median_ms(lambda: main.StratagemApp._populate_icon_list(host), args.runs)
+
+    # Hot reload of one plugin: toggle a middle layer in the catalogue, then update the sidebar in place
+    catalogue = runtime_data["catalogue"]
+    toggled = layers[len(layers) // 2] if layers else None
+    update_mismatches = []
+
+    def toggle_layer():
+        if toggled is None:
+            return
+        if catalogue.layer(toggled["manifest_path"]) is not None:
+            catalogue.remove_layer(toggled["manifest_path"])
+        else:
+            catalogue.put_layer(PluginManager.catalogue_layer(toggled), len(layers) // 2)
+
+    def update_sidebar():
+        view.update_catalogue(host.stratagems_by_department)
+        model = view.list_model
+        if model._rows != model._visible_entries() or model._entries != model._catalogue_entries(
+            host.stratagems_by_department
+        ):
+            update_mismatches.append(True)
+
+    # Even run count so the toggled plugin ends up merged again
+    results["update"], _ = median_ms(update_sidebar, args.runs * 2, toggle_layer)
+    results["update_ok"] = not update_mismatches
+
+    search_timings = []
+    for query in SEARCH_QUERIES:
+        # Start each run from a different filter; repeating the same query is a no-op
+        previous = "no such stratagem" if query == "" else ""
+        query_ms, _ = median_ms(
+            lambda: main.StratagemApp.filter_icons(host, query), args.runs,
+            lambda: main.StratagemApp.filter_icons(host, previous),
+        )
+        search_timings.append(query_ms)
+    results["search"] = max(search_timings)
+
+    names = list(runtime_data["stratagems"])
+    lookup_ms, _ = median_ms(lambda: [find_svg_path(name) for name in names], args.runs)
+    results["find_svg_us"] = lookup_ms * 1000 / max(1, len(names))
+
+    results["stratagems"] = len(names)
+    results["icons"] = len(runtime_data["icon_overrides"])
+    results["plugins"] = len(plugins)
+    results["sidebar_rows"] = view.list_model.rowCount()
+    # Dropped without running the event loop, so the queued icon prefetch never starts
+    del host, view
+    return results
+
+
+def scaling_exponent(rows, stage):
+    """Slope of log(time) over log(total stratagems) between the smallest and largest size."""
+    first, last = rows[0], rows[-1]
+    if last["stratagems"] <= first["stratagems"] or first[stage] <= 0 or last[stage] <= 0:
+        return None
+    return math.log(last[stage] / first[stage]) / math.log(last["stratagems"] / first["stratagems"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure how plugin loading, sidebar and search scale with plugin content")
+    parser.add_argument("--plugins", type=int, nargs="+", default=DEFAULT_PLUGINS)
+    parser.add_argument("--stratagems", type=int, nargs="+", default=DEFAULT_STRATAGEMS)
+    parser.add_argument("--format", choices=["folder", "package"], default="folder")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="Budget for sidebar population, in-place update and the slowest search query")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="hdm-bench-") as temp_root:
+        # Point AppData and the local plugin root at the temp folder before importing the app
+        os.environ["APPDATA"] = temp_root
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        sys.path.insert(0, REPO_ROOT)
+        os.chdir(temp_root)
+        from PyQt6.QtWidgets import QApplication
+        app = QApplication.instance() or QApplication([])  # noqa: F841 - widgets need a live application
+
+        print(f"[Bench] {args.format} plugins, {THEMES_PER_PLUGIN} themes and an icon for every other stratagem "
+              f"per plugin, median of {args.runs} runs, search = slowest of {len(SEARCH_QUERIES)} queries")
+        header = f"{'Plugins':>8}{'x Strat':>8}{'Total':>8}{'Rows':>8}" + "".join(f"{h:>14}" for h in STAGE_HEADERS)
+        print(header)
+
+        failed = False
+        for stratagem_count in sorted(set(args.stratagems)):
+            rows = []
+            for plugin_count in sorted(set(args.plugins)):
+                row = measure(args, plugin_count, stratagem_count)
+                rows.append(row)
+                print(f"{plugin_count:>8}{stratagem_count:>8}{row['stratagems']:>8}{row['sidebar_rows']:>8}"
+                      + "".join(f"{row[stage]:>14.2f}" for stage in STAGES))
+
+                for stage in INTERACTIVE_STAGES:
+                    if row[stage] > args.budget_ms:
+                        print(f"[Bench] Over budget: {stage} {row[stage]:.1f} ms > {args.budget_ms:.0f} ms "
+                              f"at {plugin_count} plugins x {stratagem_count} stratagems")
+                        failed = True
+                if not row["update_ok"]:
+                    print(f"[Bench] FAIL: in-place sidebar update differs from a full rebuild "
+                          f"at {plugin_count} plugins x {stratagem_count} stratagems")
+                    failed = True
+                if row["plugins"] != plugin_count:
+                    print(f"[Bench] FAIL: discovered {row['plugins']} of {plugin_count} plugins")
+                    failed = True
+
+            exponents = []
+            for stage, label in zip(STAGES, STAGE_HEADERS):
+                exponent = scaling_exponent(rows, stage)
+                if exponent is not None:
+                    exponents.append(f"{label.rsplit(' ', 1)[0]} ^{exponent:.2f}")
+            if exponents:
+                print(f"[Bench] Scaling with total stratagems (x {stratagem_count}): " + ", ".join(exponents))
+
+        print("[Bench] OK" if not failed else "[Bench] FAIL")
+        return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+SVG optimizer benchmark for Helldivers Numpad Macros
+Optimizes every SVG under assets/, reports time and size savings, and renders
+each source and optimized icon offscreen to check they stay pixel-identical.
+Also runs regression cases for markup the optimizer must keep intact (styles
+inside <defs>, compact arc flags in path data). Fails on any mismatch.
+
+Usage: python benchmarks/bench_svg_optimizer.py [--size PX] [--tolerance N]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SIZE = 126
+# Largest per-channel difference allowed between source and optimized renders
+DEFAULT_TOLERANCE = 2
+
+STYLE_IN_DEFS_SVG = (
+    b'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 64 64">'
+    b'<defs><style>.cls-1{fill:#4a90e2}</style><linearGradient id="unused"/></defs>'
+    b'<rect class="cls-1" x="8" y="8" width="48" height="48"/></svg>'
+)
+COMPACT_ARC_SVG = (
+    b'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 64 64">'
+    b'<path fill="#fff" d="M20 32a12 12 0 01.5.5 12.25 12.25 0 1022 6.123456z"/></svg>'
+)
+
+
+def render(data, size):
+    """Render SVG bytes into a size x size ARGB image."""
+    from PyQt6.QtCore import QByteArray
+    from PyQt6.QtSvg import QSvgRenderer
+    from src.ui.icon_cache import render_svg_image
+
+    return render_svg_image(QSvgRenderer(QByteArray(data)), size, size)
+
+
+def max_difference(first, second):
+    """Largest per-channel difference between two equally sized images (or None if not comparable)."""
+    if first is None or second is None or first.size() != second.size():
+        return None
+    first_bytes = first.constBits().asstring(first.sizeInBytes())
+    second_bytes = second.constBits().asstring(second.sizeInBytes())
+    if first_bytes == second_bytes:
+        return 0
+    return max(abs(a - b) for a, b in zip(first_bytes, second_bytes))
+
+
+def check_regressions(size, tolerance):
+    """Return failure messages for the optimizer regression cases."""
+    from src.core.svg_optimizer import optimize_svg, round_path_data
+
+    failures = []
+    optimized, _ = optimize_svg(STYLE_IN_DEFS_SVG)
+    if b"<style>" not in optimized or b"unused" in optimized:
+        failures.append(f"<defs><style> not preserved or unused def kept: {optimized!r}")
+
+    compact = round_path_data("M10 10a5 5 0 01.5.5z")
+    if compact != "M10 10a5 5 0 0 1 .5.5z":
+        failures.append(f"arc flags mangled: {compact!r}")
+
+    for name, source in (("style in defs", STYLE_IN_DEFS_SVG), ("compact arcs", COMPACT_ARC_SVG)):
+        optimized, _ = optimize_svg(source)
+        difference = max_difference(render(source, size), render(optimized, size))
+        if difference is None or difference > tolerance:
+            failures.append(f"{name}: optimized render differs (max channel difference {difference})")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check SVG optimizer savings and render fidelity on the bundled icons")
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE)
+    parser.add_argument("--tolerance", type=int, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, REPO_ROOT)
+    from PyQt6.QtGui import QGuiApplication
+    app = QGuiApplication.instance() or QGuiApplication([])  # noqa: F841 - QPainter needs a live application
+    from src.core.svg_optimizer import optimize_svg
+
+    paths = sorted(glob.glob(os.path.join(REPO_ROOT, "assets", "**", "*.svg"), recursive=True))
+    source_size = optimized_size = 0
+    optimize_ms = 0.0
+    mismatches = []
+    for path in paths:
+        with open(path, "rb") as f:
+            source = f.read()
+        start = time.perf_counter()
+        optimized, _ = optimize_svg(source)
+        optimize_ms += (time.perf_counter() - start) * 1000
+        source_size += len(source)
+        optimized_size += len(optimized)
+
+        difference = max_difference(render(source, args.size), render(optimized, args.size))
+        if difference is None or difference > args.tolerance:
+            mismatches.append((os.path.relpath(path, REPO_ROOT), difference))
+
+    saved = 100 * (1 - optimized_size / source_size) if source_size else 0
+    print(f"[Bench] {len(paths)} icons: {source_size // 1024} KB -> {optimized_size // 1024} KB "
+          f"({saved:.1f}% smaller) in {optimize_ms:.1f} ms")
+    for relative_path, difference in mismatches:
+        print(f"[Bench] Render mismatch at {args.size} px: {relative_path} (max channel difference {difference})")
+
+    failures = check_regressions(args.size, args.tolerance)
+    for failure in failures:
+        print(f"[Bench] Regression: {failure}")
+
+    failed = bool(mismatches or failures)
+    print("[Bench] OK" if not failed else "[Bench] FAIL")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
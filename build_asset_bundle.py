@@ -0,0 +1,37 @@
+"""
+Pack stratagem icons and QSS themes into a single indexed asset bundle
+Frozen builds ship this file instead of hundreds of loose SVGs (see src/config/asset_bundle.py)
+"""
+
+import sys
+from pathlib import Path
+
+from src.config.asset_bundle import BUNDLE_FILENAME, write_asset_bundle
+from src.config.constants import THEME_FILES
+from src.core.svg_optimizer import optimize_svg
+
+ASSETS_ROOT = Path("assets")
+OUTPUT_PATH = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("build") / BUNDLE_FILENAME
+
+members = {}
+
+source_size = 0
+
+# Stratagem and UI icons, keyed by their posix path relative to the project root
+for svg_path in sorted(ASSETS_ROOT.rglob("*.svg")):
+    source = svg_path.read_bytes()
+    source_size += len(source)
+    optimized, warnings = optimize_svg(source)
+    for warning in warnings:
+        print(f"[WARN] {svg_path.as_posix()}: {warning}")
+    members[svg_path.as_posix()] = optimized
+
+for theme_ref in THEME_FILES.values():
+    theme_path = Path(theme_ref)
+    members[theme_path.as_posix()] = theme_path.read_bytes()
+
+count = write_asset_bundle(str(OUTPUT_PATH), members)
+total_size = sum(len(data) for data in members.values())
+svg_size = sum(len(data) for name, data in members.items() if name.endswith(".svg"))
+print(f"[OK] Optimized SVGs: {source_size // 1024} KB -> {svg_size // 1024} KB")
+print(f"[OK] Packed {count} assets ({total_size // 1024} KB) into {OUTPUT_PATH}")
@@ -50,19 +50,27 @@ if exist "dist" rmdir /s /q "dist"
 if exist "HelldiversNumpadMacros.spec" del "HelldiversNumpadMacros.spec"
 if exist "Helldivers2StratCommander.spec" del "Helldivers2StratCommander.spec"
 
+echo.
+echo [Step 1b/4] Packing asset bundle...
+python build_asset_bundle.py build\assets.hdbundle
+if errorlevel 1 (
+    echo ERROR: Failed to pack asset bundle
+    pause < con
+    exit /b 1
+)
+
 echo.
 echo [Step 2/4] Building EXE with PyInstaller...
 echo This may take a few minutes...
 
 pyinstaller --noconfirm --onefile --windowed ^
     --name "Helldivers2StratCommander" ^
-    --add-data "assets;assets" ^
+    --add-data "build/assets.hdbundle;." ^
+    --add-data "assets/*.svg;assets" ^
+    --add-data "assets/icon.ico;assets" ^
     --add-data "src/core/stratagem_data.py;." ^
     --add-data "src/config/version.py;." ^
     --add-data "src/managers/update_checker.py;." ^
-    --add-data "src/ui/theme_dark_default.qss;src/ui/" ^
-    --add-data "src/ui/theme_dark_blue.qss;src/ui/" ^
-    --add-data "src/ui/theme_dark_red.qss;src/ui/" ^
     --version-file "version_file.txt" ^
     --icon "assets/icon.ico" ^
     --manifest "app.manifest" ^
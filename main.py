@@ -2,6 +2,9 @@ import sys
 import os
 import ctypes
 import json
+import time
+
+from startup_profiler import startup_profiler
 
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QGridLayout, QLabel,
                              QHBoxLayout, QVBoxLayout, QLineEdit, QPushButton, QComboBox,
@@ -9,22 +12,24 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QGridLayout, QL
                              QSizePolicy, QListWidgetItem, QSlider, QInputDialog,
                              QFileDialog, QStackedWidget, QFormLayout, QDialog, QBoxLayout,
                              QPlainTextEdit, QStyle, QColorDialog)
-from PyQt6.QtCore import Qt, QTimer, QEvent, QSize, pyqtSignal, QByteArray, QPoint
-from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QCursor, QKeySequence
-from PyQt6.QtSvg import QSvgRenderer
+from PyQt6.QtCore import Qt, QTimer, QEvent, QSize, pyqtSignal, QPoint
+from PyQt6.QtGui import QIcon, QColor, QCursor, QKeySequence
 
 from src.config import (PROFILES_DIR, ASSETS_DIR, get_theme_stylesheet, load_settings, 
-                       save_settings, get_asset_path, set_icon_overrides)
+                       save_settings, flush_settings, bootstrap, get_asset_path, set_icon_overrides, asset_exists)
 from src.config.constants import NUMPAD_LAYOUT, THEME_FILES, KEYBIND_MAPPINGS, NUMPAD_GRID_WIDTH, NUMPAD_GRID_HEIGHT
 from src.core.stratagem_data import STRATAGEMS_BY_DEPARTMENT as BASE_STRATAGEMS_BY_DEPARTMENT
 from src.config.version import VERSION, APP_NAME
-from src.ui.dialogs import TestEnvironment, SettingsWindow
-from src.ui.widgets import DraggableIcon, NumpadSlot, comm, CollapsibleDepartmentHeader, DeletableComboBox
+from src.ui.widgets import NumpadSlot, comm, DeletableComboBox
+from src.ui.sidebar import StratagemListView
+from src.ui.icon_cache import icon_cache
+from src.ui.svg_pool import svg_pool
 from src.managers.profile_manager import ProfileManager
 from src.managers.plugin_manager import PluginManager
+from src.managers.plugin_watcher import PluginWatcher
+from src.managers.plugin_loader import PluginLoadThread
 from src.core.macro_engine import MacroEngine
 from src.ui.tray_manager import TrayManager
-from src.managers.update_manager import check_for_updates_startup
 
 
 DEFAULT_SLOT_LAYOUT_NAME = "Default Numpad"
@@ -450,9 +455,11 @@ class StratagemApp(QMainWindow):
     
     def __init__(self):
         super().__init__()
+        bootstrap()
         self.slots = {}
         self.setWindowTitle(f"{APP_NAME} - Numpad Commander")
-        self.global_settings = load_settings()
+        with startup_profiler.phase("load_settings"):
+            self.global_settings = load_settings()
         self.slot_layouts = self._load_slot_layouts_from_settings()
         self.active_slot_layout_name = self._sanitize_layout_name(
             self.global_settings.get("active_slot_layout", DEFAULT_SLOT_LAYOUT_NAME)
@@ -490,7 +497,8 @@ class StratagemApp(QMainWindow):
         self.plugin_creator_dirty = False
         self._macro_state_before_plugins = None
         self._macro_forced_by_plugins = False
-        self._load_runtime_plugin_data()
+        with startup_profiler.phase("_load_base_runtime_data"):
+            self._load_base_runtime_data()
         self.saved_state = None
         self.undo_btn = None
         self.save_btn = None
@@ -499,21 +507,29 @@ class StratagemApp(QMainWindow):
         self.macro_engine = MacroEngine(
             lambda: self.slots,
             lambda: self.global_settings,
-            self.map_direction_to_key
+            self.map_direction_to_key,
+            lambda: self.stratagems,
         )
         
-        self.initUI()
-        self.refresh_profiles()
+        with startup_profiler.phase("initUI"):
+            self.initUI()
+        with startup_profiler.phase("refresh_profiles"):
+            self.refresh_profiles()
         
-        self.tray_manager = TrayManager(
-            self.app_icon if hasattr(self, 'app_icon') and self.app_icon else None
-        )
-        self.tray_manager.toggle_macros.connect(self.set_macros_enabled)
-        self.tray_manager.show_window.connect(self._show_window)
-        self.tray_manager.quit_app.connect(self.quit_application)
-        self.tray_manager.setup()
+        with startup_profiler.phase("tray setup"):
+            self.tray_manager = TrayManager(
+                self.app_icon if hasattr(self, 'app_icon') and self.app_icon else None
+            )
+            self.tray_manager.toggle_macros.connect(self.set_macros_enabled)
+            self.tray_manager.show_window.connect(self._show_window)
+            self.tray_manager.quit_app.connect(self.quit_application)
+            self.tray_manager.setup()
         
-        self._autoload_last_profile()
+        with startup_profiler.phase("_autoload_last_profile"):
+            self._autoload_last_profile()
+
+        # Plugins are merged after the window is shown; the watcher starts once they are in
+        QTimer.singleShot(0, self._start_plugin_loading)
         
         if self.global_settings.get("auto_check_updates", True):
             QTimer.singleShot(1000, self.check_for_updates_startup)
@@ -724,16 +740,170 @@ class StratagemApp(QMainWindow):
 
         return [(scan, label, row, col, rowspan, colspan, False) for scan, label, row, col, rowspan, colspan in NUMPAD_LAYOUT]
 
-    def _load_runtime_plugin_data(self):
-        """Load merged runtime plugin data into app state."""
-        runtime_data = PluginManager.build_runtime_data(BASE_STRATAGEMS_BY_DEPARTMENT, THEME_FILES)
+    # Plugin layers added to the catalogue (and sidebar) per event loop pass during startup
+    PLUGIN_LAYER_BATCH = 16
+
+    def _load_base_runtime_data(self):
+        """Load the built-in catalogue and user themes; plugin layers are added later by _start_plugin_loading."""
+        runtime_data = PluginManager.base_runtime_data(BASE_STRATAGEMS_BY_DEPARTMENT, THEME_FILES)
+        self.plugins_loading = True
+        self._pending_plugin_layers = []
+        self._pending_plugin_changes = None
+        # Live read-only views over the layered catalogue (base + plugin layers + user layer)
+        self.catalogue = runtime_data["catalogue"]
         self.stratagems_by_department = runtime_data["stratagems_by_department"]
         self.stratagems = runtime_data["stratagems"]
         self.theme_files = runtime_data["theme_files"]
-        self.theme_sources = runtime_data.get("theme_sources", {})
+        self.icon_overrides = runtime_data["icon_overrides"]
         self.loaded_plugins = runtime_data["loaded_plugins"]
+        self.plugin_layers = runtime_data.get("plugin_layers", [])
         self._merge_custom_themes_into_runtime()
-        set_icon_overrides(runtime_data["icon_overrides"])
+        set_icon_overrides(dict(self.icon_overrides))
+
+    def _start_plugin_loading(self):
+        """Build plugin layers on a worker thread; they are merged in batches when ready."""
+        # Overlaps first paint, so it is listed as its own top-level phase
+        self._plugin_load_profile = startup_profiler.begin("plugin merge (background)", detached=True)
+        self.plugin_load_thread = PluginLoadThread(BASE_STRATAGEMS_BY_DEPARTMENT, THEME_FILES, self)
+        self.plugin_load_thread.layersLoaded.connect(self._on_plugin_layers_loaded)
+        self.plugin_load_thread.error.connect(self._on_plugin_load_error)
+        self.plugin_load_thread.start()
+
+    def _on_plugin_load_error(self, message):
+        print(f"[Plugins] Background plugin load failed: {message}")
+        self._finish_plugin_loading()
+
+    def _on_plugin_layers_loaded(self, layers):
+        self._pending_plugin_layers = list(layers)
+        self._merge_next_plugin_batch()
+
+    def _merge_next_plugin_batch(self):
+        """Add the next few plugin layers, inserting their rows into the sidebar, then yield to the event loop."""
+        batch = self._pending_plugin_layers[:self.PLUGIN_LAYER_BATCH]
+        del self._pending_plugin_layers[:self.PLUGIN_LAYER_BATCH]
+        if batch:
+            self._install_plugin_layers(self.plugin_layers + batch)
+        if self._pending_plugin_layers:
+            QTimer.singleShot(0, self._merge_next_plugin_batch)
+        else:
+            self._finish_plugin_loading()
+
+    def _finish_plugin_loading(self):
+        self.plugins_loading = False
+        PluginManager.report_plugin_layers(self.plugin_layers)
+
+        # A saved plugin theme was shown as the default until now; drop it only if it never appeared
+        theme_name = self.global_settings.get("theme", "Dark (Default)")
+        if theme_name not in self.theme_files:
+            self.global_settings["theme"] = "Dark (Default)"
+            self.save_global_settings()
+
+        self._start_plugin_watcher()
+        # The catalogue is final now; drop cached renditions of icons it no longer uses
+        icon_cache.prune(self.icon_list.icon_paths())
+        startup_profiler.end(self._plugin_load_profile)
+        # Startup is complete once plugins are merged
+        startup_profiler.finish()
+        if self.loaded_plugins:
+            self.show_status(f"Loaded {len(self.loaded_plugins)} customization pack(s)", 1800)
+
+        pending_changes = self._pending_plugin_changes
+        self._pending_plugin_changes = None
+        if pending_changes is not None:
+            self._apply_plugin_layer_changes(sorted(pending_changes))
+
+    def _start_plugin_watcher(self):
+        """Watch plugin folders so edited, added or removed plugins reload live."""
+        self.plugin_watcher = PluginWatcher(self)
+        self.plugin_watcher.pluginsChanged.connect(self.reload_changed_plugins)
+        self._refresh_plugin_watch()
+
+    def _refresh_plugin_watch(self):
+        if hasattr(self, "plugin_watcher"):
+            self.plugin_watcher.watch(PluginManager.get_plugin_roots(), self.plugin_layers)
+
+    def reload_changed_plugins(self, changed_paths):
+        """Reload only the plugins whose files changed and update sidebar, themes and slots in place."""
+        self._apply_plugin_layer_changes(changed_paths)
+        self.show_status("Plugins reloaded", 1800)
+
+    def _apply_plugin_layer_changes(self, changed_paths):
+        """Reload changed, added and removed plugins; deferred until the startup merge is done."""
+        if self.plugins_loading:
+            if self._pending_plugin_changes is None:
+                self._pending_plugin_changes = set()
+            self._pending_plugin_changes.update(changed_paths)
+            return
+
+        layers = PluginManager.reload_plugin_layers(
+            self.plugin_layers,
+            BASE_STRATAGEMS_BY_DEPARTMENT,
+            THEME_FILES,
+            changed_paths,
+        )
+        self._install_plugin_layers(layers)
+        self._refresh_plugin_watch()
+
+    def _install_plugin_layers(self, layers):
+        """Swap the catalogue's plugin layers for layers and refresh sidebar, slots and theme in place."""
+        previous_layers = {layer["manifest_path"]: layer for layer in self.plugin_layers}
+        theme_name = self.global_settings.get("theme", "Dark (Default)")
+        old_palette = self.theme_files.get(theme_name)
+        old_overrides = dict(self.icon_overrides)
+
+        # Only the layers that changed touch the catalogue; the registry views update with it
+        current_paths = {layer["manifest_path"] for layer in layers}
+        stale_icon_paths = set()
+        for manifest_path, previous_layer in previous_layers.items():
+            if manifest_path not in current_paths:
+                self.catalogue.remove_layer(manifest_path)
+                stale_icon_paths.update(previous_layer.get("icon_overrides", {}).values())
+        for position, layer in enumerate(layers):
+            previous_layer = previous_layers.get(layer["manifest_path"])
+            if previous_layer is not layer:
+                self.catalogue.put_layer(PluginManager.catalogue_layer(layer), position)
+                if previous_layer is not None:
+                    stale_icon_paths.update(previous_layer.get("icon_overrides", {}).values())
+
+        # Package members keep their hdplugin:// path when the package is edited or reinstalled
+        for icon_path in stale_icon_paths:
+            icon_cache.invalidate(icon_path)
+            svg_pool.invalidate(icon_path)
+
+        self.plugin_layers = layers
+        self.loaded_plugins = [layer["name"] for layer in layers]
+
+        new_overrides = dict(self.icon_overrides)
+        changed_icons = {
+            name for name in set(old_overrides) | set(new_overrides)
+            if old_overrides.get(name) != new_overrides.get(name) or new_overrides.get(name) in stale_icon_paths
+        }
+        if changed_icons:
+            set_icon_overrides(new_overrides)
+
+        if hasattr(self, "icon_list"):
+            for department in list(self.department_expanded_state):
+                if department not in self.stratagems_by_department:
+                    del self.department_expanded_state[department]
+            for department in self.stratagems_by_department:
+                self.department_expanded_state.setdefault(department, True)
+            self.icon_list.update_catalogue(self.stratagems_by_department, changed_icons)
+            self.update_header_widths()
+
+        for slot in self.slots.values():
+            if slot.assigned_stratagem in changed_icons:
+                slot.refresh_icon()
+
+        if theme_name not in self.theme_files:
+            # During startup the theme may belong to a plugin that has not been merged yet
+            if not self.plugins_loading:
+                self.global_settings["theme"] = "Dark (Default)"
+                self.save_global_settings()
+                self.apply_theme("Dark (Default)")
+        elif self.theme_files.get(theme_name) != old_palette:
+            self.apply_theme(theme_name)
+
+        self.refresh_main_plugins_page()
 
     def _normalize_custom_theme_colors(self, colors):
         """Normalize custom theme palette values into expected keys."""
@@ -759,18 +929,18 @@ class StratagemApp(QMainWindow):
         }
 
     def _merge_custom_themes_into_runtime(self):
-        """Merge persisted user custom themes into runtime theme list."""
+        """Load persisted user custom themes into the catalogue's user layer."""
         custom_themes = self.global_settings.get("custom_themes", {})
         if not isinstance(custom_themes, dict):
             return
 
+        user_themes = {}
         for theme_name, palette in custom_themes.items():
             if not isinstance(theme_name, str) or not theme_name.strip():
                 continue
 
-            clean_name = theme_name.strip()
-            self.theme_files[clean_name] = self._normalize_custom_theme_colors(palette)
-            self.theme_sources[clean_name] = "User custom"
+            user_themes[theme_name.strip()] = self._normalize_custom_theme_colors(palette)
+        self.catalogue.set_user_themes(user_themes)
 
     def save_custom_theme(self, theme_name, colors):
         """Persist a user-created custom theme and inject it into runtime theme list."""
@@ -786,8 +956,7 @@ class StratagemApp(QMainWindow):
 
         custom_themes[clean_name] = palette
         self.global_settings["custom_themes"] = custom_themes
-        self.theme_files[clean_name] = palette
-        self.theme_sources[clean_name] = "User custom"
+        self.catalogue.set_user_theme(clean_name, palette)
         self.save_global_settings()
         return True
 
@@ -804,8 +973,7 @@ class StratagemApp(QMainWindow):
         custom_themes.pop(clean_name, None)
         self.global_settings["custom_themes"] = custom_themes
 
-        self.theme_files.pop(clean_name, None)
-        self.theme_sources.pop(clean_name, None)
+        self.catalogue.remove_user_theme(clean_name)
 
         if self.global_settings.get("theme") == clean_name:
             self.global_settings["theme"] = "Dark (Default)"
@@ -814,41 +982,14 @@ class StratagemApp(QMainWindow):
         self.save_global_settings()
         return True
 
-    def _rebuild_icon_sidebar(self):
-        """Rebuild stratagem sidebar list after plugin/theme runtime changes."""
-        if not hasattr(self, "icon_list"):
-            return
-
-        search_text = self.search.text() if hasattr(self, "search") else ""
-        self.icon_list.clear()
-        self.icon_widgets = []
-        self.icon_items = []
-        self.header_items = []
-        self.department_expanded_state = {}
-        self.toggle_all_collapsed = False
-        self.update_toggle_all_button_state()
-
-        self._populate_icon_list()
-        self.filter_icons(search_text)
-        self.update_header_widths()
-
     def apply_plugin_manifest_selection(self, selected_manifest_paths):
         """Apply plugin checkbox selection, reload runtime data and refresh sidebar/themes."""
         if not PluginManager.set_enabled_manifests(selected_manifest_paths):
             self.show_status("Plugin selection invalid", 2000)
             return
 
-        self._load_runtime_plugin_data()
-        self._rebuild_icon_sidebar()
-
-        theme_name = self.global_settings.get("theme", "Dark (Default)")
-        if theme_name not in self.theme_files:
-            theme_name = "Dark (Default)"
-            self.global_settings["theme"] = theme_name
-            self.save_global_settings()
-
-        self.apply_theme(theme_name)
-        self.refresh_main_plugins_page()
+        # Newly enabled plugins are added and disabled ones removed as single layers
+        self._apply_plugin_layer_changes([])
         self.show_status("Customizations applied and reloaded", 2200)
 
     def initUI(self):
@@ -860,9 +1001,12 @@ class StratagemApp(QMainWindow):
         theme_name = self.global_settings.get("theme", "Dark (Default)")
         if theme_name not in self.theme_files:
             theme_name = "Dark (Default)"
-            self.global_settings["theme"] = theme_name
-            self.save_global_settings()
-        self.apply_theme(theme_name)
+            # Plugin themes are applied once plugins are merged; keep the saved choice until then
+            if not self.plugins_loading:
+                self.global_settings["theme"] = theme_name
+                self.save_global_settings()
+        with startup_profiler.phase("apply_theme"):
+            self.apply_theme(theme_name)
         
         self._load_app_icon()
         
@@ -1191,10 +1335,15 @@ class StratagemApp(QMainWindow):
         btn_export = QPushButton("")
         import_icon_path = get_asset_path("import.svg")
         export_icon_path = get_asset_path("export.svg")
-        if os.path.exists(import_icon_path):
-            btn_import.setIcon(QIcon(import_icon_path))
-        if os.path.exists(export_icon_path):
-            btn_export.setIcon(QIcon(export_icon_path))
+        dpr = self.devicePixelRatioF()
+        if asset_exists(import_icon_path):
+            import_icon = svg_pool.icon(18, 18, dpr, path=import_icon_path)
+            if import_icon:
+                btn_import.setIcon(import_icon)
+        if asset_exists(export_icon_path):
+            export_icon = svg_pool.icon(18, 18, dpr, path=export_icon_path)
+            if export_icon:
+                btn_export.setIcon(export_icon)
         btn_import.setIconSize(QSize(18, 18))
         btn_export.setIconSize(QSize(18, 18))
 
@@ -1216,14 +1365,16 @@ class StratagemApp(QMainWindow):
         btn_layout.addStretch(1)
         
         self.undo_btn = QPushButton("↶")
+        self.undo_btn.setObjectName("undo_button")
         self.save_btn = QPushButton("💾")
+        self.save_btn.setObjectName("save_button")
         btn_test = QPushButton("🧪")
         btn_clear = QPushButton("🗑️")
         
         buttons = [
             (self.undo_btn, "Undo Changes", self.undo_changes),
             (self.save_btn, "Save Profile", self.manual_save),
-            (btn_test, "Test Mode", lambda: TestEnvironment().exec()),
+            (btn_test, "Test Mode", self.open_test_environment),
             (btn_clear, "Clear", self.confirm_clear)
         ]
         
@@ -1267,7 +1418,8 @@ class StratagemApp(QMainWindow):
         self.commander_layout = QBoxLayout(QBoxLayout.Direction.LeftToRight, commander_widget)
         self.commander_layout.setContentsMargins(0, 0, 0, 0)
         self.commander_layout.setSpacing(0)
-        self._create_sidebar(self.commander_layout)
+        with startup_profiler.phase("sidebar population"):
+            self._create_sidebar(self.commander_layout)
         self._create_numpad_grid(self.commander_layout)
         self._apply_commander_layout_mode()
         self.content_stack.addWidget(commander_widget)
@@ -1733,22 +1885,13 @@ class StratagemApp(QMainWindow):
         """Build a small icon from svg path or pasted svg code."""
         icon_size = QSize(16, 16)
 
+        dpr = self.devicePixelRatioF()
+
         if svg_path and os.path.exists(svg_path):
-            return QIcon(svg_path)
+            return svg_pool.icon(icon_size.width(), icon_size.height(), dpr, path=svg_path)
 
         if svg_code:
-            renderer = QSvgRenderer(QByteArray(svg_code.encode("utf-8")))
-            if not renderer.isValid():
-                return None
-
-            pixmap = QPixmap(icon_size)
-            pixmap.fill(Qt.GlobalColor.transparent)
-
-            painter = QPainter(pixmap)
-            renderer.render(painter)
-            painter.end()
-
-            return QIcon(pixmap)
+            return svg_pool.icon(icon_size.width(), icon_size.height(), dpr, svg_data=svg_code)
 
         return None
 
@@ -1853,8 +1996,10 @@ class StratagemApp(QMainWindow):
                     generated_svg_name = f"{safe_name}_{safe_stratagem_name}.svg"
                     generated_svg_path = os.path.join(generated_svg_dir, generated_svg_name)
                     try:
-                        with open(generated_svg_path, "w", encoding="utf-8") as svg_file:
-                            svg_file.write(svg_code)
+                        from src.core.svg_optimizer import optimize_svg
+                        optimized_svg, _ = optimize_svg(svg_code)
+                        with open(generated_svg_path, "wb") as svg_file:
+                            svg_file.write(optimized_svg)
                     except Exception as e:
                         QMessageBox.warning(self, "Create Plugin", f"Failed writing SVG code file:\n{e}")
                         return
@@ -1902,7 +2047,7 @@ class StratagemApp(QMainWindow):
 
         self.show_plugins_list_view(confirm_unsaved=False, reset_form=True)
         self.plugin_creator_dirty = False
-        self.refresh_main_plugins_page()
+        self.reload_changed_plugins([target_file])
         self.show_status("Plugin created", 1800)
 
     def _create_sidebar(self, content_layout):
@@ -1946,23 +2091,11 @@ class StratagemApp(QMainWindow):
         self.update_toggle_all_button_state()
         side.addWidget(self.toggle_all_btn)
         
-        self.icon_list = QListWidget()
+        self.icon_list = StratagemListView()
         self.icon_list.setObjectName("icon_list")
-        self.icon_list.setViewMode(QListWidget.ViewMode.IconMode)
-        self.icon_list.setFlow(QListWidget.Flow.LeftToRight)
-        self.icon_list.setWrapping(True)
-        self.icon_list.setResizeMode(QListWidget.ResizeMode.Adjust)
-        self.icon_list.setMovement(QListWidget.Movement.Static)
-        self.icon_list.setSelectionMode(QListWidget.SelectionMode.NoSelection)
-        self.icon_list.setSpacing(8)
         self.icon_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.icon_list.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self.icon_list.installEventFilter(self)
-        self.icon_list.viewport().installEventFilter(self)
-        
-        self.icon_widgets = []
-        self.icon_items = []
-        self.header_items = []
+        self.icon_list.departmentToggled.connect(self.toggle_department)
         
         self._populate_icon_list()
         
@@ -1973,28 +2106,13 @@ class StratagemApp(QMainWindow):
 
     def _populate_icon_list(self):
         """Populate the icon list with stratagems organized by department"""
-        for department, stratagems in self.stratagems_by_department.items():
+        for department in self.stratagems_by_department:
             # Initialize expanded state for this department
             self.department_expanded_state[department] = True
-            
-            header_item = QListWidgetItem()
-            header_container = CollapsibleDepartmentHeader(department, parent_app=self)
-            
-            header_item.setSizeHint(QSize(800, 32))
-            self.icon_list.addItem(header_item)
-            self.icon_list.setItemWidget(header_item, header_container)
-            self.header_items.append((header_item, header_container, department))
-            
-            for name in sorted(stratagems.keys()):
-                w = DraggableIcon(name)
-                item = QListWidgetItem()
-                item.setSizeHint(QSize(80, 80))
-                # Store department info with the item
-                item.stratagem_department = department
-                self.icon_list.addItem(item)
-                self.icon_list.setItemWidget(item, w)
-                self.icon_widgets.append(w)
-                self.icon_items.append((item, w))
+
+        self.icon_list.set_catalogue(self.stratagems_by_department)
+        self.icon_list.set_filter("", self.department_expanded_state)
+        QTimer.singleShot(0, self.icon_list.prefetch_icons)
 
     def _create_numpad_grid(self, content_layout):
         """Create the numpad grid layout"""
@@ -2764,14 +2882,6 @@ class StratagemApp(QMainWindow):
             self.update_search_clear_position()
             if self.search.height() != 32:
                 self.search.setFixedHeight(32)
-        elif hasattr(self, 'icon_list') and source == self.icon_list and event.type() == QEvent.Type.Resize:
-            self.update_header_widths()
-        elif (
-            hasattr(self, 'icon_list')
-            and source == self.icon_list.viewport()
-            and event.type() == QEvent.Type.Resize
-        ):
-            self.update_header_widths()
         return super().eventFilter(source, event)
 
     def closeEvent(self, event):
@@ -2806,11 +2916,9 @@ class StratagemApp(QMainWindow):
     # UI update methods
     def update_header_widths(self):
         """Update header item sizes to match the scroll list width"""
-        if not hasattr(self, 'header_items') or not hasattr(self, 'icon_list'):
+        if not hasattr(self, 'icon_list'):
             return
-        viewport_width = self.icon_list.viewport().width()
-        for header_item, header_container, department in self.header_items:
-            header_item.setSizeHint(QSize(max(0, viewport_width), 32))
+        self.icon_list.refresh_header_widths()
 
     def update_search_clear_visibility(self, text):
         """Update search clear button visibility"""
@@ -2882,9 +2990,9 @@ class StratagemApp(QMainWindow):
 
     def get_theme_source(self, theme_name):
         """Get plugin origin for a theme name, or None for built-in themes."""
-        if not hasattr(self, "theme_sources"):
+        if not hasattr(self, "catalogue"):
             return None
-        return self.theme_sources.get(theme_name)
+        return self.catalogue.theme_source(theme_name)
 
     def save_global_settings(self):
         """Save global settings"""
@@ -2894,6 +3002,7 @@ class StratagemApp(QMainWindow):
         """Open settings dialog"""
         if not self._prepare_leave_plugin_creator():
             return
+        from src.ui.dialogs import SettingsWindow
         dlg = SettingsWindow(self, initial_tab=initial_tab)
         if dlg.exec():
             self.show_status("Settings applied.")
@@ -2903,19 +3012,31 @@ class StratagemApp(QMainWindow):
         """Refresh the profile list"""
         self.profile_box.blockSignals(True)
         self.profile_box.clear()
-        files = [os.path.splitext(f)[0] for f in os.listdir(PROFILES_DIR) if f.endswith(".json")]
-        if not files:
+        catalogue = ProfileManager.get_profile_catalogue()
+        if not catalogue:
             self.profile_box.addItem("Create new profile")
             self.profile_box.setItemDeletable(0, False)
         else:
-            for profile_name in sorted(files):
+            for profile_name in sorted(catalogue):
                 self.profile_box.addItem(profile_name)
-                self.profile_box.setItemDeletable(self.profile_box.count() - 1, True)
+                index = self.profile_box.count() - 1
+                self.profile_box.setItemDeletable(index, True)
+                self.profile_box.setItemData(index, self._profile_tooltip(catalogue[profile_name]), Qt.ItemDataRole.ToolTipRole)
             self.profile_box.addItem("Create new profile")
             self.profile_box.setItemDeletable(self.profile_box.count() - 1, False)
         self.profile_box.blockSignals(False)
         self.profile_changed()
 
+    @staticmethod
+    def _profile_tooltip(metadata):
+        """Summary shown when hovering a profile in the selector"""
+        lines = [f"{metadata.get('slot_count', 0)} slot(s) assigned", f"Latency: {metadata.get('latency', 20)} ms"]
+        if metadata.get("layout"):
+            lines.append(f"Layout: {metadata['layout']}")
+        if metadata.get("last_used"):
+            lines.append("Last used: " + time.strftime("%Y-%m-%d %H:%M", time.localtime(metadata["last_used"])))
+        return "\n".join(lines)
+
     def delete_profile_from_select(self, profile_name, _index=None, _user_data=None):
         """Delete a profile from profile selector after confirmation."""
         if not isinstance(profile_name, str) or profile_name == "Create new profile":
@@ -2931,12 +3052,8 @@ class StratagemApp(QMainWindow):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        profile_path = os.path.join(PROFILES_DIR, f"{profile_name}.json")
-        try:
-            if os.path.exists(profile_path):
-                os.remove(profile_path)
-        except Exception as e:
-            QMessageBox.warning(self, "Delete Profile", f"Failed to delete profile:\n{e}")
+        if ProfileManager.profile_exists(profile_name) and not ProfileManager.delete_profile(profile_name):
+            QMessageBox.warning(self, "Delete Profile", "Failed to delete profile.")
             return
 
         if self.global_settings.get("last_profile") == profile_name:
@@ -2951,13 +3068,13 @@ class StratagemApp(QMainWindow):
         """Handle profile change"""
         current = self.profile_box.currentText()
         if current == "Create new profile":
-            for slot in self.slots.values():
-                slot.clear_slot()
+            self.apply_slot_mappings({})
             self.sync_macro_hook_state()
             self.saved_state = None
             self.show_status("FRESH PROFILE READY")
         else:
             self.load_profile(os.path.join(PROFILES_DIR, f"{current}.json"))
+            ProfileManager.mark_profile_used(current)
             self.show_status(f"LOADED: {current.upper()}")
             # Track last loaded profile for autoload
             self.global_settings["last_profile"] = current
@@ -2972,7 +3089,7 @@ class StratagemApp(QMainWindow):
             if ok and name:
                 clean_name = os.path.splitext(name)[0]
                 state = self.get_current_state()
-                ProfileManager.save_profile(clean_name, state)
+                ProfileManager.save_profile(clean_name, state, layout=self.active_slot_layout_name)
                 self.refresh_profiles()
                 self.profile_box.setCurrentText(clean_name)
                 self.show_status("PROFILE SAVED")
@@ -2980,7 +3097,7 @@ class StratagemApp(QMainWindow):
                 return
         else:
             state = self.get_current_state()
-            ProfileManager.save_profile(current, state)
+            ProfileManager.save_profile(current, state, layout=self.active_slot_layout_name)
             self.show_status("PROFILE SAVED")
         self.save_current_state()
         self.update_undo_state()
@@ -3060,26 +3177,53 @@ class StratagemApp(QMainWindow):
 
     def load_profile(self, path):
         """Load profile from file"""
-        for slot in self.slots.values():
-            slot.clear_slot()
-        
         # Load profile using ProfileManager
         profile_name = os.path.splitext(os.path.basename(path))[0]
         data = ProfileManager.load_profile(profile_name)
         
+        mappings = {}
         if data:
             self.speed_slider.blockSignals(True)
             self.speed_slider.setValue(data.get("speed", 20))
             self.speed_slider.blockSignals(False)
-            
             mappings = data.get("mappings", {})
-            for code, strat in mappings.items():
-                if code in self.slots:
-                    self.slots[code].assign(strat)
-        
+
+        self.apply_slot_mappings(mappings)
         self.sync_macro_hook_state()
         self.save_current_state()
 
+    def apply_slot_mappings(self, mappings):
+        """Bring the slots to the given {scan code: stratagem} mappings
+        
+        Only slots whose stratagem differs are cleared or assigned, with repaints
+        held until the batch is done and a single change notification at the end.
+        
+        Returns:
+            Number of slots that changed
+        """
+        changed = []
+        for code, slot in self.slots.items():
+            target = mappings.get(code) or None
+            if not slot.is_hidden and slot.assigned_stratagem != target:
+                changed.append((slot, target))
+        if not changed:
+            return 0
+
+        grid_widget = self.numpad_grid_widget
+        if grid_widget is not None:
+            grid_widget.setUpdatesEnabled(False)
+        try:
+            for slot, target in changed:
+                if target:
+                    slot.assign(target, notify=False)
+                else:
+                    slot.clear_slot(notify=False)
+        finally:
+            if grid_widget is not None:
+                grid_widget.setUpdatesEnabled(True)
+        self.on_change()
+        return len(changed)
+
     # State management methods  
     def get_current_state(self):
         """Get the current state of the profile"""
@@ -3106,16 +3250,17 @@ class StratagemApp(QMainWindow):
         if self.undo_btn:
             has_changes = self.has_unsaved_changes()
             self.undo_btn.setEnabled(has_changes)
-            if has_changes:
-                self.undo_btn.setStyleSheet("color: #fff; opacity: 1.0;")
-            else:
-                self.undo_btn.setStyleSheet("color: #555; opacity: 0.5; border: 1px solid #333;")
-            
+
+            buttons = [self.undo_btn]
             if hasattr(self, "save_btn") and self.save_btn:
-                border_color = "#ff4444" if has_changes else "#3ddc84"
-                self.save_btn.setStyleSheet(
-                    f"QPushButton {{ border: 2px solid {border_color}; border-radius: 6px; }}"
-                )
+                buttons.append(self.save_btn)
+            for btn in buttons:
+                if btn.property("has_changes") == has_changes:
+                    continue
+                btn.setProperty("has_changes", has_changes)
+                btn.style().unpolish(btn)
+                btn.style().polish(btn)
+                btn.update()
 
     def on_change(self):
         """Called when any change is made"""
@@ -3125,83 +3270,39 @@ class StratagemApp(QMainWindow):
         """Undo changes to the last saved state"""
         if self.saved_state is None:
             # Fresh profile - clear everything
-            for slot in self.slots.values():
-                slot.clear_slot()
+            self.apply_slot_mappings({})
             self.speed_slider.blockSignals(True)
             self.speed_slider.setValue(20)
             self.speed_slider.blockSignals(False)
         else:
             # Restore to saved state
-            for slot in self.slots.values():
-                slot.clear_slot()
             speed = self.saved_state.get("speed", 20)
             mappings = self.saved_state.get("mappings", {})
             self.speed_slider.blockSignals(True)
             self.speed_slider.setValue(speed)
             self.speed_slider.blockSignals(False)
-            for code, strat in mappings.items():
-                if code in self.slots:
-                    self.slots[code].assign(strat)
+            self.apply_slot_mappings(mappings)
         self.show_status("Changes undone")
         self.update_undo_state()
 
     def filter_icons(self, text):
         """Filter stratagem icons based on search text"""
         text_lower = text.lower()
-        visible_icons = {}
-        
-        for item, widget in self.icon_items:
-            matches = text_lower in widget.name.lower() if text_lower else True
-            visible_icons[id(item)] = matches
-        
+
         # If searching, expand all departments automatically
         if text_lower:
             for department in self.department_expanded_state:
                 self.department_expanded_state[department] = True
-            
-            # Update all headers to show expanded state
-            for header_item, header_container, department in self.header_items:
-                header_container.is_expanded = True
-                header_container.update_header_display()
-            
+
             self.toggle_all_collapsed = False
             self.update_toggle_all_button_state()
-        
-        # First pass: determine which headers have items matching the search
-        headers_with_matches = {}
-        for item, widget in self.icon_items:
-            if hasattr(item, 'stratagem_department'):
-                department = item.stratagem_department
-                item_id = id(item)
-                if item_id in visible_icons and visible_icons[item_id]:
-                    if department not in headers_with_matches:
-                        headers_with_matches[department] = False
-                    headers_with_matches[department] = True
-        
-        # Second pass: show/hide items and headers
-        for i in range(self.icon_list.count()):
-            item = self.icon_list.item(i)
-            widget = self.icon_list.itemWidget(item)
-            
-            # Check if this is a department header
-            is_header = isinstance(widget, CollapsibleDepartmentHeader)
-            
-            if is_header:
-                # Hide headers when searching, show them when search is empty
-                item.setHidden(bool(text_lower))
-                continue
-            
-            # This is an icon
-            if hasattr(widget, 'name'):
-                item_id = id(item)
-                department = item.stratagem_department if hasattr(item, 'stratagem_department') else None
-                
-                # Check if should be visible based on search filter AND department collapse state
-                should_show_by_search = item_id in visible_icons and visible_icons[item_id]
-                is_department_expanded = self.department_expanded_state.get(department, True)
-                should_show = should_show_by_search and is_department_expanded
-                
-                item.setHidden(not should_show)
+
+        self.icon_list.set_filter(text_lower, self.department_expanded_state)
+
+    def toggle_department(self, department_name):
+        """Toggle a single department header between collapsed and expanded"""
+        is_expanded = self.department_expanded_state.get(department_name, True)
+        self.update_department_visibility(department_name, not is_expanded)
 
     def update_department_visibility(self, department_name, is_expanded):
         """Update visibility of items in a department based on expanded state"""
@@ -3229,11 +3330,6 @@ class StratagemApp(QMainWindow):
         for department in self.department_expanded_state:
             self.department_expanded_state[department] = new_state
         
-        # Update all headers to show the new state
-        for header_item, header_container, department in self.header_items:
-            header_container.is_expanded = new_state
-            header_container.update_header_display()
-        
         # Toggle the state tracker
         self.toggle_all_collapsed = not self.toggle_all_collapsed
         
@@ -3313,10 +3409,19 @@ class StratagemApp(QMainWindow):
     def quit_application(self):
         """Quit the application"""
         self.macro_engine.disable()
+        loader = getattr(self, "plugin_load_thread", None)
+        if loader is not None and loader.isRunning():
+            loader.wait()
         QApplication.quit()
     
+    def open_test_environment(self):
+        """Open the macro test environment dialog"""
+        from src.ui.dialogs import TestEnvironment
+        TestEnvironment().exec()
+
     def check_for_updates_startup(self):
         """Check for updates on startup"""
+        from src.managers.update_manager import check_for_updates_startup
         check_for_updates_startup(self, self.global_settings)
 
 
@@ -3324,7 +3429,10 @@ def main():
     """Main application entry point"""
     from src.config.config import is_admin, run_as_admin
     
-    settings = load_settings()
+    startup_profiler.record_since_start("module imports")
+    with startup_profiler.phase("bootstrap + load_settings"):
+        bootstrap()
+        settings = load_settings()
     require_admin = settings.get("require_admin", False)
     
     if require_admin and not is_admin():
@@ -3345,9 +3453,20 @@ def main():
                     0x00000000 | 0x00000010,
                 )
     
-    app = QApplication(sys.argv)
-    ex = StratagemApp()
-    ex.show()
+    with startup_profiler.phase("QApplication"):
+        app = QApplication(sys.argv)
+    app.aboutToQuit.connect(icon_cache.shutdown)
+    app.aboutToQuit.connect(flush_settings)
+    app.aboutToQuit.connect(ProfileManager.flush_index)
+    with startup_profiler.phase("StratagemApp.__init__"):
+        ex = StratagemApp()
+    with startup_profiler.phase("show"):
+        ex.show()
+    if startup_profiler.active:
+        first_paint = startup_profiler.begin("first paint")
+        # Runs after the first event loop pass, i.e. once the window has painted;
+        # the profile is printed when the background plugin merge finishes
+        QTimer.singleShot(0, lambda: startup_profiler.end(first_paint))
     sys.exit(app.exec())
 
 
@@ -5,6 +5,7 @@ Re-exports commonly used functions
 
 from .config import (
     get_app_data_dir,
+    bootstrap,
     is_installed,
     get_install_type,
     is_admin,
@@ -12,18 +13,28 @@ from .config import (
     find_svg_path,
     set_icon_overrides,
     get_asset_path,
+    get_asset_bundle,
+    register_resource_scheme,
+    read_asset_bytes,
+    asset_exists,
+    asset_fingerprint,
     load_settings,
     save_settings,
+    flush_settings,
+    get_settings_store,
     get_theme_stylesheet,
     PROFILES_DIR,
     PLUGINS_DIR,
+    CACHE_DIR,
     ASSETS_DIR,
     SETTINGS_FILE,
+    SETTINGS_DIR,
 )
 
 from .constants import (
     THEME_FILES,
     DEFAULT_SETTINGS,
+    SETTINGS_SHARDS,
     NUMPAD_LAYOUT,
     KEYBIND_MAPPINGS,
     ARROW_ICONS,
@@ -39,6 +50,7 @@ from .version import (
 __all__ = [
     # config.py
     'get_app_data_dir',
+    'bootstrap',
     'is_installed',
     'get_install_type',
     'is_admin',
@@ -46,16 +58,26 @@ __all__ = [
     'find_svg_path',
     'set_icon_overrides',
     'get_asset_path',
+    'get_asset_bundle',
+    'register_resource_scheme',
+    'read_asset_bytes',
+    'asset_exists',
+    'asset_fingerprint',
     'load_settings',
     'save_settings',
+    'flush_settings',
+    'get_settings_store',
     'get_theme_stylesheet',
     'PROFILES_DIR',
     'PLUGINS_DIR',
+    'CACHE_DIR',
     'ASSETS_DIR',
     'SETTINGS_FILE',
+    'SETTINGS_DIR',
     # constants.py
     'THEME_FILES',
     'DEFAULT_SETTINGS',
+    'SETTINGS_SHARDS',
     'NUMPAD_LAYOUT',
     'KEYBIND_MAPPINGS',
     'ARROW_ICONS',
@@ -0,0 +1,114 @@
+"""
+Packed asset bundle for Helldivers Numpad Macros
+Single indexed file holding stratagem SVGs and QSS themes for frozen builds.
+Read through mmap so startup does one open instead of hundreds of small reads.
+
+Layout: MAGIC | version (u32) | index length (u64) | JSON index | blobs
+Index maps a posix member path (e.g. "assets/Hangar/Eagle Airstrike.svg")
+to [absolute offset, length, sha1].
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+BUNDLE_MAGIC = b"HDAB"
+BUNDLE_VERSION = 1
+BUNDLE_FILENAME = "assets.hdbundle"
+BUNDLE_SCHEME = "bundle"
+
+_HEADER = struct.Struct("<4sIQ")
+
+
+class AssetBundleError(Exception):
+    """Raised when a bundle file is missing, truncated or has an unknown format."""
+
+
+class AssetBundle:
+    """Read-only, memory-mapped view over a packed asset bundle."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._index = self._read_index()
+        except Exception:
+            self._file.close()
+            raise
+
+    def _read_index(self):
+        if len(self._map) < _HEADER.size:
+            raise AssetBundleError(f"Bundle too small: {self.path}")
+
+        magic, version, index_length = _HEADER.unpack_from(self._map, 0)
+        if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+            raise AssetBundleError(f"Unsupported bundle format: {self.path}")
+
+        start = _HEADER.size
+        end = start + index_length
+        if end > len(self._map):
+            raise AssetBundleError(f"Bundle index truncated: {self.path}")
+
+        index = json.loads(self._map[start:end].decode("utf-8"))
+        if not isinstance(index, dict):
+            raise AssetBundleError(f"Bundle index malformed: {self.path}")
+        return index
+
+    def __contains__(self, member):
+        return member in self._index
+
+    def members(self):
+        """Return all member paths in the bundle."""
+        return list(self._index.keys())
+
+    def read(self, member):
+        """Return the bytes of a member, or raise KeyError."""
+        offset, length, _ = self._index[member]
+        return self._map[offset:offset + length]
+
+    def digest(self, member):
+        """Return the content sha1 recorded for a member, or None."""
+        entry = self._index.get(member)
+        return entry[2] if entry else None
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+def write_asset_bundle(output_path, members):
+    """Write a bundle from a {member path: bytes} mapping (sorted for reproducible output)."""
+    names = sorted(members)
+
+    # Offsets depend on index size, so lay out blobs relative to zero first
+    relative = {}
+    cursor = 0
+    for name in names:
+        data = members[name]
+        relative[name] = (cursor, len(data), hashlib.sha1(data).hexdigest())
+        cursor += len(data)
+
+    def encode_index(base):
+        index = {name: [base + off, length, digest] for name, (off, length, digest) in relative.items()}
+        return json.dumps(index, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+    # Offsets are part of the index, so iterate until its length is stable
+    index_bytes = encode_index(0)
+    while True:
+        base = _HEADER.size + len(index_bytes)
+        encoded = encode_index(base)
+        if len(encoded) == len(index_bytes):
+            index_bytes = encoded
+            break
+        index_bytes = encoded
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, "wb") as bundle_file:
+        bundle_file.write(_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(index_bytes)))
+        bundle_file.write(index_bytes)
+        for name in names:
+            bundle_file.write(members[name])
+    return len(names)
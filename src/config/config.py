@@ -9,19 +9,34 @@ import shutil
 import json
 import ctypes
 import re
+from collections.abc import Mapping
 
-from .constants import THEME_FILES, DEFAULT_SETTINGS
+from .constants import THEME_FILES, DEFAULT_SETTINGS, SETTINGS_SHARDS
+from .asset_bundle import AssetBundle, AssetBundleError, BUNDLE_FILENAME, BUNDLE_SCHEME
+from .settings_store import ShardedSettings
+from .stylesheet_cache import StylesheetCache
+
+
+MIGRATIONS_FILE_NAME = "migrations.json"
+
+_APP_DATA_DIR = None
+_BOOTSTRAPPED = False
 
 
 def get_app_data_dir():
-    r"""Get the application data directory (Windows: %APPDATA%\HelldiversNumpadMacros)"""
-    appdata = os.environ.get('APPDATA')
-    if appdata:
-        app_dir = os.path.join(appdata, "HelldiversNumpadMacros")
-        os.makedirs(app_dir, exist_ok=True)
-        return app_dir
-    # Fallback for systems without APPDATA (shouldn't happen on Windows)
-    return "profiles"
+    r"""Get the application data directory (Windows: %APPDATA%\HelldiversNumpadMacros)
+
+    Path is computed once; directories are created by bootstrap(), not here.
+    """
+    global _APP_DATA_DIR
+    if _APP_DATA_DIR is None:
+        appdata = os.environ.get('APPDATA')
+        if appdata:
+            _APP_DATA_DIR = os.path.join(appdata, "HelldiversNumpadMacros")
+        else:
+            # Fallback for systems without APPDATA (shouldn't happen on Windows)
+            _APP_DATA_DIR = "profiles"
+    return _APP_DATA_DIR
 
 
 def migrate_old_files():
@@ -52,14 +67,64 @@ def migrate_old_files():
 
 PROFILES_DIR = os.path.join(get_app_data_dir(), "profiles")
 SETTINGS_FILE = os.path.join(get_app_data_dir(), "general.json")
+SETTINGS_DIR = os.path.join(get_app_data_dir(), "settings")
 PLUGINS_DIR = os.path.join(get_app_data_dir(), "plugins")
+CACHE_DIR = os.path.join(get_app_data_dir(), "cache")
+MIGRATIONS_FILE = os.path.join(get_app_data_dir(), MIGRATIONS_FILE_NAME)
 ASSETS_DIR = "assets"
 
-_ICON_OVERRIDE_PATHS = {}
+# One-time migrations run by bootstrap(); completed ids are recorded in MIGRATIONS_FILE
+_MIGRATIONS = [
+    ("legacy_app_dir_files", migrate_old_files),
+]
+
+
+def _load_completed_migrations():
+    try:
+        with open(MIGRATIONS_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        completed = data.get("completed", []) if isinstance(data, dict) else []
+        return set(completed) if isinstance(completed, list) else set()
+    except (OSError, ValueError):
+        return set()
+
+
+def _save_completed_migrations(completed):
+    try:
+        temp_path = f"{MIGRATIONS_FILE}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"completed": sorted(completed)}, f, indent=2)
+        os.replace(temp_path, MIGRATIONS_FILE)
+    except OSError as e:
+        print(f"[Migration] Warning: Could not record completed migrations: {e}")
+
+
+def bootstrap():
+    """Create app data directories and run pending one-time migrations (idempotent)"""
+    global _BOOTSTRAPPED
+    if _BOOTSTRAPPED:
+        return
+    _BOOTSTRAPPED = True
+
+    for directory in (get_app_data_dir(), PROFILES_DIR, PLUGINS_DIR):
+        os.makedirs(directory, exist_ok=True)
+
+    completed = _load_completed_migrations()
+    pending = [(name, migrate) for name, migrate in _MIGRATIONS if name not in completed]
+    if not pending:
+        return
 
-os.makedirs(PROFILES_DIR, exist_ok=True)
-os.makedirs(PLUGINS_DIR, exist_ok=True)
-migrate_old_files()
+    for name, migrate in pending:
+        migrate()
+        completed.add(name)
+    _save_completed_migrations(completed)
+
+
+_ICON_OVERRIDE_PATHS = {}
+_SVG_INDEX = None
+_ASSET_BUNDLE = None
+_ASSET_BUNDLE_LOADED = False
+_RESOURCE_SCHEMES = {}
 
 
 def normalize(name):
@@ -112,22 +177,121 @@ def run_as_admin():
         return False
 
 
-def find_svg_path(name):
-    """Find SVG file for stratagem, with simplified lookup since files now match official names"""
-    override_path = _ICON_OVERRIDE_PATHS.get(name)
-    if override_path and os.path.exists(override_path):
-        return override_path
+def get_asset_bundle():
+    """Return the packed asset bundle shipped next to the app (frozen builds), or None"""
+    global _ASSET_BUNDLE, _ASSET_BUNDLE_LOADED
+    if _ASSET_BUNDLE_LOADED:
+        return _ASSET_BUNDLE
+
+    _ASSET_BUNDLE_LOADED = True
+    base_path = getattr(sys, '_MEIPASS', os.path.abspath("."))
+    bundle_path = os.path.join(base_path, BUNDLE_FILENAME)
+    if os.path.exists(bundle_path):
+        try:
+            _ASSET_BUNDLE = AssetBundle(bundle_path)
+        except (OSError, ValueError, AssetBundleError) as e:
+            print(f"[Config] Could not open asset bundle, using loose files: {e}")
+            _ASSET_BUNDLE = None
+    return _ASSET_BUNDLE
+
+
+def register_resource_scheme(scheme, read, exists, fingerprint):
+    """Register a virtual 'scheme://member' path type understood by the asset helpers"""
+    _RESOURCE_SCHEMES[scheme] = {"read": read, "exists": exists, "fingerprint": fingerprint}
+
+
+def split_resource_path(path):
+    """Return (scheme, member) for registered virtual paths, or (None, path) for files"""
+    if isinstance(path, str) and "://" in path:
+        scheme, member = path.split("://", 1)
+        if scheme in _RESOURCE_SCHEMES:
+            return scheme, member
+    return None, path
+
+
+def read_asset_bytes(path):
+    """Read raw bytes of an asset from disk or a registered virtual source"""
+    scheme, member = split_resource_path(path)
+    if scheme:
+        return _RESOURCE_SCHEMES[scheme]["read"](member)
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def asset_exists(path):
+    """Check if an asset path exists on disk or in a registered virtual source"""
+    if not path:
+        return False
+    scheme, member = split_resource_path(path)
+    if scheme:
+        return bool(_RESOURCE_SCHEMES[scheme]["exists"](member))
+    return os.path.exists(path)
+
+
+def asset_fingerprint(path):
+    """Return a string that changes whenever the asset content changes"""
+    scheme, member = split_resource_path(path)
+    if scheme:
+        return f"{path}|{_RESOURCE_SCHEMES[scheme]['fingerprint'](member)}"
+    abs_path = os.path.abspath(path)
+    try:
+        stat = os.stat(abs_path)
+        return f"{abs_path}|{stat.st_mtime_ns}|{stat.st_size}"
+    except OSError:
+        return abs_path
+
+
+def _bundle_read(member):
+    bundle = get_asset_bundle()
+    if bundle is None:
+        raise FileNotFoundError(f"{BUNDLE_SCHEME}://{member}")
+    return bundle.read(member)
+
+
+def _bundle_exists(member):
+    bundle = get_asset_bundle()
+    return bundle is not None and member in bundle
+
+
+def _bundle_fingerprint(member):
+    bundle = get_asset_bundle()
+    return bundle.digest(member) if bundle is not None else None
+
+
+register_resource_scheme(BUNDLE_SCHEME, _bundle_read, _bundle_exists, _bundle_fingerprint)
+
+
+def _build_svg_index():
+    """Map normalized stratagem names to SVG paths (bundle members or loose files)"""
+    index = {}
+    bundle = get_asset_bundle()
+    if bundle is not None:
+        prefix = f"{ASSETS_DIR}/"
+        for member in sorted(bundle.members()):
+            if member.startswith(prefix) and member.endswith(".svg"):
+                stem = os.path.splitext(member.rsplit("/", 1)[-1])[0]
+                index.setdefault(normalize(stem), f"{BUNDLE_SCHEME}://{member}")
+        return index
 
     base_path = getattr(sys, '_MEIPASS', os.path.abspath("."))
     assets_lookup = os.path.join(base_path, ASSETS_DIR)
-    target = normalize(name)
-    
     for root, dirs, files in os.walk(assets_lookup):
         for f in files:
             if f.endswith(".svg"):
-                if normalize(os.path.splitext(f)[0]) == target:
-                    return os.path.join(root, f)
-    return None
+                index.setdefault(normalize(os.path.splitext(f)[0]), os.path.join(root, f))
+    return index
+
+
+def find_svg_path(name):
+    """Find SVG file for stratagem, with simplified lookup since files now match official names"""
+    global _SVG_INDEX
+    override_path = _ICON_OVERRIDE_PATHS.get(name)
+    if override_path and asset_exists(override_path):
+        return override_path
+
+    if _SVG_INDEX is None:
+        _SVG_INDEX = _build_svg_index()
+    return _SVG_INDEX.get(normalize(name))
 
 
 def set_icon_overrides(overrides):
@@ -147,34 +311,63 @@ def set_icon_overrides(overrides):
 def get_asset_path(filename):
     """Get the correct path for an asset file, handling both development and PyInstaller builds"""
     base_path = getattr(sys, '_MEIPASS', os.path.abspath("."))
-    return os.path.join(base_path, ASSETS_DIR, filename)
+    path = os.path.join(base_path, ASSETS_DIR, filename)
+    if not os.path.exists(path):
+        member = f"{ASSETS_DIR}/{filename.replace(os.sep, '/')}"
+        if _bundle_exists(member):
+            return f"{BUNDLE_SCHEME}://{member}"
+    return path
+
+
+def _resolve_theme_source(theme_ref, base_path):
+    """Resolve a theme file reference to a bundle member or loose file path, or None"""
+    if not os.path.isabs(theme_ref):
+        member = theme_ref.replace(os.sep, "/")
+        if _bundle_exists(member):
+            return f"{BUNDLE_SCHEME}://{member}"
+
+    qss_path = theme_ref if os.path.isabs(theme_ref) else os.path.join(base_path, theme_ref)
+    return qss_path if os.path.exists(qss_path) else None
+
+
+def _read_theme_file(source):
+    """Read QSS text for a resolved theme source"""
+    return read_asset_bytes(source).decode("utf-8")
+
+
+_SETTINGS = None
+
+
+def get_settings_store():
+    """Return the shared sharded settings view (stores under SETTINGS_DIR)"""
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = ShardedSettings(
+            SETTINGS_DIR,
+            SETTINGS_SHARDS,
+            DEFAULT_SETTINGS,
+            legacy_path=SETTINGS_FILE,
+        )
+    return _SETTINGS
 
 
 def load_settings():
-    """Load global settings from file"""
-    if not os.path.exists(SETTINGS_FILE):
-        save_settings(DEFAULT_SETTINGS)
-        return DEFAULT_SETTINGS.copy()
-    
-    try:
-        with open(SETTINGS_FILE, "r") as f:
-            settings = json.load(f)
-            # Merge with defaults in case new settings were added
-            result = DEFAULT_SETTINGS.copy()
-            result.update(settings)
-            return result
-    except Exception as e:
-        print(f"[Config] Error loading settings: {e}")
-        return DEFAULT_SETTINGS.copy()
+    """Return global settings; each store file is read on first access to one of its keys"""
+    return get_settings_store()
 
 
 def save_settings(settings):
-    """Save global settings to file"""
-    try:
-        with open(SETTINGS_FILE, "w") as f:
-            json.dump(settings, f, indent=2)
-    except Exception as e:
-        print(f"[Config] Error saving settings: {e}")
+    """Queue changed settings for a debounced background write of the affected stores"""
+    store = get_settings_store()
+    if settings is not store:
+        for key, value in settings.items():
+            store[key] = value
+    store.save()
+
+
+def flush_settings():
+    """Write pending settings to disk immediately (call on shutdown)"""
+    get_settings_store().flush()
 
 
 def apply_theme_to_stylesheet(qss_content, base_path):
@@ -298,11 +491,13 @@ QListWidget#settings_tab_list::item:selected {{
     border-left: 3px solid {accent};
 }}
 
-QWidget[role="numpad-slot"][assigned="false"]:hover {{
+QWidget[role="numpad-slot"][assigned="false"]:hover,
+QWidget[role="numpad-slot"][assigned="false"] QLabel:hover {{
     border: 2px solid {accent};
 }}
 
-QWidget[role="numpad-slot"][assigned="true"] {{
+QWidget[role="numpad-slot"][assigned="true"],
+QWidget[role="numpad-slot"][assigned="true"] QLabel {{
     border: 2px solid {accent};
 }}
 
@@ -323,42 +518,46 @@ QLabel#department_header {{
 """
 
 
+_STYLESHEET_CACHE = StylesheetCache(os.path.join(CACHE_DIR, "qss"))
+
+
 def get_theme_stylesheet(theme_name="Dark (Default)", theme_files=None):
-    """Get the stylesheet content for a given theme"""
+    """Get the compiled stylesheet for a given theme (cached by name, palette, base path and QSS mtime)"""
     try:
-        effective_theme_files = theme_files if isinstance(theme_files, dict) else THEME_FILES
+        effective_theme_files = theme_files if isinstance(theme_files, Mapping) else THEME_FILES
         theme_value = effective_theme_files.get(
             theme_name,
             effective_theme_files.get("Dark (Default)", THEME_FILES["Dark (Default)"])
         )
         base_path = getattr(sys, '_MEIPASS', os.path.abspath("."))
 
+        palette = None
         if isinstance(theme_value, dict):
             palette = _normalize_plugin_theme_palette(theme_value)
 
-            base_theme_ref = effective_theme_files.get("Dark (Default)", THEME_FILES["Dark (Default)"])
-            if isinstance(base_theme_ref, dict):
-                base_theme_ref = THEME_FILES["Dark (Default)"]
-
-            base_theme_path = base_theme_ref if os.path.isabs(base_theme_ref) else os.path.join(base_path, base_theme_ref)
-            if not os.path.exists(base_theme_path):
-                return ""
-
-            with open(base_theme_path, 'r', encoding='utf-8') as base_theme_file:
-                base_qss = base_theme_file.read()
-
-            if not palette:
-                return apply_theme_to_stylesheet(base_qss, base_path)
-
-            overlay_qss = _build_plugin_theme_overlay(palette)
-            return apply_theme_to_stylesheet(base_qss + "\n" + overlay_qss, base_path)
-
-        if isinstance(theme_value, str):
-            qss_path = theme_value if os.path.isabs(theme_value) else os.path.join(base_path, theme_value)
-            if os.path.exists(qss_path):
-                with open(qss_path, 'r', encoding='utf-8') as f:
-                    qss = f.read()
-                return apply_theme_to_stylesheet(qss, base_path)
+            theme_ref = effective_theme_files.get("Dark (Default)", THEME_FILES["Dark (Default)"])
+            if isinstance(theme_ref, dict):
+                theme_ref = THEME_FILES["Dark (Default)"]
+        elif isinstance(theme_value, str):
+            theme_ref = theme_value
+        else:
+            return ""
+
+        source = _resolve_theme_source(theme_ref, base_path)
+        if source is None:
+            return ""
+
+        key = _STYLESHEET_CACHE.key(theme_name, palette, base_path, asset_fingerprint(source))
+        cached = _STYLESHEET_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        qss = _read_theme_file(source)
+        if palette:
+            qss = qss + "\n" + _build_plugin_theme_overlay(palette)
+        compiled = apply_theme_to_stylesheet(qss, base_path)
+        _STYLESHEET_CACHE.put(key, compiled)
+        return compiled
     except Exception as e:
         print(f"[Config] Theme Error: {e}")
     return ""
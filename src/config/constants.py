@@ -23,6 +23,27 @@ DEFAULT_SETTINGS = {
     "custom_themes": {},
 }
 
+# Settings are stored in separate files under settings/, each with its own
+# schema version; keys not listed here live in the "core" store
+SETTINGS_SHARDS = {
+    "core": {"file": "core.json", "schema_version": 1},
+    "slot_layouts": {
+        "file": "slot_layouts.json",
+        "schema_version": 1,
+        "keys": ["slot_layouts", "active_slot_layout"],
+    },
+    "custom_themes": {
+        "file": "custom_themes.json",
+        "schema_version": 1,
+        "keys": ["custom_themes"],
+    },
+    "usage": {
+        "file": "usage.json",
+        "schema_version": 1,
+        "keys": ["last_profile", "skipped_version"],
+    },
+}
+
 NUMPAD_LAYOUT = [
     ('53', '/', 0, 1, 1, 1),
     ('55', '*', 0, 2, 1, 1),
@@ -0,0 +1,285 @@
+"""
+Settings persistence for Helldivers Numpad Macros
+Keeps the latest settings in memory, tracks which keys changed and writes them
+to disk on a short debounce from a background thread using temp file + rename.
+Settings are split into independent versioned store files (core, slot layouts,
+custom themes, usage) that are loaded on first access and written separately.
+"""
+
+import atexit
+import copy
+import json
+import os
+import tempfile
+import threading
+from collections.abc import MutableMapping
+
+
+class SettingsStore:
+    """Debounced, atomic JSON settings file.
+
+    save() only records changed keys and (re)starts the debounce timer; the
+    actual write happens on a timer thread. Keys absent from the dict passed to
+    save() are left untouched, so independent callers cannot clobber each other.
+    """
+
+    DEFAULT_DELAY_SECONDS = 0.4
+
+    def __init__(self, path, defaults, delay_seconds=DEFAULT_DELAY_SECONDS, schema_version=None, migrations=None):
+        self.path = path
+        self.defaults = defaults
+        self.delay_seconds = delay_seconds
+        self.schema_version = schema_version
+        self.migrations = migrations or {}
+        self._state = None
+        self._dirty_keys = set()
+        self._timer = None
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def _ensure_loaded(self):
+        if self._state is not None:
+            return
+
+        if not os.path.exists(self.path):
+            self._state = copy.deepcopy(self.defaults)
+            self._dirty_keys = set(self._state)
+            self._schedule()
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._state = self._unwrap(data)
+        except Exception as e:
+            print(f"[Config] Error loading settings from {os.path.basename(self.path)}: {e}")
+            self._state = {}
+
+    def _unwrap(self, data):
+        """Extract settings from the file payload, upgrading older schema versions."""
+        if not isinstance(data, dict):
+            return {}
+        if self.schema_version is None:
+            return data
+
+        version = data.get("schema_version", 0)
+        settings = data.get("settings", {})
+        if not isinstance(settings, dict):
+            settings = {}
+
+        if version > self.schema_version:
+            print(
+                f"[Config] {os.path.basename(self.path)} has newer schema "
+                f"v{version} (expected v{self.schema_version}); loading anyway"
+            )
+            return settings
+
+        while version < self.schema_version:
+            migrate = self.migrations.get(version)
+            if migrate is not None:
+                settings = migrate(settings)
+            version += 1
+            self._dirty_keys.update(settings)
+        if self._dirty_keys:
+            self._schedule()
+        return settings
+
+    def load(self):
+        """Return a copy of the current settings merged over defaults."""
+        with self._lock:
+            self._ensure_loaded()
+            result = copy.deepcopy(self.defaults)
+            result.update(copy.deepcopy(self._state))
+            return result
+
+    def save(self, settings):
+        """Record changed keys and schedule a background write."""
+        with self._lock:
+            self._ensure_loaded()
+            for key, value in settings.items():
+                if key not in self._state or self._state[key] != value:
+                    self._state[key] = copy.deepcopy(value)
+                    self._dirty_keys.add(key)
+
+            if self._dirty_keys:
+                self._schedule()
+
+    def delete(self, keys):
+        """Remove keys from the file and schedule a background write."""
+        with self._lock:
+            self._ensure_loaded()
+            for key in keys:
+                if key in self._state:
+                    del self._state[key]
+                    self._dirty_keys.add(key)
+
+            if self._dirty_keys:
+                self._schedule()
+
+    def dirty_keys(self):
+        """Return keys changed since the last completed write."""
+        with self._lock:
+            return set(self._dirty_keys)
+
+    def _schedule(self):
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.delay_seconds, self._write_pending)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self):
+        """Write pending changes immediately (call on shutdown)."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self._write_pending()
+
+    def _write_pending(self):
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty_keys:
+                    return
+                if self.schema_version is None:
+                    payload = json.dumps(self._state, indent=2)
+                else:
+                    payload = json.dumps(
+                        {"schema_version": self.schema_version, "settings": self._state}, indent=2
+                    )
+                written_keys = set(self._dirty_keys)
+                self._dirty_keys.clear()
+
+            if not self._write_atomic(payload):
+                with self._lock:
+                    self._dirty_keys.update(written_keys)
+
+    def _write_atomic(self, payload):
+        """Write payload to a temp file next to the target and rename it into place."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        temp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                prefix=f".{os.path.basename(self.path)}.", suffix=".tmp", dir=directory
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+            return True
+        except Exception as e:
+            print(f"[Config] Error saving settings: {e}")
+            if temp_path and os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            return False
+
+
+class ShardedSettings(MutableMapping):
+    """Dict-like view over several SettingsStore files.
+
+    Each key is routed to one shard; a shard file is only read the first time
+    one of its keys is accessed, and save() only writes shards whose content
+    changed. Existing single-file settings are split into shards once.
+    """
+
+    def __init__(self, directory, shards, defaults, default_shard="core", legacy_path=None):
+        self.directory = directory
+        self.default_shard = default_shard
+        self.legacy_path = legacy_path
+        self._routes = {key: name for name, spec in shards.items() for key in spec.get("keys", ())}
+        self._stores = {}
+        for name, spec in shards.items():
+            shard_defaults = {
+                key: value for key, value in defaults.items() if self.shard_for(key) == name
+            }
+            self._stores[name] = SettingsStore(
+                os.path.join(directory, spec["file"]),
+                shard_defaults,
+                schema_version=spec.get("schema_version", 1),
+                migrations=spec.get("migrations"),
+            )
+        self._data = {}
+        self._migration_checked = False
+
+    def shard_for(self, key):
+        """Return the shard name a settings key is stored in."""
+        return self._routes.get(key, self.default_shard)
+
+    def store(self, name):
+        """Return the SettingsStore backing a shard."""
+        return self._stores[name]
+
+    def _shard(self, name):
+        data = self._data.get(name)
+        if data is None:
+            self._migrate_legacy()
+            data = self._stores[name].load()
+            self._data[name] = data
+        return data
+
+    def _migrate_legacy(self):
+        """Split the legacy single settings file into shard files (first run only)."""
+        if self._migration_checked:
+            return
+        self._migration_checked = True
+
+        if not self.legacy_path or not os.path.exists(self.legacy_path):
+            return
+        if any(os.path.exists(store.path) for store in self._stores.values()):
+            return
+
+        try:
+            with open(self.legacy_path, "r", encoding="utf-8") as f:
+                legacy = json.load(f)
+        except Exception as e:
+            print(f"[Config] Could not migrate {os.path.basename(self.legacy_path)}: {e}")
+            return
+        if not isinstance(legacy, dict):
+            return
+
+        split = {name: {} for name in self._stores}
+        for key, value in legacy.items():
+            split[self.shard_for(key)][key] = value
+        for name, values in split.items():
+            store = self._stores[name]
+            store.save(values)
+            store.flush()
+        print(f"[Config] Migrated {os.path.basename(self.legacy_path)} into {self.directory}")
+
+    def __getitem__(self, key):
+        return self._shard(self.shard_for(key))[key]
+
+    def __setitem__(self, key, value):
+        self._shard(self.shard_for(key))[key] = value
+
+    def __delitem__(self, key):
+        name = self.shard_for(key)
+        del self._shard(name)[key]
+        self._stores[name].delete([key])
+
+    def __iter__(self):
+        for name in self._stores:
+            yield from list(self._shard(name))
+
+    def __len__(self):
+        return sum(len(self._shard(name)) for name in self._stores)
+
+    def loaded_shards(self):
+        """Return names of shards that have been read so far."""
+        return list(self._data)
+
+    def save(self):
+        """Queue writes for every loaded shard; unchanged shards are skipped."""
+        for name, data in self._data.items():
+            self._stores[name].save(data)
+
+    def flush(self):
+        """Write all pending shard changes immediately."""
+        for store in self._stores.values():
+            store.flush()
@@ -0,0 +1,64 @@
+"""
+Compiled stylesheet cache for Helldivers Numpad Macros
+Keeps fully resolved theme QSS (base file + palette overlay + asset URLs) in
+memory and on disk so applying or previewing a theme skips recompilation.
+"""
+
+import hashlib
+import json
+import os
+
+
+class StylesheetCache:
+    """Memory + disk cache of compiled theme stylesheets keyed by their inputs."""
+
+    CACHE_VERSION = 1
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self._memory = {}
+
+    def key(self, theme_name, palette, base_path, source_fingerprint):
+        """Build the cache key for a theme compiled from the given inputs."""
+        parts = (
+            str(self.CACHE_VERSION),
+            theme_name or "",
+            json.dumps(palette, sort_keys=True) if palette else "",
+            os.path.normcase(os.path.abspath(base_path)),
+            source_fingerprint,
+        )
+        return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Return compiled QSS for key from memory or disk, or None."""
+        qss = self._memory.get(key)
+        if qss is not None:
+            return qss
+
+        disk_path = os.path.join(self.cache_dir, f"{key}.qss")
+        if not os.path.exists(disk_path):
+            return None
+        try:
+            with open(disk_path, "r", encoding="utf-8") as f:
+                qss = f.read()
+        except OSError:
+            return None
+        self._memory[key] = qss
+        return qss
+
+    def put(self, key, qss):
+        """Store compiled QSS in memory and write it to disk atomically."""
+        self._memory[key] = qss
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            disk_path = os.path.join(self.cache_dir, f"{key}.qss")
+            temp_path = f"{disk_path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(qss)
+            os.replace(temp_path, disk_path)
+        except OSError as e:
+            print(f"[Config] Could not write stylesheet cache entry: {e}")
+
+    def clear(self):
+        """Drop in-memory entries (disk entries are keyed by content and stay valid)."""
+        self._memory.clear()
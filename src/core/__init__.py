@@ -3,10 +3,13 @@ Core functionality module
 """
 
 from .macro_engine import MacroEngine
+from .layered_catalogue import LayeredCatalogue, CatalogueLayer
 from .stratagem_data import STRATAGEMS, STRATAGEMS_BY_DEPARTMENT
 
 __all__ = [
     'MacroEngine',
+    'LayeredCatalogue',
+    'CatalogueLayer',
     'STRATAGEMS',
     'STRATAGEMS_BY_DEPARTMENT',
 ]
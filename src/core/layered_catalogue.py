@@ -0,0 +1,327 @@
+"""
+Layered stratagem catalogue for Helldivers Numpad Macros
+Stacks the built-in data, one immutable layer per plugin and a user layer.
+Lookups resolve lazily to the topmost layer that provides an entry, every entry
+keeps its provenance, and adding or removing a layer only touches that layer's
+entries.
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from ..config.config import normalize
+
+BASE_LAYER = "base"
+USER_LAYER = "user"
+
+
+class CatalogueLayer:
+    """Immutable contribution of one source: the built-in data, a plugin or the user."""
+
+    __slots__ = ("layer_id", "name", "departments", "stratagems", "icon_overrides", "themes")
+
+    def __init__(self, layer_id, name, stratagems_by_department=None, icon_overrides=None, themes=None):
+        departments = {}
+        stratagems = {}
+        for department, entries in (stratagems_by_department or {}).items():
+            frozen_entries = {stratagem_name: tuple(sequence) for stratagem_name, sequence in entries.items()}
+            departments[department] = MappingProxyType(frozen_entries)
+            stratagems.update(frozen_entries)
+
+        self.layer_id = layer_id
+        self.name = name
+        self.departments = MappingProxyType(departments)
+        self.stratagems = MappingProxyType(stratagems)
+        self.icon_overrides = MappingProxyType(dict(icon_overrides or {}))
+        self.themes = MappingProxyType(dict(themes or {}))
+
+    def __len__(self):
+        return len(self.stratagems) + len(self.icon_overrides) + len(self.themes)
+
+
+class _ResolvedView(Mapping):
+    """Read-only name -> value view resolved through the topmost providing layer."""
+
+    def __init__(self, catalogue, providers, field):
+        self._catalogue = catalogue
+        self._providers = providers
+        self._field = field
+
+    def __getitem__(self, name):
+        layer_id = self._providers[name][-1]
+        value = getattr(self._catalogue._layers[layer_id], self._field)[name]
+        # Palettes are plain dicts; hand out copies so layers stay immutable
+        return dict(value) if isinstance(value, dict) else value
+
+    def __iter__(self):
+        return iter(self._providers)
+
+    def __len__(self):
+        return len(self._providers)
+
+    def __contains__(self, name):
+        return name in self._providers
+
+
+class _DepartmentView(Mapping):
+    """Stratagems placed in one department, each resolved through its topmost layer."""
+
+    def __init__(self, catalogue, department):
+        self._catalogue = catalogue
+        self._department = department
+
+    def _placements(self):
+        return self._catalogue._placement_providers.get(self._department, {})
+
+    def __getitem__(self, name):
+        layer_id = self._placements()[name][-1]
+        return self._catalogue._layers[layer_id].departments[self._department][name]
+
+    def __iter__(self):
+        return iter(self._placements())
+
+    def __len__(self):
+        return len(self._placements())
+
+
+class _DepartmentsView(Mapping):
+    """Department name -> stratagems, ordered by first appearance from the bottom layer up."""
+
+    def __init__(self, catalogue):
+        self._catalogue = catalogue
+
+    def __getitem__(self, department):
+        if department not in self._catalogue._placement_providers:
+            raise KeyError(department)
+        return _DepartmentView(self._catalogue, department)
+
+    def __iter__(self):
+        return iter(self._catalogue._ordered_departments())
+
+    def __len__(self):
+        return len(self._catalogue._placement_providers)
+
+    def __contains__(self, department):
+        return department in self._catalogue._placement_providers
+
+
+class LayeredCatalogue:
+    """Base layer + plugin layers + user layer with per-entry provenance.
+
+    Each entry keeps a stack of the layers providing it (bottom to top), so
+    lookups read the top of the stack and adding, replacing or removing a layer
+    only updates the stacks of that layer's own entries.
+    """
+
+    def __init__(self, base_stratagems_by_department, base_theme_files, base_name="Built-in"):
+        self._layers = {}
+        self._order = []
+        self._stratagem_providers = {}
+        self._placement_providers = {}
+        self._icon_providers = {}
+        self._theme_providers = {}
+        self._department_order = None
+        self._conflicts = None
+
+        self.stratagems = _ResolvedView(self, self._stratagem_providers, "stratagems")
+        self.icon_overrides = _ResolvedView(self, self._icon_providers, "icon_overrides")
+        self.theme_files = _ResolvedView(self, self._theme_providers, "themes")
+        self.stratagems_by_department = _DepartmentsView(self)
+
+        self._insert(CatalogueLayer(BASE_LAYER, base_name, base_stratagems_by_department, themes=base_theme_files), 0)
+        self._insert(CatalogueLayer(USER_LAYER, "User custom"), 1)
+
+    def layer_ids(self):
+        """Return layer ids from bottom (built-in data) to top (user layer)."""
+        return list(self._order)
+
+    def layer(self, layer_id):
+        return self._layers.get(layer_id)
+
+    def plugin_layers(self):
+        """Return plugin layers in precedence order (lowest first)."""
+        return [self._layers[layer_id] for layer_id in self._order[1:-1]]
+
+    def put_layer(self, layer, position=None):
+        """Add or replace a plugin layer; position counts plugin layers only (default: topmost).
+
+        Returns the set of stratagem, icon and theme names whose resolution may have changed.
+        """
+        if layer.layer_id in (BASE_LAYER, USER_LAYER):
+            raise ValueError(f"Reserved layer id: {layer.layer_id}")
+
+        affected = set()
+        if layer.layer_id in self._layers:
+            index = self._order.index(layer.layer_id)
+            affected |= self._remove(layer.layer_id)
+        else:
+            plugin_count = len(self._order) - 2
+            plugin_position = plugin_count if position is None else max(0, min(position, plugin_count))
+            index = 1 + plugin_position
+        affected |= self._insert(layer, index)
+        return affected
+
+    def remove_layer(self, layer_id):
+        """Remove a plugin layer; returns the names whose resolution may have changed."""
+        if layer_id in (BASE_LAYER, USER_LAYER) or layer_id not in self._layers:
+            return set()
+        return self._remove(layer_id)
+
+    def set_user_themes(self, themes):
+        """Replace the user layer's custom themes."""
+        current = self._layers[USER_LAYER]
+        user_layer = CatalogueLayer(USER_LAYER, current.name, icon_overrides=current.icon_overrides, themes=themes)
+        index = self._order.index(USER_LAYER)
+        self._remove(USER_LAYER)
+        self._insert(user_layer, index)
+
+    def set_user_theme(self, theme_name, palette):
+        themes = dict(self._layers[USER_LAYER].themes)
+        themes[theme_name] = palette
+        self.set_user_themes(themes)
+
+    def remove_user_theme(self, theme_name):
+        themes = dict(self._layers[USER_LAYER].themes)
+        if themes.pop(theme_name, None) is not None:
+            self.set_user_themes(themes)
+
+    def stratagem_provenance(self, name):
+        """Return layer names providing a stratagem, bottom to top (the last one wins)."""
+        return [self._layers[layer_id].name for layer_id in self._stratagem_providers.get(name, [])]
+
+    def theme_provenance(self, theme_name):
+        return [self._layers[layer_id].name for layer_id in self._theme_providers.get(theme_name, [])]
+
+    def theme_source(self, theme_name):
+        """Name of the layer providing a theme, or None for built-in themes."""
+        providers = self._theme_providers.get(theme_name)
+        if not providers or providers[-1] == BASE_LAYER:
+            return None
+        return self._layers[providers[-1]].name
+
+    def theme_sources(self):
+        return {theme_name: self.theme_source(theme_name) for theme_name in self._theme_providers}
+
+    def conflict_index(self):
+        """Overrides, normalized-name collisions and duplicate sequences involving non-built-in layers.
+
+        Built in one pass over the provider stacks and cached until a layer changes.
+        Entries are sorted by name so the result is deterministic.
+        """
+        if self._conflicts is not None:
+            return self._conflicts
+
+        overrides = []
+        by_normalized = {}
+        by_sequence = {}
+        for name, providers in self._stratagem_providers.items():
+            if len(providers) > 1:
+                overrides.append(self._override_entry("stratagem", name, providers))
+            by_normalized.setdefault(normalize(name), []).append(name)
+            by_sequence.setdefault(self.stratagems[name], []).append(name)
+        for name, providers in self._icon_providers.items():
+            if len(providers) > 1:
+                overrides.append(self._override_entry("icon", name, providers))
+        for theme_name, providers in self._theme_providers.items():
+            if len(providers) > 1:
+                overrides.append(self._override_entry("theme", theme_name, providers))
+
+        name_collisions = [
+            {"key": key, "names": sorted(names), "sources": [self._top_source(name) for name in sorted(names)]}
+            for key, names in by_normalized.items()
+            if len(names) > 1 and self._involves_plugin(names)
+        ]
+        duplicate_sequences = [
+            {"sequence": list(sequence), "names": sorted(names),
+             "sources": [self._top_source(name) for name in sorted(names)]}
+            for sequence, names in by_sequence.items()
+            if len(names) > 1 and self._involves_plugin(names)
+        ]
+
+        self._conflicts = {
+            "overrides": sorted(overrides, key=lambda entry: (entry["kind"], entry["name"])),
+            "name_collisions": sorted(name_collisions, key=lambda entry: entry["names"]),
+            "duplicate_sequences": sorted(duplicate_sequences, key=lambda entry: entry["names"]),
+        }
+        return self._conflicts
+
+    def _override_entry(self, kind, name, providers):
+        sources = [self._layers[layer_id].name for layer_id in providers]
+        return {"kind": kind, "name": name, "sources": sources, "winner": sources[-1]}
+
+    def _top_source(self, name):
+        return self._layers[self._stratagem_providers[name][-1]].name
+
+    def _involves_plugin(self, names):
+        return any(self._stratagem_providers[name][-1] != BASE_LAYER for name in names)
+
+    def _insert(self, layer, index):
+        self._conflicts = None
+        self._order.insert(index, layer.layer_id)
+        self._layers[layer.layer_id] = layer
+        ranks = {layer_id: rank for rank, layer_id in enumerate(self._order)}
+        rank = ranks[layer.layer_id]
+
+        def push(stack):
+            position = len(stack)
+            while position and ranks[stack[position - 1]] > rank:
+                position -= 1
+            stack.insert(position, layer.layer_id)
+
+        for name in layer.stratagems:
+            push(self._stratagem_providers.setdefault(name, []))
+        for department, entries in layer.departments.items():
+            if department not in self._placement_providers:
+                self._department_order = None
+            placements = self._placement_providers.setdefault(department, {})
+            for name in entries:
+                push(placements.setdefault(name, []))
+        for name in layer.icon_overrides:
+            push(self._icon_providers.setdefault(name, []))
+        for theme_name in layer.themes:
+            push(self._theme_providers.setdefault(theme_name, []))
+        if layer.departments:
+            self._department_order = None
+
+        return set(layer.stratagems) | set(layer.icon_overrides) | set(layer.themes)
+
+    def _remove(self, layer_id):
+        self._conflicts = None
+        layer = self._layers.pop(layer_id)
+        self._order.remove(layer_id)
+
+        def pop(providers, name):
+            stack = providers[name]
+            stack.remove(layer_id)
+            if not stack:
+                del providers[name]
+
+        for name in layer.stratagems:
+            pop(self._stratagem_providers, name)
+        for department, entries in layer.departments.items():
+            placements = self._placement_providers[department]
+            for name in entries:
+                pop(placements, name)
+            if not placements and not self._department_still_declared(department):
+                del self._placement_providers[department]
+        for name in layer.icon_overrides:
+            pop(self._icon_providers, name)
+        for theme_name in layer.themes:
+            pop(self._theme_providers, theme_name)
+        if layer.departments:
+            self._department_order = None
+
+        return set(layer.stratagems) | set(layer.icon_overrides) | set(layer.themes)
+
+    def _department_still_declared(self, department):
+        # A layer may declare a department without valid entries; keep it while one does
+        return any(department in self._layers[layer_id].departments for layer_id in self._order)
+
+    def _ordered_departments(self):
+        if self._department_order is None:
+            order = {}
+            for layer_id in self._order:
+                for department in self._layers[layer_id].departments:
+                    order.setdefault(department, None)
+            self._department_order = list(order)
+        return self._department_order
@@ -17,7 +17,8 @@ NUMPAD_SCAN_CODES = {'53', '55', '74', '71', '72', '73', '78', '75', '76', '77',
 class MacroEngine:
     """Manages macro execution and keyboard hooks"""
     
-    def __init__(self, get_slots_callback, get_settings_callback, map_direction_callback):
+    def __init__(self, get_slots_callback, get_settings_callback, map_direction_callback,
+                 get_stratagems_callback=None):
         """
         Initialize macro engine
         
@@ -25,10 +26,13 @@ class MacroEngine:
             get_slots_callback: Function that returns dict of slots
             get_settings_callback: Function that returns global settings dict
             map_direction_callback: Function that maps direction to key
+            get_stratagems_callback: Function that returns the runtime stratagem
+                registry (base + plugins); defaults to the built-in stratagems
         """
         self.get_slots = get_slots_callback
         self.get_settings = get_settings_callback
         self.map_direction = map_direction_callback
+        self.get_stratagems = get_stratagems_callback or (lambda: STRATAGEMS)
         self.hooks_active = False
     
     def enable(self):
@@ -75,7 +79,7 @@ class MacroEngine:
                 
                 if not is_numpad_key or is_keypad:
                     stratagem_name = slot.assigned_stratagem
-                    seq = STRATAGEMS.get(stratagem_name)
+                    seq = self.get_stratagems().get(stratagem_name)
                     if seq:
                         slot.run_macro(stratagem_name, seq, slot.label_text)
                     return False  # Suppress the key
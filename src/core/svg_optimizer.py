@@ -0,0 +1,330 @@
+"""
+SVG preprocessing for Helldivers Numpad Macros
+Strips editor metadata, unused defs and excess precision from stratagem icons,
+flattens redundant group nesting and reports features QtSvg (SVG Tiny 1.2) ignores.
+Optimized output is cached by content hash so each source is processed once.
+"""
+
+import hashlib
+import os
+import re
+import xml.etree.ElementTree as ET
+
+OPTIMIZER_VERSION = 2
+DEFAULT_PRECISION = 3
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+
+# Namespaces written by vector editors that QtSvg never reads
+EDITOR_NAMESPACES = {
+    "http://www.inkscape.org/namespaces/inkscape",
+    "http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd",
+    "http://www.bohemiancoding.com/sketch/ns",
+    "http://www.serif.com/",
+    "http://ns.adobe.com/AdobeIllustrator/10.0/",
+    "http://ns.adobe.com/Extensibility/1.0/",
+    "http://ns.adobe.com/Graphs/1.0/",
+    "http://ns.adobe.com/SaveForWeb/1.0/",
+    "http://purl.org/dc/elements/1.1/",
+    "http://creativecommons.org/ns#",
+    "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+}
+
+METADATA_TAGS = {"metadata", "title", "desc"}
+
+# Elements outside the SVG Tiny 1.2 subset QtSvg renders
+UNSUPPORTED_TAGS = {
+    "filter", "mask", "pattern", "marker", "foreignObject", "script", "symbol", "clipPath",
+}
+
+# transform is left alone: rounded scale factors are amplified by large translations
+NUMERIC_ATTRIBUTES = {
+    "d", "points", "viewBox",
+    "x", "y", "x1", "y1", "x2", "y2", "cx", "cy", "r", "rx", "ry",
+    "width", "height", "stroke-width", "offset", "fx", "fy",
+}
+
+_NUMBER_RE = re.compile(r"-?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?")
+_REFERENCE_RE = re.compile(r"url\(\s*#([^)\s]+)\s*\)")
+
+PATH_COMMANDS = frozenset("MmZzLlHhVvCcSsQqTtAa")
+_PATH_SEPARATORS = frozenset(" \t\r\n,")
+# Positions of the large-arc and sweep flags within each 7-argument arc segment
+_ARC_FLAG_INDEXES = (3, 4)
+
+
+def _split_tag(tag):
+    """Return (namespace, local name) for an ElementTree tag."""
+    if isinstance(tag, str) and tag.startswith("{"):
+        namespace, local = tag[1:].split("}", 1)
+        return namespace, local
+    return None, tag
+
+
+def _is_svg_element(tag, local_name):
+    """Match an SVG element by local name, with or without the SVG namespace."""
+    namespace, local = _split_tag(tag)
+    return local == local_name and namespace in (SVG_NS, None)
+
+
+def _format_number(match, precision):
+    text = match.group(0)
+    if "." not in text and "e" not in text.lower():
+        return text
+    value = round(float(text), precision)
+    formatted = f"{value:.{precision}f}".rstrip("0").rstrip(".")
+    if formatted in ("-0", ""):
+        formatted = "0"
+    # Leading zero is optional in SVG number syntax
+    if formatted.startswith("0.") and len(formatted) > 2:
+        formatted = formatted[1:]
+    elif formatted.startswith("-0.") and len(formatted) > 3:
+        formatted = "-" + formatted[2:]
+    return formatted
+
+
+def _needs_separator(previous, current):
+    """Check if two adjacent numbers would run together without whitespace."""
+    if current.startswith("-"):
+        return False
+    if current.startswith("."):
+        return "." not in previous and "e" not in previous.lower()
+    return True
+
+
+def round_numbers(value, precision=DEFAULT_PRECISION):
+    """Round every decimal number inside an attribute value."""
+    parts = []
+    cursor = 0
+    previous = None
+    for match in _NUMBER_RE.finditer(value):
+        between = value[cursor:match.start()]
+        formatted = _format_number(match, precision)
+        # Numbers separated only by a sign or decimal point must stay distinct
+        if previous is not None and not between and _needs_separator(previous, formatted):
+            between = " "
+        parts.append(between)
+        parts.append(formatted)
+        previous = formatted
+        cursor = match.end()
+    parts.append(value[cursor:])
+    return "".join(parts)
+
+
+def round_path_data(value, precision=DEFAULT_PRECISION):
+    """Round the numbers of a path 'd' attribute.
+
+    Arc flags are single digits that may touch the next number ('a5 5 0 01.5.5'),
+    so path data is tokenized per command instead of matched as plain numbers.
+    Data that cannot be tokenized is returned unchanged.
+    """
+    parts = []
+    previous = None
+    command = None
+    argument = 0
+    position = 0
+    while position < len(value):
+        char = value[position]
+        if char in _PATH_SEPARATORS:
+            position += 1
+            continue
+        if char in PATH_COMMANDS:
+            parts.append(char)
+            command = char
+            argument = 0
+            previous = None
+            position += 1
+            continue
+
+        if command in ("a", "A") and argument % 7 in _ARC_FLAG_INDEXES:
+            if char not in "01":
+                return value
+            token = char
+            position += 1
+        else:
+            match = _NUMBER_RE.match(value, position)
+            if match is None:
+                return value
+            token = _format_number(match, precision)
+            position = match.end()
+
+        if previous is not None and _needs_separator(previous, token):
+            parts.append(" ")
+        parts.append(token)
+        previous = token
+        argument += 1
+    return "".join(parts)
+
+
+def _referenced_ids(root):
+    """Collect ids referenced through url(#id) or (xlink:)href='#id'."""
+    referenced = set()
+    for element in root.iter():
+        for name, value in element.attrib.items():
+            referenced.update(_REFERENCE_RE.findall(value))
+            _, local = _split_tag(name)
+            if local == "href" and value.startswith("#"):
+                referenced.add(value[1:])
+        if element.text:
+            referenced.update(_REFERENCE_RE.findall(element.text))
+    return referenced
+
+
+def _strip_editor_data(element):
+    for child in list(element):
+        namespace, local = _split_tag(child.tag)
+        if not isinstance(child.tag, str):
+            element.remove(child)
+            continue
+        if namespace in EDITOR_NAMESPACES or (namespace in (SVG_NS, None) and local in METADATA_TAGS):
+            element.remove(child)
+            continue
+        _strip_editor_data(child)
+
+    for name in list(element.attrib):
+        namespace, local = _split_tag(name)
+        if namespace in EDITOR_NAMESPACES or (namespace is None and local.startswith("data-")):
+            del element.attrib[name]
+
+
+def _strip_unused_defs(root, referenced):
+    for parent in list(root.iter()):
+        for child in list(parent):
+            if not _is_svg_element(child.tag, "defs"):
+                continue
+            # Only unreferenced definitions go; id-less children such as <style> always stay
+            for definition in list(child):
+                definition_id = definition.get("id")
+                if definition_id is not None and definition_id not in referenced:
+                    child.remove(definition)
+            if len(child) == 0:
+                parent.remove(child)
+
+
+def _strip_unused_ids(root, referenced):
+    for element in root.iter():
+        element_id = element.get("id")
+        if element_id is not None and element_id not in referenced:
+            del element.attrib["id"]
+
+
+def _flatten_groups(element):
+    """Collapse redundant <g> nesting bottom-up.
+
+    Attribute-less groups are unwrapped into their parent, and a group whose only
+    attribute is a transform and which has a single child pushes the transform
+    down onto that child.
+    """
+    for child in list(element):
+        _flatten_groups(child)
+
+    index = 0
+    while index < len(element):
+        child = element[index]
+        if not _is_svg_element(child.tag, "g"):
+            index += 1
+            continue
+
+        attributes = dict(child.attrib)
+        if not attributes:
+            element.remove(child)
+            for offset, grandchild in enumerate(list(child)):
+                element.insert(index + offset, grandchild)
+            continue
+
+        if set(attributes) == {"transform"} and len(child) == 1:
+            grandchild = child[0]
+            inner = grandchild.get("transform")
+            combined = attributes["transform"] if not inner else f"{attributes['transform']} {inner}"
+            grandchild.set("transform", combined)
+            element.remove(child)
+            element.insert(index, grandchild)
+            continue
+
+        index += 1
+
+
+def validate_svg(root):
+    """Return warnings for elements QtSvg does not render."""
+    warnings = []
+    if not _is_svg_element(root.tag, "svg"):
+        warnings.append("Root element is not <svg>")
+    if root.get("viewBox") is None and (root.get("width") is None or root.get("height") is None):
+        warnings.append("Missing viewBox and explicit size; icon may not scale")
+
+    found = set()
+    for element in root.iter():
+        _, local = _split_tag(element.tag)
+        if local in UNSUPPORTED_TAGS or (isinstance(local, str) and local.startswith("fe")):
+            found.add(local)
+    for local in sorted(found):
+        warnings.append(f"<{local}> is not fully supported by the Qt SVG renderer")
+    return warnings
+
+
+def optimize_svg(data, precision=DEFAULT_PRECISION):
+    """Optimize SVG bytes/text; returns (optimized bytes, warnings).
+
+    Input that cannot be parsed is returned unchanged with a warning.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    ET.register_namespace("", SVG_NS)
+    ET.register_namespace("xlink", XLINK_NS)
+    try:
+        root = ET.fromstring(data)
+    except ET.ParseError as e:
+        return data, [f"Could not parse SVG: {e}"]
+
+    warnings = validate_svg(root)
+
+    _strip_editor_data(root)
+    referenced = _referenced_ids(root)
+    _strip_unused_defs(root, referenced)
+    # Ids may be targeted by CSS selectors when a <style> block is present
+    if not any(_is_svg_element(element.tag, "style") for element in root.iter()):
+        _strip_unused_ids(root, referenced)
+    _flatten_groups(root)
+
+    for element in root.iter():
+        for name, value in list(element.attrib.items()):
+            _, local = _split_tag(name)
+            if local == "d":
+                element.set(name, round_path_data(value, precision))
+            elif local in NUMERIC_ATTRIBUTES:
+                element.set(name, round_numbers(value, precision))
+        # Indentation whitespace between elements is irrelevant to rendering
+        if element.text is not None and not element.text.strip():
+            element.text = None
+        if element.tail is not None and not element.tail.strip():
+            element.tail = None
+
+    optimized = ET.tostring(root, encoding="unicode").encode("utf-8")
+    if len(optimized) >= len(data):
+        return data, warnings
+    return optimized, warnings
+
+
+def content_key(data):
+    """Return the cache key for SVG source bytes."""
+    return hashlib.sha1(b"%d:" % OPTIMIZER_VERSION + data).hexdigest()
+
+
+def optimize_svg_cached(data, cache_dir):
+    """Return the path of the optimized copy of data inside cache_dir, creating it if needed."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    cached_path = os.path.join(cache_dir, f"{content_key(data)}.svg")
+    if os.path.exists(cached_path):
+        return cached_path, []
+
+    optimized, warnings = optimize_svg(data)
+    os.makedirs(cache_dir, exist_ok=True)
+    temp_path = f"{cached_path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(optimized)
+    os.replace(temp_path, cached_path)
+    return cached_path, warnings
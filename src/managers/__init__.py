@@ -1,15 +1,40 @@
 """
 Managers module - Profile and update management
+Update checking and its network stack are imported on first access.
 """
 
+import importlib
+
 from .profile_manager import ProfileManager
 from .plugin_manager import PluginManager
-from .update_manager import check_for_updates_startup, UpdateDialog, SetupDialog
-from . import update_checker
+from .plugin_watcher import PluginWatcher
+from .plugin_loader import PluginLoadThread
+
+_LAZY_EXPORTS = {
+    'check_for_updates_startup': '.update_manager',
+    'UpdateDialog': '.update_manager',
+    'SetupDialog': '.update_manager',
+}
+
+_LAZY_SUBMODULES = {'update_checker', 'update_manager'}
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'ProfileManager',
     'PluginManager',
+    'PluginWatcher',
+    'PluginLoadThread',
     'check_for_updates_startup',
     'UpdateDialog',
     'SetupDialog',
@@ -0,0 +1,29 @@
+"""
+Background plugin loading for Helldivers Numpad Macros
+Discovers, validates and builds plugin layers off the GUI thread so the window
+can show the built-in catalogue immediately.
+"""
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .plugin_manager import PluginManager
+
+
+class PluginLoadThread(QThread):
+    """Builds plugin layers (snapshot or full validation) and hands them back to the GUI thread."""
+
+    layersLoaded = pyqtSignal(list)
+    error = pyqtSignal(str)
+
+    def __init__(self, base_stratagems_by_department, base_theme_files, parent=None):
+        super().__init__(parent)
+        self.base_stratagems_by_department = base_stratagems_by_department
+        self.base_theme_files = base_theme_files
+
+    def run(self):
+        try:
+            layers = PluginManager.load_plugin_layers(self.base_stratagems_by_department, self.base_theme_files)
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+        self.layersLoaded.emit(layers)
@@ -1,28 +1,51 @@
 """
 Plugin manager for Helldivers Numpad Macros.
 Loads data-only plugins that can provide stratagems, icon overrides and themes.
+Plugins are folders with a plugin.json, standalone .json manifests or zipped
+.hdplugin packages read in place.
 """
 
-import copy
+import hashlib
 import json
 import os
 import re
 import shutil
 import sys
 
-from ..config import PLUGINS_DIR
+from ..config import PLUGINS_DIR, CACHE_DIR
+from ..config.config import asset_exists, split_resource_path
+from ..config.version import VERSION
+from ..core.layered_catalogue import CatalogueLayer, LayeredCatalogue
+from .plugin_schema import COLOR_PATTERN, WARNING, diagnostic, format_diagnostic, validate_manifest
+from .plugin_package import (
+    PACKAGE_EXTENSION,
+    SVG_CACHE_DIR,
+    close_package,
+    install_package,
+    is_package_path,
+    member_path,
+    normalize_member,
+    open_package,
+    write_package_manifest,
+)
+
+RUNTIME_SNAPSHOT_PATH = os.path.join(CACHE_DIR, "plugin_runtime.json")
+RUNTIME_SNAPSHOT_VERSION = 5
 
 
 class PluginManager:
     """Load and merge plugin content into runtime application data."""
 
-    VALID_DIRECTIONS = {"up", "down", "left", "right"}
-    COLOR_VALUE_PATTERN = re.compile(r"^(#[0-9A-Fa-f]{3,8}|rgba?\([^\)]+\)|hsla?\([^\)]+\)|[A-Za-z]+)$")
+    COLOR_VALUE_PATTERN = re.compile(COLOR_PATTERN)
     DEFAULT_THEME_COLORS = {
         "background_color": "#111111",
         "border_color": "#666666",
         "accent_color": "#4a90e2",
     }
+    # manifest_path -> (mtime_ns, size, normalized manifest or None, (content, diagnostics) or None)
+    _manifest_cache = {}
+    # manifest_path -> diagnostics last printed, so each problem is reported once
+    _reported_diagnostics = {}
 
     @staticmethod
     def _get_local_plugins_dir():
@@ -56,16 +79,6 @@ class PluginManager:
             return False
         return False
 
-    @staticmethod
-    def _validate_sequence(sequence):
-        """Validate a stratagem input sequence."""
-        if not isinstance(sequence, list) or not sequence:
-            return False
-        for step in sequence:
-            if not isinstance(step, str) or step.lower() not in PluginManager.VALID_DIRECTIONS:
-                return False
-        return True
-
     @staticmethod
     def _resolve_plugin_path(plugin_dir, relative_or_absolute):
         """Resolve plugin resource path relative to plugin folder."""
@@ -75,12 +88,45 @@ class PluginManager:
         path_value = relative_or_absolute.strip()
         if os.path.isabs(path_value):
             return path_value
+        if is_package_path(plugin_dir):
+            member = normalize_member(path_value)
+            return member_path(plugin_dir, member) if member else None
         return os.path.normpath(os.path.join(plugin_dir, path_value))
 
+    @staticmethod
+    def _optimize_icon(icon_path, plugin_id, diagnostics, path):
+        """Return path of the optimized, content-hashed copy of a plugin SVG icon.
+
+        Problems are added to diagnostics at the manifest path of the override.
+        """
+        if not icon_path.lower().endswith(".svg"):
+            return icon_path
+        # Package members were optimized when the package was built or installed
+        # and stay in the archive until they are first rendered
+        if split_resource_path(icon_path)[0]:
+            return icon_path
+
+        # Only needed when icons are (re)built, not when the runtime snapshot is used
+        from ..core.svg_optimizer import optimize_svg_cached
+
+        try:
+            with open(icon_path, "rb") as f:
+                data = f.read()
+            optimized_path, svg_warnings = optimize_svg_cached(data, SVG_CACHE_DIR)
+        except Exception as e:
+            diagnostics.append(diagnostic(plugin_id, path, WARNING, f"could not optimize icon {icon_path}: {e}"))
+            return icon_path
+
+        for svg_warning in svg_warnings:
+            diagnostics.append(diagnostic(plugin_id, path, WARNING, f"{os.path.basename(icon_path)}: {svg_warning}"))
+        return optimized_path
+
     @staticmethod
     def _load_manifest(manifest_path):
-        """Read plugin manifest JSON file."""
+        """Read plugin manifest JSON file or the plugin.json of a package."""
         try:
+            if is_package_path(manifest_path):
+                return open_package(manifest_path).manifest
             with open(manifest_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
             if isinstance(data, dict):
@@ -91,8 +137,11 @@ class PluginManager:
 
     @staticmethod
     def _save_manifest(manifest_path, manifest_data):
-        """Save plugin manifest JSON file."""
+        """Save plugin manifest JSON file or rewrite the plugin.json of a package."""
         try:
+            if is_package_path(manifest_path):
+                write_package_manifest(manifest_path, manifest_data)
+                return True
             with open(manifest_path, "w", encoding="utf-8") as f:
                 json.dump(manifest_data, f, indent=2)
             return True
@@ -100,6 +149,62 @@ class PluginManager:
             print(f"[PluginManager] Failed saving manifest {manifest_path}: {e}")
             return False
 
+    @staticmethod
+    def _manifest_stat(manifest_path):
+        try:
+            stat = os.stat(manifest_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _read_manifest_cached(manifest_path):
+        """Return the normalized manifest, reparsing only when it changed on disk.
+
+        The returned dict is shared with the cache and must be treated as read-only;
+        copy it before changing it.
+        """
+        stat_key = PluginManager._manifest_stat(manifest_path)
+        if stat_key is None:
+            PluginManager._manifest_cache.pop(manifest_path, None)
+            return None
+
+        cached = PluginManager._manifest_cache.get(manifest_path)
+        if cached is None or cached[:2] != stat_key:
+            manifest = PluginManager._load_manifest(manifest_path)
+            if manifest is not None:
+                PluginManager._backfill_theme_colors(manifest)
+            cached = (stat_key[0], stat_key[1], manifest, None)
+            PluginManager._manifest_cache[manifest_path] = cached
+
+        return cached[2]
+
+    @staticmethod
+    def _validate_cached(manifest_path, manifest, plugin_id):
+        """Return (content, diagnostics) for a manifest, validated once per manifest version."""
+        cached = PluginManager._manifest_cache.get(manifest_path)
+        if cached is not None and cached[2] is manifest and cached[3] is not None:
+            return cached[3]
+
+        validation = validate_manifest(manifest, plugin_id)
+        if cached is not None and cached[2] is manifest:
+            PluginManager._manifest_cache[manifest_path] = cached[:3] + (validation,)
+        return validation
+
+    @staticmethod
+    def _write_manifests(changed_manifests):
+        """Write a batch of {manifest_path: manifest} back to disk and refresh the cache."""
+        written = 0
+        for manifest_path, manifest in changed_manifests.items():
+            if not PluginManager._save_manifest(manifest_path, manifest):
+                PluginManager._manifest_cache.pop(manifest_path, None)
+                continue
+            written += 1
+            stat_key = PluginManager._manifest_stat(manifest_path)
+            if stat_key is not None:
+                PluginManager._manifest_cache[manifest_path] = (stat_key[0], stat_key[1], manifest, None)
+        return written
+
     @staticmethod
     def _is_valid_color_value(value):
         """Validate color format used by plugin theme colors."""
@@ -169,77 +274,89 @@ class PluginManager:
         return changed
 
     @staticmethod
-    def _discover_plugins(include_disabled=False):
-        """Discover plugins from plugin root directories."""
-        plugins = []
-        seen_manifest_paths = set()
+    def _classify_entry(root, entry):
+        """Return the manifest location for one plugin root entry, or None."""
+        if entry.is_dir():
+            manifest_path = os.path.join(entry.path, "plugin.json")
+            if not os.path.exists(manifest_path):
+                return None
+            return {
+                "directory": entry.path,
+                "manifest_path": manifest_path,
+                "fallback_id": entry.name,
+            }
+
+        if entry.name.lower().endswith(PACKAGE_EXTENSION) and entry.is_file():
+            return {
+                "directory": entry.path,
+                "manifest_path": entry.path,
+                "fallback_id": os.path.splitext(entry.name)[0],
+            }
+
+        if not entry.name.lower().endswith(".json") or not entry.is_file():
+            return None
+        return {
+            "directory": root,
+            "manifest_path": entry.path,
+            "fallback_id": os.path.splitext(entry.name)[0],
+        }
 
+    @staticmethod
+    def _scan_manifest_paths():
+        """List manifest locations in precedence order without reading them.
+
+        Returns dicts with directory, manifest_path and the fallback id used when
+        the manifest does not define one. Roots keep their precedence (local
+        first, then AppData) and entries are sorted within each root.
+        """
+        found = []
+        seen_manifest_paths = set()
         for root in PluginManager.get_plugin_roots():
             if not os.path.isdir(root):
                 continue
 
             try:
-                entries = sorted(os.listdir(root))
+                with os.scandir(root) as scanned_entries:
+                    entries = sorted(scanned_entries, key=lambda entry: entry.name)
             except Exception as e:
                 print(f"[PluginManager] Cannot list plugin root {root}: {e}")
                 continue
 
             for entry in entries:
-                plugin_dir = os.path.join(root, entry)
-                manifest_path = os.path.join(plugin_dir, "plugin.json")
-                if os.path.isdir(plugin_dir) and os.path.exists(manifest_path):
-                    if manifest_path in seen_manifest_paths:
-                        continue
-                    seen_manifest_paths.add(manifest_path)
-
-                    manifest = PluginManager._load_manifest(manifest_path)
-                    if not manifest:
-                        continue
-
-                    if PluginManager._backfill_theme_colors(manifest):
-                        PluginManager._save_manifest(manifest_path, manifest)
-
-                    if not include_disabled and manifest.get("enabled", True) is False:
-                        continue
-
-                    plugins.append({
-                        "id": manifest.get("id", entry),
-                        "name": manifest.get("name", entry),
-                        "directory": plugin_dir,
-                        "manifest": manifest,
-                        "manifest_path": manifest_path,
-                    })
-                    continue
-
-                if not os.path.isfile(plugin_dir):
+                location = PluginManager._classify_entry(root, entry)
+                if location is None or location["manifest_path"] in seen_manifest_paths:
                     continue
+                seen_manifest_paths.add(location["manifest_path"])
+                found.append(location)
+        return found
 
-                if not entry.lower().endswith(".json"):
-                    continue
-
-                manifest_path = plugin_dir
-                if manifest_path in seen_manifest_paths:
-                    continue
-                seen_manifest_paths.add(manifest_path)
+    @staticmethod
+    def _discover_plugins(include_disabled=False, scanned=None):
+        """Discover plugins from plugin root directories.
 
-                manifest = PluginManager._load_manifest(manifest_path)
-                if not manifest:
-                    continue
+        Read-only: theme colors are normalized in memory and manifests are only
+        written back through _write_manifests when a selection is saved.
+        Only manifests that changed on disk are read and parsed again.
+        """
+        locations = scanned if scanned is not None else PluginManager._scan_manifest_paths()
 
-                if PluginManager._backfill_theme_colors(manifest):
-                    PluginManager._save_manifest(manifest_path, manifest)
+        plugins = []
+        for location in locations:
+            manifest = PluginManager._read_manifest_cached(location["manifest_path"])
+            if not manifest:
+                continue
 
-                if not include_disabled and manifest.get("enabled", True) is False:
-                    continue
+            if not include_disabled and manifest.get("enabled", True) is False:
+                continue
 
-                file_stem = os.path.splitext(entry)[0]
-                plugins.append({
-                    "id": manifest.get("id", file_stem),
-                    "name": manifest.get("name", file_stem),
-                    "directory": root,
-                    "manifest": manifest,
-                    "manifest_path": manifest_path,
-                })
+            fallback_id = location["fallback_id"]
+            plugins.append({
+                "id": manifest.get("id", fallback_id),
+                "name": manifest.get("name", fallback_id),
+                "directory": location["directory"],
+                "manifest": manifest,
+                "manifest_path": location["manifest_path"],
+            })
 
         return plugins
 
@@ -249,11 +366,14 @@ class PluginManager:
         plugin_list = []
         for plugin in PluginManager._discover_plugins(include_disabled=True):
             manifest = plugin.get("manifest", {})
+            plugin_id = str(plugin.get("id", "unknown"))
+            _, diagnostics = PluginManager._validate_cached(plugin.get("manifest_path", ""), manifest, plugin_id)
             plugin_list.append({
-                "id": str(plugin.get("id", "unknown")),
+                "id": plugin_id,
                 "name": str(plugin.get("name", "unknown")),
                 "enabled": bool(manifest.get("enabled", True)),
                 "manifest_path": plugin.get("manifest_path", ""),
+                "diagnostics": diagnostics,
             })
         return plugin_list
 
@@ -265,6 +385,7 @@ class PluginManager:
 
         selected_normalized = os.path.normcase(os.path.normpath(selected_manifest_path))
         found_selected = False
+        changed_manifests = {}
 
         plugins = PluginManager._discover_plugins(include_disabled=True)
         for plugin in plugins:
@@ -282,9 +403,9 @@ class PluginManager:
             if current_enabled == should_enable:
                 continue
 
-            manifest["enabled"] = should_enable
-            PluginManager._save_manifest(manifest_path, manifest)
+            changed_manifests[manifest_path] = dict(manifest, enabled=should_enable)
 
+        PluginManager._write_manifests(changed_manifests)
         return found_selected
 
     @staticmethod
@@ -300,6 +421,7 @@ class PluginManager:
         }
 
         found_selected = False
+        changed_manifests = {}
         plugins = PluginManager._discover_plugins(include_disabled=True)
         for plugin in plugins:
             manifest_path = plugin.get("manifest_path", "")
@@ -316,14 +438,14 @@ class PluginManager:
             if current_enabled == should_enable:
                 continue
 
-            manifest["enabled"] = should_enable
-            PluginManager._save_manifest(manifest_path, manifest)
+            changed_manifests[manifest_path] = dict(manifest, enabled=should_enable)
 
+        PluginManager._write_manifests(changed_manifests)
         return found_selected or not selected_normalized
 
     @staticmethod
     def uninstall_plugin_by_manifest(manifest_path):
-        """Uninstall plugin by manifest path. Removes plugin folder or standalone manifest file."""
+        """Uninstall plugin by manifest path. Removes plugin folder, package or standalone manifest file."""
         if not isinstance(manifest_path, str) or not manifest_path.strip():
             return False, "Invalid plugin manifest path."
 
@@ -335,6 +457,13 @@ class PluginManager:
             return False, "Refusing to remove path outside plugin folders."
 
         try:
+            if is_package_path(manifest_abs) and os.path.isfile(manifest_abs):
+                # Release the open zip handle first; Windows cannot delete open files
+                close_package(manifest_abs)
+                PluginManager._manifest_cache.pop(manifest_path, None)
+                os.remove(manifest_abs)
+                return True, "Plugin package removed."
+
             if os.path.basename(manifest_abs).lower() == "plugin.json":
                 plugin_dir = os.path.dirname(manifest_abs)
                 if PluginManager._is_under_plugin_roots(plugin_dir) and os.path.isdir(plugin_dir):
@@ -350,86 +479,260 @@ class PluginManager:
         return False, "Nothing was removed."
 
     @staticmethod
-    def build_runtime_data(base_stratagems_by_department, base_theme_files):
-        """Build merged runtime data from base app data and plugins."""
-        merged_departments = copy.deepcopy(base_stratagems_by_department)
-        merged_theme_files = dict(base_theme_files)
-        theme_sources = {theme_name: None for theme_name in merged_theme_files.keys()}
-        icon_overrides = {}
+    def install_plugin_package(package_path):
+        """Copy a .hdplugin package into the AppData plugin folder. Returns (success, message, installed path)."""
+        if not is_package_path(package_path) or not os.path.isfile(package_path):
+            return False, f"Select a {PACKAGE_EXTENSION} plugin package.", None
+        return install_package(package_path, PLUGINS_DIR)
 
-        loaded_plugins = []
-        warnings = []
+    @staticmethod
+    def _runtime_fingerprint(base_stratagems_by_department, base_theme_files, scanned):
+        """Hash app version, base data and manifest path/mtime/size of every plugin."""
+        digest = hashlib.sha1()
+        digest.update(f"{RUNTIME_SNAPSHOT_VERSION}|{VERSION}\n".encode("utf-8"))
+        digest.update(
+            json.dumps([base_stratagems_by_department, base_theme_files], sort_keys=True).encode("utf-8")
+        )
+        for location in scanned:
+            digest.update(f"\n{PluginManager._file_stat_entry(location['manifest_path'])}".encode("utf-8"))
+        return digest.hexdigest()
 
-        for plugin in PluginManager._discover_plugins():
-            plugin_id = str(plugin.get("id", "unknown"))
-            plugin_name = str(plugin.get("name", plugin_id))
-            plugin_dir = plugin["directory"]
-            manifest = plugin["manifest"]
-
-            loaded_plugins.append(plugin_name)
-
-            plugin_departments = manifest.get("stratagems_by_department", {})
-            if isinstance(plugin_departments, dict):
-                for department, stratagems in plugin_departments.items():
-                    if not isinstance(department, str) or not isinstance(stratagems, dict):
-                        warnings.append(f"[{plugin_id}] Invalid stratagems in department '{department}'")
-                        continue
-
-                    department_bucket = merged_departments.setdefault(department, {})
-                    for stratagem_name, sequence in stratagems.items():
-                        if not isinstance(stratagem_name, str) or not PluginManager._validate_sequence(sequence):
-                            warnings.append(f"[{plugin_id}] Invalid sequence for stratagem '{stratagem_name}'")
-                            continue
-
-                        department_bucket[stratagem_name] = [step.lower() for step in sequence]
-
-            plugin_icon_overrides = manifest.get("icon_overrides", {})
-            if isinstance(plugin_icon_overrides, dict):
-                for stratagem_name, icon_path in plugin_icon_overrides.items():
-                    if not isinstance(stratagem_name, str):
-                        continue
-
-                    resolved_icon_path = PluginManager._resolve_plugin_path(plugin_dir, icon_path)
-                    if resolved_icon_path and os.path.exists(resolved_icon_path):
-                        icon_overrides[stratagem_name] = resolved_icon_path
-                    else:
-                        warnings.append(f"[{plugin_id}] Missing icon override file: {icon_path}")
-
-            plugin_themes = manifest.get("themes", [])
-            if isinstance(plugin_themes, list):
-                for theme_entry in plugin_themes:
-                    if not isinstance(theme_entry, dict):
-                        continue
-
-                    theme_name = theme_entry.get("name")
-                    if not isinstance(theme_name, str):
-                        continue
-
-                    theme_colors = PluginManager._normalize_theme_colors(theme_entry.get("colors"))
-                    if theme_colors:
-                        merged_theme_files[theme_name] = theme_colors
-                        theme_sources[theme_name] = plugin_name
-                    else:
-                        warnings.append(
-                            f"[{plugin_id}] Theme '{theme_name}' must define colors in JSON: "
-                            "colors.background_color, colors.border_color, colors.accent_color"
-                        )
-
-        merged_stratagems = {}
-        for _, stratagems in merged_departments.items():
-            merged_stratagems.update(stratagems)
-
-        if loaded_plugins:
-            print(f"[PluginManager] Loaded plugins: {', '.join(loaded_plugins)}")
-        for warning in warnings:
-            print(f"[PluginManager] Warning: {warning}")
+    @staticmethod
+    def _icon_sources_fingerprint(plugin_layers):
+        """Hash path/mtime/size of every icon source file the layers were built from."""
+        digest = hashlib.sha1()
+        for layer in plugin_layers:
+            for icon_source in layer.get("icon_sources", []):
+                digest.update(f"\n{PluginManager._file_stat_entry(icon_source)}".encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _file_stat_entry(path):
+        try:
+            stat = os.stat(path)
+            return f"{path}|{stat.st_mtime_ns}|{stat.st_size}"
+        except OSError:
+            return f"{path}|missing"
+
+    @staticmethod
+    def _load_runtime_snapshot(fingerprint):
+        """Return cached plugin layers when the snapshot matches fingerprint."""
+        try:
+            with open(RUNTIME_SNAPSHOT_PATH, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(snapshot, dict) or snapshot.get("fingerprint") != fingerprint:
+            return None
+        plugin_layers = snapshot.get("plugin_layers")
+        if not isinstance(plugin_layers, list):
+            return None
+
+        # Icon overrides point at optimized copies of their sources; rebuild if a source was edited
+        if snapshot.get("icon_fingerprint") != PluginManager._icon_sources_fingerprint(plugin_layers):
+            return None
+        # ...or if an optimized copy was removed from the cache
+        for layer in plugin_layers:
+            for icon_path in layer.get("icon_overrides", {}).values():
+                if icon_path.startswith(SVG_CACHE_DIR) and not os.path.isfile(icon_path):
+                    return None
+        return plugin_layers
+
+    @staticmethod
+    def _save_runtime_snapshot(fingerprint, plugin_layers):
+        """Persist validated plugin layers for the next start."""
+        try:
+            os.makedirs(os.path.dirname(RUNTIME_SNAPSHOT_PATH), exist_ok=True)
+            temp_path = f"{RUNTIME_SNAPSHOT_PATH}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "fingerprint": fingerprint,
+                    "icon_fingerprint": PluginManager._icon_sources_fingerprint(plugin_layers),
+                    "plugin_layers": plugin_layers,
+                }, f)
+            os.replace(temp_path, RUNTIME_SNAPSHOT_PATH)
+        except Exception as e:
+            print(f"[PluginManager] Could not save runtime snapshot: {e}")
+
+    @staticmethod
+    def _report_runtime_data(runtime_data):
+        PluginManager.report_plugin_layers(runtime_data.get("plugin_layers", []))
+
+    @staticmethod
+    def report_plugin_layers(layers):
+        """Print loaded plugin names and any diagnostics not reported yet."""
+        if layers:
+            print(f"[PluginManager] Loaded plugins: {', '.join(layer['name'] for layer in layers)}")
+        PluginManager._report_diagnostics(layers)
+
+    @staticmethod
+    def _report_diagnostics(layers):
+        """Print each plugin's diagnostics once; they are printed again only when they change."""
+        for layer in layers:
+            manifest_path = layer.get("manifest_path", "")
+            diagnostics = layer.get("diagnostics", [])
+            if PluginManager._reported_diagnostics.get(manifest_path) == diagnostics:
+                continue
+            PluginManager._reported_diagnostics[manifest_path] = diagnostics
+            for entry in diagnostics:
+                print(f"[PluginManager] {format_diagnostic(entry)}")
+
+    @staticmethod
+    def build_runtime_data(base_stratagems_by_department, base_theme_files, use_snapshot=True):
+        """Build merged runtime data from base app data and plugins.
+
+        Validated plugin layers are cached in a snapshot keyed by app version,
+        base data, plugin manifest and icon source paths/mtimes/sizes, so unchanged
+        plugin sets load with a single file read plus stat calls.
+        """
+        layers = PluginManager.load_plugin_layers(base_stratagems_by_department, base_theme_files, use_snapshot)
+        runtime_data = PluginManager._combine_layers(base_stratagems_by_department, base_theme_files, layers)
+        PluginManager._report_runtime_data(runtime_data)
+        return runtime_data
+
+    @staticmethod
+    def base_runtime_data(base_stratagems_by_department, base_theme_files):
+        """Runtime data with no plugin layers, used to show the window before plugins are loaded."""
+        return PluginManager._combine_layers(base_stratagems_by_department, base_theme_files, [])
+
+    @staticmethod
+    def load_plugin_layers(base_stratagems_by_department, base_theme_files, use_snapshot=True):
+        """Return validated plugin layers in precedence order, from the snapshot when it is current.
+
+        Touches no Qt objects, so it can run on a worker thread.
+        """
+        scanned = PluginManager._scan_manifest_paths()
+        fingerprint = None
+        layers = None
+        if use_snapshot:
+            fingerprint = PluginManager._runtime_fingerprint(
+                base_stratagems_by_department, base_theme_files, scanned
+            )
+            layers = PluginManager._load_runtime_snapshot(fingerprint)
+
+        if layers is None:
+            layers = [
+                PluginManager._build_plugin_layer(plugin)
+                for plugin in PluginManager._discover_plugins(scanned=scanned)
+            ]
+            if use_snapshot:
+                PluginManager._save_runtime_snapshot(fingerprint, layers)
+        return layers
+
+    @staticmethod
+    def reload_plugin_layers(previous_layers, base_stratagems_by_department, base_theme_files, changed_paths):
+        """Return plugin layers after plugin files changed, rebuilding only affected ones.
+
+        changed_paths holds manifest paths (or plugin root paths) reported by the watcher.
+        Plugins that are new or newly enabled are always built and removed or disabled
+        plugins drop out; every other layer is reused as is.
+        """
+        changed = {os.path.normcase(os.path.normpath(path)) for path in changed_paths if path}
+        previous_by_path = {
+            os.path.normcase(os.path.normpath(layer.get("manifest_path", ""))): layer
+            for layer in previous_layers
+        }
+
+        scanned = PluginManager._scan_manifest_paths()
+        layers = []
+        rebuilt = []
+        for plugin in PluginManager._discover_plugins(scanned=scanned):
+            key = os.path.normcase(os.path.normpath(plugin["manifest_path"]))
+            layer = previous_by_path.get(key)
+            if layer is None or key in changed:
+                layer = PluginManager._build_plugin_layer(plugin)
+                rebuilt.append(layer)
+            layers.append(layer)
+
+        if rebuilt:
+            print(f"[PluginManager] Reloaded plugins: {', '.join(layer['name'] for layer in rebuilt)}")
+        PluginManager._report_diagnostics(rebuilt)
+
+        fingerprint = PluginManager._runtime_fingerprint(
+            base_stratagems_by_department, base_theme_files, scanned
+        )
+        PluginManager._save_runtime_snapshot(fingerprint, layers)
+        return layers
+
+    @staticmethod
+    def catalogue_layer(layer):
+        """Freeze a validated plugin layer into an immutable catalogue layer keyed by its manifest path."""
+        return CatalogueLayer(
+            layer["manifest_path"],
+            layer["name"],
+            layer["stratagems_by_department"],
+            layer["icon_overrides"],
+            layer["themes"],
+        )
+
+    @staticmethod
+    def _build_plugin_layer(plugin):
+        """Build one plugin's layer from its schema-validated content, independently of other plugins."""
+        plugin_id = str(plugin.get("id", "unknown"))
+        plugin_name = str(plugin.get("name", plugin_id))
+        plugin_dir = plugin["directory"]
+        content, schema_diagnostics = PluginManager._validate_cached(
+            plugin.get("manifest_path", ""), plugin["manifest"], plugin_id
+        )
+        diagnostics = list(schema_diagnostics)
+
+        layer_departments = {
+            department: dict(stratagems)
+            for department, stratagems in content["stratagems_by_department"].items()
+        }
+
+        icon_overrides = {}
+        icon_sources = []
+        for stratagem_name, icon_path in content["icon_overrides"].items():
+            path = ("icon_overrides", stratagem_name)
+            resolved_icon_path = PluginManager._resolve_plugin_path(plugin_dir, icon_path)
+            if resolved_icon_path and not split_resource_path(resolved_icon_path)[0]:
+                icon_sources.append(resolved_icon_path)
+            if resolved_icon_path and asset_exists(resolved_icon_path):
+                icon_overrides[stratagem_name] = PluginManager._optimize_icon(
+                    resolved_icon_path, plugin_id, diagnostics, path
+                )
+            else:
+                diagnostics.append(diagnostic(plugin_id, path, WARNING, f"missing icon file {icon_path}"))
+
+        themes = {
+            theme["name"]: PluginManager._normalize_theme_colors(theme["colors"])
+            for theme in content["themes"]
+        }
 
         return {
-            "stratagems_by_department": merged_departments,
-            "stratagems": merged_stratagems,
-            "theme_files": merged_theme_files,
-            "theme_sources": theme_sources,
+            "id": plugin_id,
+            "name": plugin_name,
+            "directory": plugin_dir,
+            "manifest_path": plugin.get("manifest_path", ""),
+            "stratagems_by_department": layer_departments,
             "icon_overrides": icon_overrides,
-            "loaded_plugins": loaded_plugins,
-            "warnings": warnings,
+            "icon_sources": icon_sources,
+            "themes": themes,
+            "diagnostics": diagnostics,
+        }
+
+    @staticmethod
+    def _combine_layers(base_stratagems_by_department, base_theme_files, layers):
+        """Stack plugin layers over the base data in a LayeredCatalogue; later layers win.
+
+        The returned mappings are live read-only views of the catalogue.
+        """
+        catalogue = LayeredCatalogue(base_stratagems_by_department, base_theme_files)
+        diagnostics = []
+        for layer in layers:
+            catalogue.put_layer(PluginManager.catalogue_layer(layer))
+            diagnostics.extend(layer["diagnostics"])
+
+        return {
+            "catalogue": catalogue,
+            "stratagems_by_department": catalogue.stratagems_by_department,
+            "stratagems": catalogue.stratagems,
+            "theme_files": catalogue.theme_files,
+            "theme_sources": catalogue.theme_sources(),
+            "icon_overrides": catalogue.icon_overrides,
+            "loaded_plugins": [layer["name"] for layer in layers],
+            "diagnostics": diagnostics,
+            "plugin_layers": layers,
         }
@@ -0,0 +1,249 @@
+"""
+Zipped plugin packages for Helldivers Numpad Macros
+A .hdplugin file is a zip archive holding plugin.json plus the icons it
+references. The manifest is parsed when the package is opened; other members
+are only read through the zip index when an icon is first rendered. SVG members
+are optimized when a package is built or installed, not when it is loaded.
+
+Members are addressed as 'hdplugin://<package path>!<member>' so the asset
+helpers (icon cache, renderer pool, find_svg_path) read them in place.
+"""
+
+import json
+import os
+import threading
+import zipfile
+
+from ..config import CACHE_DIR
+from ..config.config import register_resource_scheme
+
+PACKAGE_EXTENSION = ".hdplugin"
+PACKAGE_SCHEME = "hdplugin"
+PACKAGE_MANIFEST = "plugin.json"
+SVG_CACHE_DIR = os.path.join(CACHE_DIR, "svg")
+
+_MEMBER_SEPARATOR = PACKAGE_EXTENSION + "!"
+
+
+class PluginPackageError(Exception):
+    """Raised when a package is not a zip archive or has no valid plugin.json."""
+
+
+class PluginPackage:
+    """Read-only view over a .hdplugin archive; the zip index is read once on open."""
+
+    def __init__(self, path):
+        self.path = path
+        try:
+            self._zip = zipfile.ZipFile(path, "r")
+        except (OSError, zipfile.BadZipFile) as e:
+            raise PluginPackageError(f"Not a plugin package: {path} ({e})") from e
+
+        try:
+            self._index = {info.filename: info for info in self._zip.infolist() if not info.is_dir()}
+            self.manifest = self._read_manifest()
+        except Exception:
+            self._zip.close()
+            raise
+
+    def _read_manifest(self):
+        if PACKAGE_MANIFEST not in self._index:
+            raise PluginPackageError(f"Package has no {PACKAGE_MANIFEST}: {self.path}")
+        try:
+            manifest = json.loads(self._zip.read(PACKAGE_MANIFEST).decode("utf-8"))
+        except (ValueError, UnicodeDecodeError) as e:
+            raise PluginPackageError(f"Invalid {PACKAGE_MANIFEST} in {self.path}: {e}") from e
+        if not isinstance(manifest, dict):
+            raise PluginPackageError(f"{PACKAGE_MANIFEST} in {self.path} is not an object")
+        return manifest
+
+    def __contains__(self, member):
+        return member in self._index
+
+    def members(self):
+        """Return all file member paths in the package."""
+        return list(self._index.keys())
+
+    def read(self, member):
+        """Return the bytes of a member, or raise KeyError."""
+        return self._zip.read(self._index[member])
+
+    def digest(self, member):
+        """Return the CRC and size recorded in the zip index for a member, or None."""
+        info = self._index.get(member)
+        return f"{info.CRC:08x}|{info.file_size}" if info else None
+
+    def close(self):
+        self._zip.close()
+
+
+# package path -> (mtime_ns, size, PluginPackage); reopened when the file changes
+_open_packages = {}
+_open_packages_lock = threading.Lock()
+
+
+def is_package_path(path):
+    return isinstance(path, str) and path.lower().endswith(PACKAGE_EXTENSION)
+
+
+def open_package(path):
+    """Return the cached PluginPackage for a path, reopening it if the file changed."""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    stat_key = (stat.st_mtime_ns, stat.st_size)
+    with _open_packages_lock:
+        cached = _open_packages.get(path)
+        if cached is not None and cached[:2] == stat_key:
+            return cached[2]
+
+        package = PluginPackage(path)
+        if cached is not None:
+            cached[2].close()
+        _open_packages[path] = (stat_key[0], stat_key[1], package)
+        return package
+
+
+def close_package(path):
+    """Close a cached package handle so the file can be replaced or removed."""
+    with _open_packages_lock:
+        cached = _open_packages.pop(os.path.abspath(path), None)
+    if cached is not None:
+        cached[2].close()
+
+
+def member_path(package_path, member):
+    """Return the virtual asset path of a package member."""
+    return f"{PACKAGE_SCHEME}://{os.path.abspath(package_path)}!{member}"
+
+
+def normalize_member(relative_path):
+    """Turn a manifest-relative path into a zip member name, or None if it escapes the package."""
+    member = relative_path.strip().replace("\\", "/")
+    while member.startswith("./"):
+        member = member[2:]
+    if not member or member.startswith("/") or ".." in member.split("/"):
+        return None
+    return member
+
+
+def _split_member(reference):
+    index = reference.lower().find(_MEMBER_SEPARATOR)
+    if index < 0:
+        raise FileNotFoundError(f"{PACKAGE_SCHEME}://{reference}")
+    split_at = index + len(PACKAGE_EXTENSION)
+    return reference[:split_at], reference[split_at + 1:]
+
+
+def _package_read(reference):
+    package_path, member = _split_member(reference)
+    try:
+        return open_package(package_path).read(member)
+    except (KeyError, PluginPackageError) as e:
+        raise FileNotFoundError(f"{PACKAGE_SCHEME}://{reference}") from e
+
+
+def _package_exists(reference):
+    try:
+        package_path, member = _split_member(reference)
+        return member in open_package(package_path)
+    except (OSError, PluginPackageError):
+        return False
+
+
+def _package_fingerprint(reference):
+    try:
+        package_path, member = _split_member(reference)
+        return open_package(package_path).digest(member)
+    except (OSError, PluginPackageError):
+        return None
+
+
+register_resource_scheme(PACKAGE_SCHEME, _package_read, _package_exists, _package_fingerprint)
+
+
+def write_package_manifest(package_path, manifest):
+    """Replace plugin.json inside a package, copying the other members unchanged."""
+    package_path = os.path.abspath(package_path)
+    temp_path = package_path + ".tmp"
+    with zipfile.ZipFile(package_path, "r") as source, \
+            zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED) as target:
+        target.writestr(PACKAGE_MANIFEST, json.dumps(manifest, indent=2))
+        for info in source.infolist():
+            if info.filename != PACKAGE_MANIFEST:
+                target.writestr(info, source.read(info))
+    close_package(package_path)
+    os.replace(temp_path, package_path)
+
+
+def _optimized_member(member, data):
+    """Return member bytes, with SVG icons run through the optimizer (cached by content hash)."""
+    if not member.lower().endswith(".svg"):
+        return data
+
+    # Only needed when packing, not when packages are loaded
+    from ..core.svg_optimizer import optimize_svg_cached
+
+    try:
+        optimized_path, svg_warnings = optimize_svg_cached(data, SVG_CACHE_DIR)
+        with open(optimized_path, "rb") as f:
+            optimized = f.read()
+    except Exception as e:
+        print(f"[PluginPackage] Could not optimize {member}: {e}")
+        return data
+
+    for svg_warning in svg_warnings:
+        print(f"[PluginPackage] {member}: {svg_warning}")
+    return optimized
+
+
+def build_package(plugin_dir, output_path):
+    """Pack a folder plugin (plugin.json + resources) into a .hdplugin file, optimizing its SVG icons."""
+    if not os.path.isfile(os.path.join(plugin_dir, PACKAGE_MANIFEST)):
+        raise PluginPackageError(f"No {PACKAGE_MANIFEST} in {plugin_dir}")
+
+    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for current_dir, dir_names, file_names in os.walk(plugin_dir):
+            dir_names.sort()
+            for file_name in sorted(file_names):
+                file_path = os.path.join(current_dir, file_name)
+                member = os.path.relpath(file_path, plugin_dir).replace(os.sep, "/")
+                with open(file_path, "rb") as f:
+                    archive.writestr(member, _optimized_member(member, f.read()))
+    return output_path
+
+
+def install_package(source_path, target_dir):
+    """Validate a package and copy it into target_dir with its SVG icons optimized.
+
+    Returns (success, message, installed path).
+    """
+    try:
+        with zipfile.ZipFile(source_path, "r") as archive:
+            if PACKAGE_MANIFEST not in archive.namelist():
+                return False, f"Package has no {PACKAGE_MANIFEST}.", None
+            manifest = json.loads(archive.read(PACKAGE_MANIFEST).decode("utf-8"))
+        if not isinstance(manifest, dict):
+            return False, f"{PACKAGE_MANIFEST} is not a JSON object.", None
+    except (OSError, zipfile.BadZipFile, ValueError, UnicodeDecodeError) as e:
+        return False, f"Invalid plugin package: {e}", None
+
+    target_path = os.path.join(target_dir, os.path.basename(source_path))
+    if os.path.normcase(os.path.abspath(source_path)) == os.path.normcase(os.path.abspath(target_path)):
+        return True, "Plugin package is already installed.", target_path
+
+    temp_path = target_path + ".tmp"
+    try:
+        os.makedirs(target_dir, exist_ok=True)
+        with zipfile.ZipFile(source_path, "r") as source, \
+                zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED) as target:
+            for info in source.infolist():
+                target.writestr(info, _optimized_member(info.filename, source.read(info)))
+        close_package(target_path)
+        os.replace(temp_path, target_path)
+    except (OSError, zipfile.BadZipFile) as e:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False, f"Failed installing plugin package: {e}", None
+
+    name = manifest.get("name", os.path.splitext(os.path.basename(target_path))[0])
+    return True, f"Installed plugin package '{name}'.", target_path
@@ -0,0 +1,236 @@
+"""
+Declarative plugin manifest schema for Helldivers Numpad Macros
+MANIFEST_SCHEMA is compiled once into nested validator functions. Validating a
+manifest returns its usable content (invalid entries dropped, directions
+lower-cased, strings stripped) and diagnostics locating every problem by
+plugin, JSON path and severity.
+"""
+
+import json
+import re
+
+ERROR = "error"      # The value was dropped
+WARNING = "warning"  # The value was dropped but its parent is still usable
+INFO = "info"        # Ignored content, e.g. unknown keys
+
+DIRECTIONS = ("up", "down", "left", "right")
+COLOR_PATTERN = r"^(#[0-9A-Fa-f]{3,8}|rgba?\([^\)]+\)|hsla?\([^\)]+\)|[A-Za-z]+)$"
+THEME_COLOR_KEYS = ("background_color", "border_color", "accent_color")
+
+_COLOR = {"type": "string", "strip": True, "pattern": COLOR_PATTERN, "severity": WARNING}
+
+SEQUENCE_SCHEMA = {
+    "type": "array",
+    "min_items": 1,
+    # One bad step invalidates the whole sequence
+    "strict": True,
+    "items": {"type": "string", "enum": DIRECTIONS, "case_insensitive": True},
+}
+
+THEME_SCHEMA = {
+    "type": "object",
+    "required": ["name", "colors"],
+    "properties": {
+        "name": {"type": "string", "non_empty": True},
+        "colors": {
+            "type": "object",
+            "properties": {
+                "background_color": _COLOR,
+                "border_color": _COLOR,
+                "accent_color": _COLOR,
+                "background": _COLOR,
+                "border": _COLOR,
+                "accent": _COLOR,
+            },
+            "required_any": THEME_COLOR_KEYS,
+        },
+    },
+}
+
+MANIFEST_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "string", "non_empty": True},
+        "name": {"type": "string", "non_empty": True},
+        "enabled": {"type": "boolean"},
+        "stratagems_by_department": {
+            "type": "object",
+            "values": {"type": "object", "values": SEQUENCE_SCHEMA},
+        },
+        "icon_overrides": {
+            "type": "object",
+            "values": {"type": "string", "strip": True, "non_empty": True},
+        },
+        "themes": {"type": "array", "items": THEME_SCHEMA},
+    },
+}
+
+# Returned by compiled validators for values that must be dropped
+INVALID = object()
+
+_JSON_TYPE_NAMES = {dict: "object", list: "array", str: "string", bool: "boolean", type(None): "null"}
+
+
+def _type_name(value):
+    return _JSON_TYPE_NAMES.get(type(value), "number" if isinstance(value, (int, float)) else type(value).__name__)
+
+
+def format_path(path):
+    """Render a path tuple as a JSON path, e.g. $.themes[0].colors."""
+    parts = ["$"]
+    for segment in path:
+        if isinstance(segment, int):
+            parts.append(f"[{segment}]")
+        elif segment.isidentifier():
+            parts.append(f".{segment}")
+        else:
+            parts.append(f"[{json.dumps(segment)}]")
+    return "".join(parts)
+
+
+def compile_schema(schema):
+    """Compile a schema node into validate(value, path, report) -> cleaned value or INVALID.
+
+    report(path, severity, message) is called for every problem found.
+    """
+    kind = schema.get("type")
+    severity = schema.get("severity", ERROR)
+
+    if kind == "object":
+        return _compile_object(schema, severity)
+    if kind == "array":
+        return _compile_array(schema, severity)
+    if kind == "string":
+        return _compile_string(schema, severity)
+    if kind == "boolean":
+        def validate_boolean(value, path, report):
+            if isinstance(value, bool):
+                return value
+            report(path, severity, f"expected a boolean, got {_type_name(value)}")
+            return INVALID
+        return validate_boolean
+    raise ValueError(f"Unsupported schema type: {kind}")
+
+
+def _compile_object(schema, severity):
+    properties = {key: compile_schema(child) for key, child in schema.get("properties", {}).items()}
+    values = compile_schema(schema["values"]) if "values" in schema else None
+    required = tuple(schema.get("required", ()))
+    required_any = tuple(schema.get("required_any", ()))
+
+    def validate_object(value, path, report):
+        if not isinstance(value, dict):
+            report(path, severity, f"expected an object, got {_type_name(value)}")
+            return INVALID
+
+        result = {}
+        for key, item in value.items():
+            validator = properties.get(key, values)
+            if validator is None:
+                report(path + (key,), INFO, "unknown key ignored")
+                continue
+            cleaned = validator(item, path + (key,), report)
+            if cleaned is not INVALID:
+                result[key] = cleaned
+
+        for key in required:
+            if key not in result:
+                if key not in value:
+                    report(path, severity, f"missing required key '{key}'")
+                return INVALID
+        if required_any and not any(key in result for key in required_any):
+            report(path, severity, f"needs at least one valid value for {', '.join(required_any)}")
+            return INVALID
+        return result
+
+    return validate_object
+
+
+def _compile_array(schema, severity):
+    items = compile_schema(schema["items"])
+    min_items = schema.get("min_items", 0)
+    strict = schema.get("strict", False)
+
+    def validate_array(value, path, report):
+        if not isinstance(value, list):
+            report(path, severity, f"expected an array, got {_type_name(value)}")
+            return INVALID
+
+        result = []
+        for index, item in enumerate(value):
+            cleaned = items(item, path + (index,), report)
+            if cleaned is INVALID:
+                if strict:
+                    return INVALID
+                continue
+            result.append(cleaned)
+
+        if len(result) < min_items:
+            report(path, severity, f"needs at least {min_items} item(s)")
+            return INVALID
+        return result
+
+    return validate_array
+
+
+def _compile_string(schema, severity):
+    strip = schema.get("strip", False)
+    non_empty = schema.get("non_empty", False)
+    case_insensitive = schema.get("case_insensitive", False)
+    enum = schema.get("enum")
+    allowed = frozenset(enum) if enum else None
+    pattern = re.compile(schema["pattern"]) if "pattern" in schema else None
+
+    def validate_string(value, path, report):
+        if not isinstance(value, str):
+            report(path, severity, f"expected a string, got {_type_name(value)}")
+            return INVALID
+
+        if strip or pattern is not None:
+            value = value.strip()
+        if case_insensitive:
+            value = value.lower()
+        if (non_empty or pattern is not None) and not value:
+            report(path, severity, "must not be empty")
+            return INVALID
+        if allowed is not None and value not in allowed:
+            report(path, severity, f"'{value}' is not one of {', '.join(enum)}")
+            return INVALID
+        if pattern is not None and not pattern.match(value):
+            report(path, severity, f"'{value}' is not a valid value")
+            return INVALID
+        return value
+
+    return validate_string
+
+
+_validate_manifest = compile_schema(MANIFEST_SCHEMA)
+
+
+def diagnostic(plugin_id, path, severity, message):
+    return {"plugin": plugin_id, "path": format_path(path), "severity": severity, "message": message}
+
+
+def validate_manifest(manifest, plugin_id):
+    """Return (content, diagnostics) for a parsed manifest.
+
+    content keeps only valid entries and always has the stratagems_by_department,
+    icon_overrides and themes keys.
+    """
+    diagnostics = []
+
+    def report(path, severity, message):
+        diagnostics.append(diagnostic(plugin_id, path, severity, message))
+
+    content = _validate_manifest(manifest, (), report)
+    if content is INVALID:
+        content = {}
+    content.setdefault("stratagems_by_department", {})
+    content.setdefault("icon_overrides", {})
+    content.setdefault("themes", [])
+    return content, diagnostics
+
+
+def format_diagnostic(entry):
+    """One-line form used in logs and tooltips."""
+    return f"[{entry['plugin']}] {entry['severity']}: {entry['path']}: {entry['message']}"
@@ -0,0 +1,77 @@
+"""
+Plugin file watcher for Helldivers Numpad Macros
+Watches plugin roots, plugin folders, manifests and icon override files and
+reports which plugins changed so only those are reloaded.
+"""
+
+import os
+
+from PyQt6.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+
+class PluginWatcher(QObject):
+    """Debounced QFileSystemWatcher that maps changed files back to their plugin manifest."""
+
+    # List of affected manifest paths; plugin root paths when plugins were added or removed
+    pluginsChanged = pyqtSignal(list)
+
+    DEBOUNCE_MS = 300
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_path_changed)
+        self._watcher.directoryChanged.connect(self._on_path_changed)
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._emit_pending)
+
+        self._owners = {}
+        self._pending = set()
+
+    def watch(self, plugin_roots, plugin_layers):
+        """Replace the watched set with the plugin roots and files of the given plugin layers."""
+        owners = {}
+        for root in plugin_roots:
+            if os.path.isdir(root):
+                owners[os.path.normpath(root)] = os.path.normpath(root)
+
+        for layer in plugin_layers:
+            manifest_path = layer.get("manifest_path")
+            if not manifest_path:
+                continue
+            manifest_path = os.path.normpath(manifest_path)
+            owners[manifest_path] = manifest_path
+
+            # Folder plugins: also watch the folder so replaced/added icons are noticed
+            if os.path.basename(manifest_path).lower() == "plugin.json":
+                owners.setdefault(os.path.dirname(manifest_path), manifest_path)
+            for icon_source in layer.get("icon_sources", []):
+                owners.setdefault(os.path.normpath(icon_source), manifest_path)
+
+        watched = set(self._watcher.files()) | set(self._watcher.directories())
+        stale = [path for path in watched if path not in owners]
+        if stale:
+            self._watcher.removePaths(stale)
+        missing = [path for path in owners if path not in watched and os.path.exists(path)]
+        if missing:
+            self._watcher.addPaths(missing)
+        self._owners = owners
+
+    def _on_path_changed(self, path):
+        path = os.path.normpath(path)
+        # Editors often save by replacing the file, which drops the watch
+        if os.path.exists(path) and path not in self._watcher.files() and path not in self._watcher.directories():
+            self._watcher.addPath(path)
+
+        self._pending.add(self._owners.get(path, path))
+        self._debounce.start()
+
+    def _emit_pending(self):
+        if not self._pending:
+            return
+        changed = sorted(self._pending)
+        self._pending.clear()
+        self.pluginsChanged.emit(changed)
@@ -1,23 +1,160 @@
 """
 Profile manager for Helldivers Numpad Macros
 Handles loading, saving, and managing profiles
+Profile metadata is kept in a catalogue index so listing profiles does not
+open every profile file.
 """
 
 import os
 import json
-from ..config.config import PROFILES_DIR, LEGACY_NAME_MAP
+import time
+from ..config.config import PROFILES_DIR, CACHE_DIR, LEGACY_NAME_MAP
+from ..config.settings_store import SettingsStore
+
+PROFILE_INDEX_PATH = os.path.join(CACHE_DIR, "profile_index.json")
+PROFILE_INDEX_VERSION = 2
+
+# One store key per profile so an update copies only that entry; written on the
+# settings debounce from a background thread and flushed at exit
+_DIR_MTIME_KEY = "dir_mtime_ns"
+_PROFILE_KEY_PREFIX = "profile:"
+_index_store = SettingsStore(PROFILE_INDEX_PATH, {_DIR_MTIME_KEY: None}, schema_version=PROFILE_INDEX_VERSION)
 
 
 class ProfileManager:
     """Manages profile operations"""
+
+    # In-memory copy of the catalogue index: {"dir_mtime_ns": int or None, "profiles": {name: metadata}}
+    _index = None
     
     @staticmethod
     def get_profile_list():
         """Get list of available profiles"""
-        if not os.path.exists(PROFILES_DIR):
-            os.makedirs(PROFILES_DIR, exist_ok=True)
-        files = [os.path.splitext(f)[0] for f in os.listdir(PROFILES_DIR) if f.endswith(".json")]
-        return sorted(files)
+        return sorted(ProfileManager.get_profile_catalogue())
+
+    @staticmethod
+    def get_profile_catalogue():
+        """Get metadata for every profile without opening profile files
+        
+        The index is trusted while the profiles folder mtime matches the one it
+        was built against; otherwise the folder is rescanned and only profiles
+        whose file mtime/size changed are re-read.
+        
+        Returns:
+            dict of profile name -> {'latency', 'slot_count', 'layout', 'last_used', 'mtime_ns', 'size'}
+        """
+        profiles = ProfileManager._synced_index()["profiles"]
+        return {name: dict(metadata) for name, metadata in profiles.items()}
+
+    @staticmethod
+    def mark_profile_used(profile_name):
+        """Record that a profile was just loaded (persisted on the debounce, off the GUI thread)"""
+        profiles = ProfileManager._synced_index()["profiles"]
+        if profile_name in profiles:
+            profiles[profile_name]["last_used"] = time.time()
+            ProfileManager._write_index([profile_name])
+
+    @staticmethod
+    def _profiles_dir_mtime():
+        try:
+            return os.stat(PROFILES_DIR).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _read_index():
+        if ProfileManager._index is not None:
+            return ProfileManager._index
+
+        data = _index_store.load()
+        profiles = {
+            key[len(_PROFILE_KEY_PREFIX):]: metadata
+            for key, metadata in data.items()
+            if key.startswith(_PROFILE_KEY_PREFIX) and isinstance(metadata, dict)
+        }
+        ProfileManager._index = {"dir_mtime_ns": data.get(_DIR_MTIME_KEY), "profiles": profiles}
+        return ProfileManager._index
+
+    @staticmethod
+    def _write_index(changed=(), removed=()):
+        """Stamp the index with the current folder mtime and queue a debounced write
+
+        Args:
+            changed: Names of profiles whose metadata was added or updated
+            removed: Names of profiles dropped from the index
+        """
+        index = ProfileManager._read_index()
+        index["dir_mtime_ns"] = ProfileManager._profiles_dir_mtime()
+        updates = {_DIR_MTIME_KEY: index["dir_mtime_ns"]}
+        for name in changed:
+            updates[_PROFILE_KEY_PREFIX + name] = index["profiles"][name]
+        _index_store.save(updates)
+        if removed:
+            _index_store.delete([_PROFILE_KEY_PREFIX + name for name in removed])
+
+    @staticmethod
+    def flush_index():
+        """Write a pending index update immediately (call on shutdown)"""
+        _index_store.flush()
+
+    @staticmethod
+    def _synced_index():
+        """Return the index, rescanning the profiles folder if it changed since the index was written"""
+        os.makedirs(PROFILES_DIR, exist_ok=True)
+        index = ProfileManager._read_index()
+        dir_mtime = ProfileManager._profiles_dir_mtime()
+        if dir_mtime is not None and index["dir_mtime_ns"] == dir_mtime:
+            return index
+
+        previous = index["profiles"]
+        profiles = {}
+        with os.scandir(PROFILES_DIR) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                name = entry.name[:-5]
+                stat = entry.stat()
+                metadata = previous.get(name)
+                if (metadata is None or metadata.get("mtime_ns") != stat.st_mtime_ns
+                        or metadata.get("size") != stat.st_size):
+                    metadata = ProfileManager._read_metadata(entry.path, stat, metadata)
+                profiles[name] = metadata
+
+        index["profiles"] = profiles
+        ProfileManager._write_index(
+            [name for name, metadata in profiles.items() if previous.get(name) is not metadata],
+            [name for name in previous if name not in profiles],
+        )
+        return index
+
+    @staticmethod
+    def _read_metadata(filepath, stat, previous=None):
+        data = None
+        try:
+            with open(filepath, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[ProfileManager] Could not index profile {os.path.basename(filepath)}: {e}")
+        return ProfileManager._build_metadata(data, stat, previous)
+
+    @staticmethod
+    def _build_metadata(data, stat, previous=None, layout=None):
+        """Build the index entry of one profile from its data and file stat"""
+        data = data if isinstance(data, dict) else {}
+        mappings = data.get("mappings", {})
+        try:
+            latency = int(data.get("speed", 20))
+        except (TypeError, ValueError):
+            latency = 20
+        previous = previous or {}
+        return {
+            "latency": latency,
+            "slot_count": sum(1 for strat in mappings.values() if strat) if isinstance(mappings, dict) else 0,
+            "layout": layout if layout is not None else previous.get("layout"),
+            "last_used": previous.get("last_used"),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+        }
     
     @staticmethod
     def load_profile(profile_name):
@@ -104,18 +241,23 @@ class ProfileManager:
             return None
     
     @staticmethod
-    def save_profile(profile_name, data):
+    def save_profile(profile_name, data, layout=None):
         """
         Save profile to file
         
         Args:
             profile_name: Name of the profile (without .json extension)
             data: dict with 'speed' and 'mappings' keys
+            layout: Slot layout name recorded in the catalogue (keeps the previous one if None)
         """
         filepath = ProfileManager.get_profile_path(profile_name)
         try:
+            profiles = ProfileManager._synced_index()["profiles"]
             with open(filepath, "w") as f:
                 json.dump(data, f, indent=2)
+            name = os.path.splitext(os.path.basename(filepath))[0]
+            profiles[name] = ProfileManager._build_metadata(data, os.stat(filepath), profiles.get(name), layout)
+            ProfileManager._write_index([name])
             return True
         except Exception as e:
             print(f"[ProfileManager] Error saving profile: {e}")
@@ -146,7 +288,11 @@ class ProfileManager:
         filepath = ProfileManager.get_profile_path(profile_name)
         try:
             if os.path.exists(filepath):
+                profiles = ProfileManager._synced_index()["profiles"]
                 os.remove(filepath)
+                name = os.path.splitext(os.path.basename(filepath))[0]
+                profiles.pop(name, None)
+                ProfileManager._write_index(removed=[name])
                 return True
             return False
         except Exception as e:
@@ -1,18 +1,45 @@
 """
 UI module - Dialog windows and widgets
+Dialogs are imported on first access since most sessions never open them.
 """
 
-from .dialogs import TestEnvironment, SettingsDialog, SettingsWindow
-from .widgets import Comm, DraggableIcon, NumpadSlot, comm
+import importlib
+
+from .widgets import Comm, CachedSvgIcon, NumpadSlot, comm
+from .icon_cache import IconCache, icon_cache
+from .svg_pool import SvgRendererPool, svg_pool
+from .sidebar import StratagemListModel, StratagemListView
 from .tray_manager import TrayManager
 
+_LAZY_EXPORTS = {
+    'TestEnvironment': '.dialogs',
+    'SettingsDialog': '.dialogs',
+    'SettingsWindow': '.dialogs',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     'TestEnvironment',
     'SettingsDialog',
     'SettingsWindow',
     'Comm',
     'comm',
-    'DraggableIcon',
+    'CachedSvgIcon',
+    'IconCache',
+    'icon_cache',
+    'SvgRendererPool',
+    'svg_pool',
     'NumpadSlot',
+    'StratagemListModel',
+    'StratagemListView',
     'TrayManager',
 ]
@@ -4,19 +4,22 @@ Dialog windows for Helldivers Numpad Macros
 
 import json
 import os
+from collections.abc import Mapping
 
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QSlider,
                              QPushButton, QSpinBox, QListWidget, QStackedWidget,
                              QComboBox, QCheckBox, QMessageBox, QApplication, QWidget,
-                             QInputDialog, QListWidgetItem, QLineEdit, QColorDialog)
+                             QInputDialog, QListWidgetItem, QLineEdit, QColorDialog,
+                             QFileDialog)
 from PyQt6.QtCore import Qt, QUrl
 from PyQt6.QtGui import QFont, QDesktopServices
 
 from ..config.constants import ARROW_ICONS
-from ..config.config import is_admin, run_as_admin
+from ..config.config import is_admin, run_as_admin, get_theme_stylesheet
 from ..config.version import VERSION, GITHUB_REPO_OWNER, GITHUB_REPO_NAME
 from ..managers import update_checker
 from ..managers.plugin_manager import PluginManager
+from ..managers.plugin_schema import ERROR, WARNING, format_diagnostic
 from ..managers.update_manager import UpdateDialog, check_for_updates_startup
 from ..config.config import get_install_type
 from .widgets import DeletableComboBox
@@ -510,6 +513,17 @@ class SettingsWindow(QDialog):
         """Toggle custom theme color controls based on selected theme option."""
         if hasattr(self, "custom_theme_widget"):
             self.custom_theme_widget.setVisible(theme_name == self.custom_theme_option)
+        self._preview_theme(theme_name)
+
+    def _preview_theme(self, theme_name):
+        """Preview the selected theme on this window; compiled stylesheets come from the theme cache."""
+        theme_files = getattr(self.parent_app, "theme_files", None) if self.parent_app else None
+        active_theme = self.parent_app.global_settings.get("theme") if self.parent_app else None
+        if not isinstance(theme_files, Mapping) or theme_name not in theme_files or theme_name == active_theme:
+            # Fall back to the stylesheet inherited from the main window
+            self.setStyleSheet("")
+            return
+        self.setStyleSheet(get_theme_stylesheet(theme_name, theme_files))
 
     def _connect_change_tracking(self):
         """Connect settings controls to Apply button dirty-state tracking."""
@@ -793,6 +807,11 @@ class SettingsWindow(QDialog):
         create_btn.clicked.connect(self.create_plugin_template)
         left_panel.addWidget(create_btn)
 
+        install_btn = QPushButton("Install Plugin Package...")
+        install_btn.setObjectName("settings_cancel")
+        install_btn.clicked.connect(self.install_plugin_package)
+        left_panel.addWidget(install_btn)
+
         self.plugins_list = QListWidget()
         self.plugins_list.setObjectName("plugins_list")
         self.plugins_list.setMinimumWidth(260)
@@ -805,7 +824,8 @@ class SettingsWindow(QDialog):
 
         info_label = QLabel(
             "Installed/created customization packs are listed above.\n"
-            "Use Create Customization Pack to generate a JSON template file."
+            "Use Create Customization Pack to generate a JSON template file,\n"
+            "or install a packaged .hdplugin file."
         )
         info_label.setWordWrap(True)
         info_label.setStyleSheet("color: #aaa; font-size: 12px;")
@@ -815,6 +835,26 @@ class SettingsWindow(QDialog):
 
         plugins_layout.addLayout(left_panel, 1)
 
+        right_panel = QVBoxLayout()
+        self.plugin_conflicts_label = QLabel("Conflicts")
+        self.plugin_conflicts_label.setStyleSheet("font-weight: bold;")
+        right_panel.addWidget(self.plugin_conflicts_label)
+
+        self.plugin_conflicts_list = QListWidget()
+        self.plugin_conflicts_list.setObjectName("plugin_conflicts_list")
+        self.plugin_conflicts_list.setWordWrap(True)
+        right_panel.addWidget(self.plugin_conflicts_list, 1)
+
+        conflicts_info = QLabel(
+            "Overrides, near-identical names and shared input sequences\n"
+            "across the currently loaded packs. The last pack listed wins."
+        )
+        conflicts_info.setWordWrap(True)
+        conflicts_info.setStyleSheet("color: #aaa; font-size: 12px;")
+        right_panel.addWidget(conflicts_info)
+
+        plugins_layout.addLayout(right_panel, 1)
+
         self.content_stack.addWidget(plugins_widget)
         self.refresh_plugin_list()
 
@@ -823,6 +863,7 @@ class SettingsWindow(QDialog):
         if not hasattr(self, "plugins_list"):
             return
 
+        self.refresh_plugin_conflicts()
         previously_checked = set(getattr(self, "selected_plugin_manifest_paths", []))
         self.selected_plugin_manifest_paths = []
         self.plugins_list.clear()
@@ -853,6 +894,7 @@ class SettingsWindow(QDialog):
                 parent=self.plugins_list,
             )
             row_widget.checkbox.toggled.connect(self._mark_settings_changed)
+            self._show_plugin_diagnostics(row_widget, plugin.get("diagnostics", []))
             item.setSizeHint(row_widget.sizeHint())
             self.plugins_list.setItemWidget(item, row_widget)
 
@@ -861,6 +903,54 @@ class SettingsWindow(QDialog):
 
         self.selected_plugin_manifest_paths = checked_paths
 
+    def _show_plugin_diagnostics(self, row_widget, diagnostics):
+        """Append error/warning counts to a plugin row and list every diagnostic in its tooltip."""
+        if not diagnostics:
+            return
+
+        errors = sum(1 for entry in diagnostics if entry["severity"] == ERROR)
+        warnings = sum(1 for entry in diagnostics if entry["severity"] == WARNING)
+        counts = []
+        if errors:
+            counts.append(f"{errors} error{'s' if errors != 1 else ''}")
+        if warnings:
+            counts.append(f"{warnings} warning{'s' if warnings != 1 else ''}")
+        if counts:
+            row_widget.checkbox.setText(f"{row_widget.checkbox.text()}  [{', '.join(counts)}]")
+        row_widget.checkbox.setToolTip("\n".join(format_diagnostic(entry) for entry in diagnostics))
+
+    def refresh_plugin_conflicts(self):
+        """List overrides, near-duplicate names and shared sequences from the app's conflict index."""
+        if not hasattr(self, "plugin_conflicts_list"):
+            return
+
+        self.plugin_conflicts_list.clear()
+        catalogue = getattr(self.parent_app, "catalogue", None) if self.parent_app else None
+        if catalogue is None:
+            self.plugin_conflicts_label.setText("Conflicts")
+            return
+
+        conflicts = catalogue.conflict_index()
+        kind_labels = {"stratagem": "Stratagem", "icon": "Icon", "theme": "Theme"}
+        lines = []
+        for entry in conflicts["overrides"]:
+            lines.append(
+                f"{kind_labels[entry['kind']]} override: {entry['name']} "
+                f"({' < '.join(entry['sources'])})"
+            )
+        for entry in conflicts["name_collisions"]:
+            names = ", ".join(f"{name} [{source}]" for name, source in zip(entry["names"], entry["sources"]))
+            lines.append(f"Similar names: {names}")
+        for entry in conflicts["duplicate_sequences"]:
+            names = ", ".join(f"{name} [{source}]" for name, source in zip(entry["names"], entry["sources"]))
+            lines.append(f"Same sequence ({' '.join(entry['sequence'])}): {names}")
+
+        self.plugin_conflicts_label.setText(f"Conflicts ({len(lines)})" if lines else "Conflicts")
+        if lines:
+            self.plugin_conflicts_list.addItems(lines)
+        else:
+            self.plugin_conflicts_list.addItem("No conflicts")
+
     def get_checked_plugin_manifest_paths(self):
         """Collect checked plugin manifests from plugin list."""
         checked_paths = []
@@ -962,6 +1052,27 @@ class SettingsWindow(QDialog):
         guide = PluginGuideDialog(self)
         guide.exec()
 
+    def install_plugin_package(self):
+        """Pick a .hdplugin package, copy it into the plugin folder and select it."""
+        package_path, _ = QFileDialog.getOpenFileName(
+            self, "Install Plugin Package", "", "Plugin packages (*.hdplugin)"
+        )
+        if not package_path:
+            return
+
+        success, message, installed_path = PluginManager.install_plugin_package(package_path)
+        if not success:
+            QMessageBox.warning(self, "Install Failed", message)
+            return
+
+        checked_paths = self.get_checked_plugin_manifest_paths()
+        if installed_path not in checked_paths:
+            checked_paths.append(installed_path)
+        self.selected_plugin_manifest_paths = checked_paths
+        self.refresh_plugin_list()
+        self._mark_settings_changed()
+        QMessageBox.information(self, "Plugin Package Installed", message)
+
     def delete_plugin_by_manifest(self, manifest_path, plugin_name):
         """Delete a customization pack by manifest path with confirmation."""
         if not manifest_path:
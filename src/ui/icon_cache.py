@@ -0,0 +1,356 @@
+"""
+Rasterized icon cache for Helldivers Numpad Macros
+Renders each stratagem SVG once per size and pixel ratio and keeps the bitmaps
+in memory (QPixmapCache) and on disk so repaints never touch the SVG parser.
+Cache misses are rasterized on a worker pool while widgets paint a placeholder.
+"""
+
+import atexit
+import hashlib
+import os
+import shutil
+import tempfile
+import weakref
+
+from PyQt6.QtCore import Qt, QByteArray, QCoreApplication, QObject, QRectF, QRunnable, QThread, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap, QPixmapCache
+from PyQt6.QtSvg import QSvgRenderer
+
+from ..config.config import CACHE_DIR, asset_fingerprint, read_asset_bytes
+from .svg_pool import svg_pool
+
+
+ICON_CACHE_DIR = os.path.join(CACHE_DIR, "icons")
+
+PRIORITY_VISIBLE = 10
+PRIORITY_PREFETCH = 0
+PRIORITY_PRUNE = -1
+
+
+def render_svg_image(renderer, width, height, device_pixel_ratio=1.0):
+    """Render an SVG renderer into a transparent ARGB image at physical pixel size."""
+    if renderer is None or not renderer.isValid():
+        return None
+
+    pixel_width = max(1, round(width * device_pixel_ratio))
+    pixel_height = max(1, round(height * device_pixel_ratio))
+    image = QImage(pixel_width, pixel_height, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+    renderer.render(painter, QRectF(0, 0, pixel_width, pixel_height))
+    painter.end()
+    return image
+
+
+class _RasterizeTask(QRunnable):
+    """Rasterize one icon rendition on a worker thread.
+
+    Each task parses its own renderer from the file bytes: pooled renderers and
+    QPixmap belong to the GUI thread, only QImage painting is thread-safe.
+    The cache is held weakly and skipped once it is shut down, so a late worker
+    never touches a destroyed QObject.
+    """
+
+    def __init__(self, cache, key, path, width, height, device_pixel_ratio, priority):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.cache = weakref.ref(cache)
+        self.key = key
+        self.path = path
+        self.width = width
+        self.height = height
+        self.device_pixel_ratio = device_pixel_ratio
+        self.priority = priority
+
+    def run(self):
+        cache = self.cache()
+        if cache is None or cache.is_shut_down():
+            return
+
+        image = None
+        try:
+            renderer = QSvgRenderer(QByteArray(read_asset_bytes(self.path)))
+            image = render_svg_image(renderer, self.width, self.height, self.device_pixel_ratio)
+            if image is not None:
+                cache.save_to_disk(self.key, image)
+        except Exception as e:
+            print(f"[IconCache] Could not rasterize {self.path}: {e}")
+        if not cache.is_shut_down():
+            cache._rasterized.emit(self.key, image if image is not None else QImage(), self.device_pixel_ratio)
+
+
+class _PruneTask(QRunnable):
+    """Delete disk entries of other cache versions and of sources no longer in use."""
+
+    def __init__(self, cache_dir, entry_dir, live_digests):
+        super().__init__()
+        self.cache_dir = cache_dir
+        self.entry_dir = entry_dir
+        self.live_digests = live_digests
+
+    def run(self):
+        removed = 0
+        try:
+            for name in os.listdir(self.cache_dir):
+                path = os.path.join(self.cache_dir, name)
+                if path != self.entry_dir:
+                    removed += self._remove(path)
+            for name in os.listdir(self.entry_dir):
+                # Entries (and their temp files) are named "<source digest>_<size>@<ratio>.png"
+                if name.lstrip(".").split("_", 1)[0] not in self.live_digests:
+                    removed += self._remove(os.path.join(self.entry_dir, name))
+        except OSError:
+            pass
+        if removed:
+            print(f"[IconCache] Pruned {removed} stale icon cache entries")
+
+    @staticmethod
+    def _remove(path):
+        try:
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+            return 1
+        except OSError:
+            return 0
+
+
+class IconCache(QObject):
+    """Two-level cache of rasterized SVG icons keyed by (source, size, pixel ratio)."""
+
+    iconReady = pyqtSignal(str)
+    _rasterized = pyqtSignal(str, QImage, float)
+
+    CACHE_VERSION = 2
+    PIXMAP_CACHE_LIMIT_KB = 64 * 1024
+
+    def __init__(self, cache_dir=ICON_CACHE_DIR):
+        super().__init__()
+        self.cache_dir = cache_dir
+        # Each cache version gets its own folder so older layouts are pruned as a whole
+        self.entry_dir = os.path.join(cache_dir, f"v{self.CACHE_VERSION}")
+        self._source_digests = {}
+        self._limits_applied = False
+        self._pending = {}
+        self._failed = set()
+        self._thread_pool = None
+        self._shut_down = False
+        self._rasterized.connect(self._on_rasterized, Qt.ConnectionType.QueuedConnection)
+        # aboutToQuit is not emitted on every exit path; drain workers before the QObject is destroyed
+        atexit.register(self.shutdown)
+
+    def invalidate(self, path=None):
+        """Forget source digests so edited SVG files are re-rasterized."""
+        if path is None:
+            self._source_digests.clear()
+            self._failed.clear()
+        else:
+            self._source_digests.pop(path, None)
+
+    def _source_digest(self, path):
+        """Hash the asset fingerprint once per process so lookups avoid stat calls."""
+        digest = self._source_digests.get(path)
+        if digest is not None:
+            return digest
+
+        digest = hashlib.sha1(asset_fingerprint(path).encode("utf-8")).hexdigest()
+        self._source_digests[path] = digest
+        return digest
+
+    def cache_key(self, path, width, height, device_pixel_ratio=1.0):
+        """Build the memory/disk cache key for one rendition of an icon.
+
+        Keys start with the source digest so prune() can tell which source a file belongs to.
+        """
+        return f"{self._source_digest(path)}_{int(width)}x{int(height)}@{float(device_pixel_ratio):.2f}"
+
+    def find(self, path, width, height, device_pixel_ratio=1.0):
+        """Return a cached pixmap from memory or disk, or None when not rasterized yet."""
+        self._apply_limits()
+        key = self.cache_key(path, width, height, device_pixel_ratio)
+        return self._find_key(key, device_pixel_ratio)
+
+    def _find_key(self, key, device_pixel_ratio):
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap
+
+        disk_path = os.path.join(self.entry_dir, f"{key}.png")
+        if not os.path.exists(disk_path):
+            return None
+
+        image = QImage(disk_path)
+        if image.isNull():
+            return None
+        return self._store(key, image, device_pixel_ratio)
+
+    def pixmap(self, path, width, height, device_pixel_ratio=1.0):
+        """Return a pixmap for the icon, rasterizing synchronously on a cache miss.
+
+        The result is only kept in memory; disk entries are written by the workers.
+        """
+        if not path or width <= 0 or height <= 0:
+            return None
+
+        pixmap = self.find(path, width, height, device_pixel_ratio)
+        if pixmap is not None:
+            return pixmap
+
+        image = render_svg_image(svg_pool.get(path), width, height, device_pixel_ratio)
+        if image is None:
+            return None
+
+        key = self.cache_key(path, width, height, device_pixel_ratio)
+        return self._store(key, image, device_pixel_ratio)
+
+    def request(self, path, width, height, device_pixel_ratio=1.0, priority=PRIORITY_VISIBLE):
+        """Return (key, pixmap); on a miss pixmap is None and rasterization is queued.
+
+        iconReady(key) is emitted once the queued rendition is available.
+        """
+        if not path or width <= 0 or height <= 0:
+            return None, None
+
+        self._apply_limits()
+        key = self.cache_key(path, width, height, device_pixel_ratio)
+        pixmap = self._find_key(key, device_pixel_ratio)
+        if pixmap is not None or key in self._failed:
+            return key, pixmap
+
+        self._schedule(key, path, width, height, device_pixel_ratio, priority)
+        return key, None
+
+    def prefetch(self, paths, width, height, device_pixel_ratio=1.0):
+        """Queue low-priority rasterization for icons that are not on screen yet."""
+        for path in paths:
+            if path:
+                self.request(path, width, height, device_pixel_ratio, priority=PRIORITY_PREFETCH)
+
+    def _schedule(self, key, path, width, height, device_pixel_ratio, priority):
+        if self._shut_down:
+            return
+        pool = self._get_thread_pool()
+        task = self._pending.get(key)
+        if task is not None:
+            # Bump queued prefetch work once the icon is actually on screen
+            if priority > task.priority and pool.tryTake(task):
+                task.priority = priority
+                pool.start(task, priority)
+            return
+
+        task = _RasterizeTask(self, key, path, width, height, device_pixel_ratio, priority)
+        self._pending[key] = task
+        pool.start(task, priority)
+
+    def prune(self, paths):
+        """Delete disk entries whose source is not in paths, and entries of older cache versions.
+
+        Runs on the worker pool after queued rasterization, so it never blocks the GUI thread.
+        """
+        if self._shut_down:
+            return
+        live_digests = {self._source_digest(path) for path in paths if path}
+        self._get_thread_pool().start(_PruneTask(self.cache_dir, self.entry_dir, live_digests), PRIORITY_PRUNE)
+
+    def _on_rasterized(self, key, image, device_pixel_ratio):
+        self._pending.pop(key, None)
+        if image.isNull():
+            self._failed.add(key)
+            return
+        self._store(key, image, device_pixel_ratio)
+        self.iconReady.emit(key)
+
+    def _get_thread_pool(self):
+        if self._thread_pool is None:
+            self._thread_pool = QThreadPool(self)
+            self._thread_pool.setMaxThreadCount(max(1, QThread.idealThreadCount() - 1))
+            app = QCoreApplication.instance()
+            if app is not None:
+                # PyQt deletes this cache and the pooled renderers along with the QApplication,
+                # which can happen before atexit (e.g. an app created inside a function)
+                weakref.finalize(app, self.shutdown)
+        return self._thread_pool
+
+    def is_shut_down(self):
+        return self._shut_down
+
+    def shutdown(self):
+        """Drop queued work and wait for running workers; later requests are not rasterized.
+
+        Runs from whichever of aboutToQuit, QApplication teardown and atexit comes first;
+        later calls return at once because the pool may already be deleted by then.
+        """
+        if self._shut_down:
+            return
+        self._shut_down = True
+        if self._thread_pool is None:
+            return
+        self._thread_pool.clear()
+        self._thread_pool.waitForDone()
+        self._pending.clear()
+
+    @staticmethod
+    def placeholder(width, height, device_pixel_ratio=1.0):
+        """Return the shared faint placeholder painted while an icon is rasterizing."""
+        key = f"icon-placeholder:{int(width)}x{int(height)}@{float(device_pixel_ratio):.2f}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap
+
+        pixmap = QPixmap(max(1, round(width * device_pixel_ratio)), max(1, round(height * device_pixel_ratio)))
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(255, 255, 255, 18))
+        inset = pixmap.width() * 0.2
+        painter.drawRoundedRect(
+            QRectF(inset, inset, pixmap.width() - 2 * inset, pixmap.height() - 2 * inset), 6, 6
+        )
+        painter.end()
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def _store(self, key, image, device_pixel_ratio):
+        """Convert image to pixmap and insert it into the in-memory cache."""
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def save_to_disk(self, key, image):
+        """Persist rasterized image so later cold starts skip SVG parsing.
+
+        The PNG is written to a temp file and renamed into place, so readers never see a partial file.
+        """
+        temp_path = None
+        try:
+            os.makedirs(self.entry_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix=f".{key}.", suffix=".tmp", dir=self.entry_dir)
+            os.close(fd)
+            if not image.save(temp_path, "PNG"):
+                raise OSError("PNG encoding failed")
+            os.replace(temp_path, os.path.join(self.entry_dir, f"{key}.png"))
+        except Exception as e:
+            print(f"[IconCache] Could not write icon cache entry: {e}")
+            if temp_path and os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+
+    def _apply_limits(self):
+        """Raise QPixmapCache limit once so large plugin icon sets stay resident."""
+        if self._limits_applied:
+            return
+        if QPixmapCache.cacheLimit() < self.PIXMAP_CACHE_LIMIT_KB:
+            QPixmapCache.setCacheLimit(self.PIXMAP_CACHE_LIMIT_KB)
+        self._limits_applied = True
+
+
+icon_cache = IconCache()
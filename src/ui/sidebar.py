@@ -0,0 +1,400 @@
+"""
+Virtualized stratagem sidebar for Helldivers Numpad Macros
+Model/view replacement for the per-item widget list: rows are plain data and the
+delegate paints department headers and cached icon pixmaps only for visible rows
+"""
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QMimeData, QPoint, QRect, QSize, pyqtSignal
+from PyQt6.QtGui import QDrag, QPainter, QPalette, QPixmap
+from PyQt6.QtWidgets import QLabel, QListView, QStyle, QStyledItemDelegate, QStyleOption, QWidget
+
+from ..config.config import find_svg_path
+from .icon_cache import icon_cache
+
+
+ROW_HEADER = "header"
+ROW_ICON = "icon"
+
+HEADER_HEIGHT = 32
+ICON_CELL_SIZE = 80
+ICON_TILE_SIZE = 72
+ICON_PADDING = 5
+
+
+class StratagemListModel(QAbstractListModel):
+    """Flat list of department headers and stratagem icons with search/collapse filtering."""
+
+    KindRole = int(Qt.ItemDataRole.UserRole) + 1
+    NameRole = int(Qt.ItemDataRole.UserRole) + 2
+    DepartmentRole = int(Qt.ItemDataRole.UserRole) + 3
+    SvgPathRole = int(Qt.ItemDataRole.UserRole) + 4
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries = []
+        self._rows = []
+        self._svg_paths = {}
+        self._filter_text = ""
+        self._expanded_state = {}
+
+    @staticmethod
+    def _catalogue_entries(stratagems_by_department):
+        entries = []
+        for department, stratagems in stratagems_by_department.items():
+            entries.append((ROW_HEADER, department, department))
+            for name in sorted(stratagems.keys()):
+                entries.append((ROW_ICON, name, department))
+        return entries
+
+    def set_catalogue(self, stratagems_by_department):
+        """Replace all entries with departments and their sorted stratagem names."""
+        self.beginResetModel()
+        self._entries = self._catalogue_entries(stratagems_by_department)
+        self._svg_paths = {}
+        self._rows = self._visible_entries()
+        self.endResetModel()
+
+    def update_catalogue(self, stratagems_by_department, changed_icons=()):
+        """Apply a catalogue change in place, inserting/removing only the rows that differ.
+
+        Filter text and collapse state are kept; icons for changed_icons are re-resolved.
+        """
+        for name in changed_icons:
+            self._svg_paths.pop(name, None)
+
+        self._entries = self._catalogue_entries(stratagems_by_department)
+        new_rows = self._visible_entries()
+        changes = self._row_changes(self._rows, new_rows)
+        if changes is None:
+            # Departments were reordered; nothing to keep
+            self.beginResetModel()
+            self._rows = new_rows
+            self.endResetModel()
+            changes = []
+
+        # Apply from the end so earlier row numbers stay valid
+        for old_start, old_end, new_start, new_end in reversed(changes):
+            if old_end > old_start:
+                self.beginRemoveRows(QModelIndex(), old_start, old_end - 1)
+                del self._rows[old_start:old_end]
+                self.endRemoveRows()
+            if new_end > new_start:
+                self.beginInsertRows(QModelIndex(), old_start, old_start + new_end - new_start - 1)
+                self._rows[old_start:old_start] = new_rows[new_start:new_end]
+                self.endInsertRows()
+
+        changed_icons = set(changed_icons)
+        if changed_icons:
+            for row, (kind, name, _) in enumerate(self._rows):
+                if kind == ROW_ICON and name in changed_icons:
+                    index = self.index(row)
+                    self.dataChanged.emit(index, index, [self.SvgPathRole])
+
+    @staticmethod
+    def _row_changes(old_rows, new_rows):
+        """Return (old_start, old_end, new_start, new_end) spans that differ, in one linear pass.
+
+        Rows are ordered by department, header first, then by name, so both lists
+        are merged like sorted sequences. Returns None when departments present in
+        both lists changed their relative order.
+        """
+        old_departments = list(dict.fromkeys(department for _, _, department in old_rows))
+        new_departments = list(dict.fromkeys(department for _, _, department in new_rows))
+        old_set = set(old_departments)
+        new_set = set(new_departments)
+        if [d for d in old_departments if d in new_set] != [d for d in new_departments if d in old_set]:
+            return None
+
+        # One ranking that keeps the order of both lists; removed departments keep their old place
+        rank = {}
+        old_index = 0
+        for department in new_departments:
+            while old_index < len(old_departments) and old_departments[old_index] not in new_set:
+                rank[old_departments[old_index]] = len(rank)
+                old_index += 1
+            if old_index < len(old_departments) and old_departments[old_index] == department:
+                old_index += 1
+            rank[department] = len(rank)
+        for department in old_departments[old_index:]:
+            rank.setdefault(department, len(rank))
+
+        def sort_key(row):
+            kind, name, department = row
+            return rank[department], kind != ROW_HEADER, name
+
+        changes = []
+        old_pos = new_pos = 0
+        old_count, new_count = len(old_rows), len(new_rows)
+        while old_pos < old_count or new_pos < new_count:
+            if old_pos < old_count and new_pos < new_count and old_rows[old_pos] == new_rows[new_pos]:
+                old_pos += 1
+                new_pos += 1
+                continue
+            old_start, new_start = old_pos, new_pos
+            while old_pos < old_count or new_pos < new_count:
+                if old_pos < old_count and new_pos < new_count:
+                    if old_rows[old_pos] == new_rows[new_pos]:
+                        break
+                    if sort_key(old_rows[old_pos]) < sort_key(new_rows[new_pos]):
+                        old_pos += 1
+                    else:
+                        new_pos += 1
+                elif old_pos < old_count:
+                    old_pos += 1
+                else:
+                    new_pos += 1
+            changes.append((old_start, old_pos, new_start, new_pos))
+        return changes
+
+    def departments(self):
+        """Return department names in display order."""
+        return [name for kind, name, _ in self._entries if kind == ROW_HEADER]
+
+    def stratagem_names(self):
+        """Return every stratagem name regardless of filter state."""
+        return [name for kind, name, _ in self._entries if kind == ROW_ICON]
+
+    def set_filter(self, text, expanded_state):
+        """Apply search text and department collapse state to visible rows."""
+        self._filter_text = (text or "").lower()
+        self._expanded_state = dict(expanded_state)
+        rows = self._visible_entries()
+        if rows == self._rows:
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def is_expanded(self, department):
+        return self._expanded_state.get(department, True)
+
+    def _visible_entries(self):
+        text = self._filter_text
+        rows = []
+        for entry in self._entries:
+            kind, name, department = entry
+            if kind == ROW_HEADER:
+                # Headers are hidden while searching
+                if not text:
+                    rows.append(entry)
+                continue
+            if text and text not in name.lower():
+                continue
+            if not self._expanded_state.get(department, True):
+                continue
+            rows.append(entry)
+        return rows
+
+    def svg_path(self, name):
+        """Resolve and memoize the SVG path for a stratagem name."""
+        if name not in self._svg_paths:
+            self._svg_paths[name] = find_svg_path(name)
+        return self._svg_paths[name]
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+
+        kind, name, department = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if kind == ROW_HEADER:
+                arrow = "▼" if self.is_expanded(department) else "▶"
+                return f"{arrow} {department}"
+            return name
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return name if kind == ROW_ICON else None
+        if role == self.KindRole:
+            return kind
+        if role == self.NameRole:
+            return name
+        if role == self.DepartmentRole:
+            return department
+        if role == self.SvgPathRole:
+            return self.svg_path(name) if kind == ROW_ICON else None
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled
+        if index.data(self.KindRole) == ROW_ICON:
+            flags |= Qt.ItemFlag.ItemIsDragEnabled
+        return flags
+
+
+class StratagemItemDelegate(QStyledItemDelegate):
+    """Paint headers and icon tiles using hidden template widgets styled by the active QSS."""
+
+    def __init__(self, view):
+        super().__init__(view)
+        self.view = view
+
+        # Templates pick up theme rules (QWidget[role="icon"], QLabel#department_header)
+        self.icon_template = QWidget(view)
+        self.icon_template.setProperty("role", "icon")
+        self.icon_template.hide()
+
+        self.header_template = QLabel(view)
+        self.header_template.setObjectName("department_header")
+        self.header_template.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        self.header_template.hide()
+
+    def sizeHint(self, option, index):
+        if index.data(StratagemListModel.KindRole) == ROW_HEADER:
+            return QSize(max(0, self.view.viewport().width()), HEADER_HEIGHT)
+        return QSize(ICON_CELL_SIZE, ICON_CELL_SIZE)
+
+    def paint(self, painter, option, index):
+        if index.data(StratagemListModel.KindRole) == ROW_HEADER:
+            self.paint_header(painter, option.rect, index.data(Qt.ItemDataRole.DisplayRole))
+            return
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        self.paint_icon(painter, option.rect.topLeft(), index.data(StratagemListModel.SvgPathRole), hovered)
+
+    def paint_header(self, painter, rect, text):
+        template = self.header_template
+        template.ensurePolished()
+        template.resize(rect.size())
+
+        opt = QStyleOption()
+        opt.initFrom(template)
+        opt.rect = rect
+        template.style().drawPrimitive(QStyle.PrimitiveElement.PE_Widget, opt, painter, template)
+
+        text_rect = template.contentsRect().translated(rect.topLeft())
+        painter.save()
+        painter.setFont(template.font())
+        template.style().drawItemText(
+            painter,
+            text_rect,
+            int(template.alignment()),
+            template.palette(),
+            True,
+            text or "",
+            QPalette.ColorRole.WindowText,
+        )
+        painter.restore()
+
+    def paint_icon(self, painter, top_left, svg_path, hovered=False, sync=False):
+        tile_rect = QRect(top_left, QSize(ICON_TILE_SIZE, ICON_TILE_SIZE))
+        opt = QStyleOption()
+        opt.initFrom(self.icon_template)
+        opt.rect = tile_rect
+        if hovered:
+            opt.state |= QStyle.StateFlag.State_MouseOver
+        else:
+            opt.state &= ~QStyle.StateFlag.State_MouseOver
+        self.icon_template.style().drawPrimitive(
+            QStyle.PrimitiveElement.PE_Widget, opt, painter, self.icon_template
+        )
+
+        if not svg_path:
+            return
+        icon_rect = tile_rect.adjusted(ICON_PADDING, ICON_PADDING, -ICON_PADDING, -ICON_PADDING)
+        dpr = self.view.devicePixelRatioF()
+        if sync:
+            pixmap = icon_cache.pixmap(svg_path, icon_rect.width(), icon_rect.height(), dpr)
+        else:
+            _, pixmap = icon_cache.request(svg_path, icon_rect.width(), icon_rect.height(), dpr)
+            if pixmap is None:
+                pixmap = icon_cache.placeholder(icon_rect.width(), icon_rect.height(), dpr)
+        if pixmap is not None:
+            painter.drawPixmap(icon_rect, pixmap)
+
+
+class StratagemListView(QListView):
+    """Wrapping icon view over StratagemListModel with header toggling and drag support."""
+
+    departmentToggled = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.list_model = StratagemListModel(self)
+        self.setModel(self.list_model)
+        self.item_delegate = StratagemItemDelegate(self)
+        self.setItemDelegate(self.item_delegate)
+
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setMovement(QListView.Movement.Static)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(500)
+        self.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.setSpacing(8)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover, True)
+        icon_cache.iconReady.connect(self._on_icon_ready)
+
+    def set_catalogue(self, stratagems_by_department):
+        self.list_model.set_catalogue(stratagems_by_department)
+
+    def update_catalogue(self, stratagems_by_department, changed_icons=()):
+        self.list_model.update_catalogue(stratagems_by_department, changed_icons)
+
+    def set_filter(self, text, expanded_state):
+        self.list_model.set_filter(text, expanded_state)
+
+    def icon_paths(self):
+        """Return the icon path of every stratagem in the catalogue."""
+        return [self.list_model.svg_path(name) for name in self.list_model.stratagem_names()]
+
+    def prefetch_icons(self):
+        """Queue background rasterization of every sidebar icon at tile size."""
+        icon_size = ICON_TILE_SIZE - 2 * ICON_PADDING
+        icon_cache.prefetch(self.icon_paths(), icon_size, icon_size, self.devicePixelRatioF())
+
+    def _on_icon_ready(self, key):
+        self.viewport().update()
+
+    def refresh_header_widths(self):
+        """Re-layout so header rows track the viewport width."""
+        self.doItemsLayout()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.refresh_header_widths()
+
+    def mousePressEvent(self, event):
+        index = self.indexAt(event.position().toPoint())
+        if not index.isValid() or event.button() != Qt.MouseButton.LeftButton:
+            super().mousePressEvent(event)
+            return
+
+        kind = index.data(StratagemListModel.KindRole)
+        if kind == ROW_HEADER:
+            self.departmentToggled.emit(index.data(StratagemListModel.DepartmentRole))
+            event.accept()
+            return
+
+        self.start_icon_drag(index)
+        event.accept()
+
+    def start_icon_drag(self, index):
+        """Start a drag carrying the sidebar mime payload NumpadSlot accepts."""
+        name = index.data(StratagemListModel.NameRole)
+        drag = QDrag(self)
+        mime = QMimeData()
+        mime.setText(name)
+        mime.setData("source", b"sidebar")
+        drag.setMimeData(mime)
+        drag.setPixmap(self.render_icon_pixmap(index))
+        drag.exec(Qt.DropAction.MoveAction)
+
+    def render_icon_pixmap(self, index):
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(round(ICON_TILE_SIZE * dpr), round(ICON_TILE_SIZE * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        self.item_delegate.paint_icon(
+            painter, QPoint(0, 0), index.data(StratagemListModel.SvgPathRole), hovered=True, sync=True
+        )
+        painter.end()
+        return pixmap
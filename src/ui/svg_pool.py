@@ -0,0 +1,101 @@
+"""
+Shared SVG renderer pool for Helldivers Numpad Macros
+Hands out already-parsed QSvgRenderer instances keyed by resolved icon path
+(or content hash for inline SVG code), evicting the least recently used ones
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+
+from PyQt6.QtCore import Qt, QByteArray, QRectF
+from PyQt6.QtGui import QIcon, QPainter, QPixmap
+from PyQt6.QtSvg import QSvgRenderer
+
+from ..config.config import read_asset_bytes, split_resource_path
+
+
+class SvgRendererPool:
+    """LRU cache of parsed SVG renderers (GUI thread only).
+
+    Renderers are only used for the duration of one call, so eviction never
+    pulls a renderer out from under a caller.
+    """
+
+    DEFAULT_CAPACITY = 64
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = max(1, int(capacity))
+        self._renderers = OrderedDict()
+
+    @staticmethod
+    def key_for(path=None, svg_data=None):
+        """Return pool key for a file path or inline SVG bytes/text."""
+        if svg_data is not None:
+            if isinstance(svg_data, str):
+                svg_data = svg_data.encode("utf-8")
+            return "sha1:" + hashlib.sha1(bytes(svg_data)).hexdigest()
+        if path:
+            scheme, _ = split_resource_path(path)
+            return path if scheme else os.path.normcase(os.path.abspath(path))
+        return None
+
+    def get(self, path=None, svg_data=None):
+        """Return the parsed renderer for a path or inline SVG, parsing only on first use."""
+        key = self.key_for(path, svg_data)
+        if key is None:
+            return None
+
+        renderer = self._renderers.get(key)
+        if renderer is not None:
+            self._renderers.move_to_end(key)
+            return renderer
+
+        if svg_data is not None:
+            if isinstance(svg_data, str):
+                svg_data = svg_data.encode("utf-8")
+            renderer = QSvgRenderer(QByteArray(bytes(svg_data)))
+        elif split_resource_path(path)[0]:
+            renderer = QSvgRenderer(QByteArray(read_asset_bytes(path)))
+        else:
+            renderer = QSvgRenderer(path)
+        self._renderers[key] = renderer
+        while len(self._renderers) > self.capacity:
+            self._renderers.popitem(last=False)
+        return renderer
+
+    def invalidate(self, path=None):
+        """Drop cached renderers (all, or the one for path) so files are re-parsed."""
+        if path is None:
+            self._renderers.clear()
+        else:
+            self._renderers.pop(self.key_for(path), None)
+
+    def render_pixmap(self, width, height, device_pixel_ratio=1.0, path=None, svg_data=None):
+        """Render a pooled SVG into a transparent pixmap, or None if invalid."""
+        renderer = self.get(path, svg_data)
+        if renderer is None or not renderer.isValid():
+            return None
+        pixmap = QPixmap(
+            max(1, round(width * device_pixel_ratio)),
+            max(1, round(height * device_pixel_ratio)),
+        )
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        renderer.render(painter, QRectF(0, 0, pixmap.width(), pixmap.height()))
+        painter.end()
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        return pixmap
+
+    def icon(self, width, height, device_pixel_ratio=1.0, path=None, svg_data=None):
+        """Build a QIcon from a pooled SVG, or None if invalid."""
+        pixmap = self.render_pixmap(width, height, device_pixel_ratio, path=path, svg_data=svg_data)
+        return QIcon(pixmap) if pixmap is not None else None
+
+    def stats(self):
+        """Return the number of cached renderers."""
+        return {"cached": len(self._renderers)}
+
+
+svg_pool = SvgRendererPool()
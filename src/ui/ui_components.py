@@ -3,13 +3,13 @@ UI components module for Helldivers Numpad Macros
 DEPRECATED: This module is kept for backwards compatibility only.
 All components have been moved to:
 - dialogs.py: TestEnvironment, SettingsDialog, SettingsWindow
-- widgets.py: Comm, DraggableIcon, NumpadSlot
+- widgets.py: Comm, NumpadSlot
 
 Import from those modules directly in new code.
 """
 
 from .dialogs import TestEnvironment, SettingsDialog, SettingsWindow
-from .widgets import Comm, DraggableIcon, NumpadSlot, comm
+from .widgets import Comm, NumpadSlot, comm
 
 __all__ = [
     'TestEnvironment',
@@ -17,6 +17,5 @@ __all__ = [
     'SettingsWindow',
     'Comm',
     'comm',
-    'DraggableIcon',
     'NumpadSlot',
 ]
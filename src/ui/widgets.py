@@ -4,14 +4,14 @@ Reusable widgets for Helldivers Numpad Macros
 
 import time
 import winsound
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QSizePolicy, QComboBox, QListView, QStyledItemDelegate
-from PyQt6.QtCore import Qt, QObject, pyqtSignal, QEvent, QRect
-from PyQt6.QtSvgWidgets import QSvgWidget
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QComboBox, QListView, QStyledItemDelegate
+from PyQt6.QtCore import Qt, QObject, pyqtSignal, QEvent, QRect, QSize
 from PyQt6.QtGui import QDrag, QColor, QPen, QPainter
 from PyQt6.QtCore import QMimeData
 
 import keyboard
 from ..config.config import find_svg_path
+from .icon_cache import icon_cache
 
 
 class Comm(QObject):
@@ -117,35 +117,46 @@ class DeletableComboBox(QComboBox):
         return super().eventFilter(obj, event)
 
 
-class DraggableIcon(QWidget):
-    """Draggable stratagem icon widget for sidebar"""
-    
-    def __init__(self, name):
-        super().__init__()
-        self.name = name
-        self.setProperty("role", "icon")
-        
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(5, 5, 5, 5)
-        
-        self.svg_view = QSvgWidget()
-        path = find_svg_path(name)
-        if path:
-            self.svg_view.load(path)
-        
-        layout.addWidget(self.svg_view)
-        self.setToolTip(name)
+class CachedSvgIcon(QWidget):
+    """Lightweight SVG display that paints pre-rasterized pixmaps from the icon cache"""
 
-    def mousePressEvent(self, event):
-        """Handle mouse press for drag operation"""
-        if event.button() == Qt.MouseButton.LeftButton:
-            drag = QDrag(self)
-            mime = QMimeData()
-            mime.setText(self.name)
-            mime.setData("source", b"sidebar")
-            drag.setMimeData(mime)
-            drag.setPixmap(self.grab())
-            drag.exec(Qt.DropAction.MoveAction)
+    DEFAULT_SIZE = QSize(126, 126)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.svg_path = None
+        self._icon_key = None
+        icon_cache.iconReady.connect(self._on_icon_ready)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
+
+    def load(self, path):
+        """Set the SVG file to display (QSvgWidget-compatible).
+
+        Nothing is parsed here; paintEvent draws the cached rasterization.
+        """
+        self.svg_path = path or None
+        self.updateGeometry()
+        self.update()
+
+    def sizeHint(self):
+        if self.svg_path:
+            return self.DEFAULT_SIZE
+        return super().sizeHint()
+
+    def paintEvent(self, event):
+        if not self.svg_path:
+            return
+        dpr = self.devicePixelRatioF()
+        self._icon_key, pixmap = icon_cache.request(self.svg_path, self.width(), self.height(), dpr)
+        if pixmap is None:
+            pixmap = icon_cache.placeholder(self.width(), self.height(), dpr)
+        painter = QPainter(self)
+        painter.drawPixmap(self.rect(), pixmap)
+        painter.end()
+
+    def _on_icon_ready(self, key):
+        if key == self._icon_key:
+            self.update()
 
 
 class NumpadSlot(QWidget):
@@ -167,7 +178,7 @@ class NumpadSlot(QWidget):
         self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.layout.addWidget(self.label)
         
-        self.svg_display = QSvgWidget()
+        self.svg_display = CachedSvgIcon()
         self.layout.addWidget(self.svg_display, alignment=Qt.AlignmentFlag.AlignCenter)
         self.svg_display.hide()
         
@@ -178,12 +189,13 @@ class NumpadSlot(QWidget):
         self.is_hidden = bool(hidden)
         if self.is_hidden:
             self.assigned_stratagem = None
+            self.svg_display.load(None)
             self.svg_display.hide()
             self.label.setText("")
             self.label.hide()
             self.setAcceptDrops(False)
             self.setCursor(Qt.CursorShape.ArrowCursor)
-            self.setStyleSheet(self.build_slot_stylesheet(False))
+            self._set_assigned_property(False)
             return
 
         self.setAcceptDrops(True)
@@ -195,29 +207,25 @@ class NumpadSlot(QWidget):
         """Update visual style based on whether slot is assigned"""
         if self.is_hidden:
             self.setCursor(Qt.CursorShape.ArrowCursor)
-            self.setStyleSheet(self.build_slot_stylesheet(False))
+            self._set_assigned_property(False)
             return
 
         self.setCursor(
             Qt.CursorShape.PointingHandCursor if assigned else Qt.CursorShape.ArrowCursor
         )
-        self.setStyleSheet(self.build_slot_stylesheet(assigned))
-
-    @staticmethod
-    def build_slot_stylesheet(assigned):
-        """Return the exact stylesheet used by numpad slots."""
-        if assigned:
-            border_style, color, bg = "solid", "#ffcc00", "#151515"
-            hover_border, hover_bg = "#ff4444", "#201010"
-        else:
-            border_style, color, bg = "dashed", "#444", "#0a0a0a"
-            hover_border, hover_bg = "#ffcc00", "#151515"
+        self._set_assigned_property(assigned)
 
-        return (
-            f"QWidget {{ border: 2px {border_style} {color}; background: {bg}; "
-            f"color: #888; border-radius: 8px; font-weight: bold; }} "
-            f"QWidget:hover {{ border: 2px solid {hover_border}; background: {hover_bg}; }}"
-        )
+    def _set_assigned_property(self, assigned):
+        """Switch theme rules via the "assigned" property; repolish only on change."""
+        assigned = bool(assigned)
+        if self.property("assigned") == assigned:
+            return
+        self.setProperty("assigned", assigned)
+        # Slot rules also style the label, which has to pick up the new state
+        for widget in (self, self.label):
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+            widget.update()
 
     def mousePressEvent(self, event):
         """Handle mouse press for clearing or dragging"""
@@ -272,18 +280,20 @@ class NumpadSlot(QWidget):
         
         event.accept()
 
-    def clear_slot(self):
-        """Clear the slot assignment"""
+    def clear_slot(self, notify=True):
+        """Clear the slot assignment; notify=False skips the app change callback for batched updates"""
         if self.is_hidden:
             return
         self.assigned_stratagem = None
+        self.svg_display.load(None)
         self.svg_display.hide()
         self.label.show()
         self.update_style(False)
-        self.parent_app.on_change()
+        if notify:
+            self.parent_app.on_change()
 
-    def assign(self, strat_name):
-        """Assign a stratagem to this slot"""
+    def assign(self, strat_name, notify=True):
+        """Assign a stratagem to this slot; notify=False skips the app change callback for batched updates"""
         if self.is_hidden:
             return
         self.assigned_stratagem = strat_name
@@ -293,7 +303,26 @@ class NumpadSlot(QWidget):
             self.svg_display.load(path)
             self.svg_display.show()
             self.update_style(True)
-        self.parent_app.on_change()
+        elif self.svg_display.isVisibleTo(self):
+            # Replacing an icon with a stratagem that has none; show the key label instead
+            self.svg_display.load(None)
+            self.svg_display.hide()
+            self.label.show()
+            self.update_style(False)
+        if notify:
+            self.parent_app.on_change()
+
+    def refresh_icon(self):
+        """Reload the assigned stratagem icon, e.g. after a plugin replaced it."""
+        if self.is_hidden or not self.assigned_stratagem:
+            return
+        path = find_svg_path(self.assigned_stratagem)
+        if path:
+            # Slots assigned before their plugin was merged show a text label until now
+            self.label.hide()
+            self.svg_display.load(path)
+            self.svg_display.show()
+            self.update_style(True)
 
     def run_macro(self, name, sequence, key_label):
         """Execute the macro for this slot"""
@@ -317,48 +346,3 @@ class NumpadSlot(QWidget):
         
         if self.parent_app.global_settings.get("visual_enabled", True):
             self.parent_app.show_status(f"✓ {name} executed", 1500)
-
-
-class CollapsibleDepartmentHeader(QWidget):
-    """Clickable department header that can be collapsed/expanded"""
-    
-    def __init__(self, department_name, parent_app=None):
-        super().__init__()
-        self.department_name = department_name
-        self.parent_app = parent_app
-        self.is_expanded = True
-        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-        
-        self.header_label = QLabel()
-        self.header_label.setObjectName("department_header")
-        self.header_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        self.header_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.update_header_display()
-        
-        layout.addWidget(self.header_label)
-        self.setLayout(layout)
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-    
-    def update_header_display(self):
-        """Update the header display with expand/collapse arrow"""
-        arrow = "▼" if self.is_expanded else "▶"
-        self.header_label.setText(f"{arrow} {self.department_name}")
-    
-    def mousePressEvent(self, event):
-        """Handle click to toggle collapse/expand"""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.toggle_collapse()
-            event.accept()
-    
-    def toggle_collapse(self):
-        """Toggle the collapse/expand state"""
-        self.is_expanded = not self.is_expanded
-        self.update_header_display()
-        
-        # Notify parent app to update visibility
-        if self.parent_app and hasattr(self.parent_app, 'update_department_visibility'):
-            self.parent_app.update_department_visibility(self.department_name, self.is_expanded)
@@ -0,0 +1,201 @@
+"""
+Startup profiler for Helldivers Numpad Macros
+Records wall and CPU time per startup phase plus per-module import times.
+Enabled with the --profile-startup flag or HDM_PROFILE_STARTUP=1; when
+disabled every hook is a no-op. Results are printed as a table and saved as
+startup_profile.json in the app data directory.
+
+Import this module before any other application import so module import
+times are captured. It lives outside the src package so importing it runs no
+package __init__ code that would escape the import hook.
+"""
+
+import builtins
+import contextlib
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+
+PROFILE_FLAG = "--profile-startup"
+PROFILE_ENV_VAR = "HDM_PROFILE_STARTUP"
+PROFILE_FILENAME = "startup_profile.json"
+
+_NULL_CONTEXT = contextlib.nullcontext()
+
+
+def startup_profiling_requested(argv=None, environ=None):
+    """Check the command line flag and environment variable."""
+    argv = sys.argv if argv is None else argv
+    environ = os.environ if environ is None else environ
+    value = environ.get(PROFILE_ENV_VAR, "").strip().lower()
+    return PROFILE_FLAG in argv or value in ("1", "true", "yes", "on")
+
+
+class StartupProfiler:
+    """Collects nested phase timings and first-time module import timings."""
+
+    def __init__(self, enabled=False):
+        self.enabled = bool(enabled)
+        self.finished = False
+        self.phases = []
+        self.imports = []
+        self._phase_depth = 0
+        self._open_phases = []
+        # Per-thread import stacks: worker threads import concurrently with the GUI thread
+        self._import_local = threading.local()
+        self._original_import = None
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.process_time()
+        if self.enabled:
+            self._install_import_hook()
+
+    @property
+    def active(self):
+        return self.enabled and not self.finished
+
+    def phase(self, name):
+        """Context manager timing one startup phase (no-op when inactive)."""
+        if not self.active:
+            return _NULL_CONTEXT
+        return self._timed_phase(name)
+
+    @contextlib.contextmanager
+    def _timed_phase(self, name):
+        token = self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(token)
+
+    def begin(self, name, detached=False):
+        """Open a phase that spans callbacks; closed by end() or finish().
+
+        Detached phases (background work overlapping other phases) are listed at
+        the top level and do not nest the phases opened while they run.
+        """
+        if not self.active:
+            return None
+        entry = {"name": name, "depth": 0 if detached else self._phase_depth, "wall_ms": 0.0, "cpu_ms": 0.0}
+        self.phases.append(entry)
+        if not detached:
+            self._phase_depth += 1
+        token = (entry, time.perf_counter(), time.process_time(), detached)
+        self._open_phases.append(token)
+        return token
+
+    def end(self, token):
+        """Close a phase opened with begin()."""
+        if token is None or not any(open_token is token for open_token in self._open_phases):
+            return
+        entry, start_wall, start_cpu, detached = token
+        entry["wall_ms"] = (time.perf_counter() - start_wall) * 1000
+        entry["cpu_ms"] = (time.process_time() - start_cpu) * 1000
+        self._open_phases = [open_token for open_token in self._open_phases if open_token is not token]
+        if not detached:
+            self._phase_depth -= 1
+
+    def record_since_start(self, name):
+        """Record a top-level phase spanning from profiler import until now."""
+        if not self.active:
+            return
+        self.phases.append({
+            "name": name,
+            "depth": 0,
+            "wall_ms": (time.perf_counter() - self._start_wall) * 1000,
+            "cpu_ms": (time.process_time() - self._start_cpu) * 1000,
+        })
+
+    def _install_import_hook(self):
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def _remove_import_hook(self):
+        if self._original_import is not None and builtins.__import__ == self._timed_import:
+            builtins.__import__ = self._original_import
+        self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import
+        try:
+            package = globals.get("__package__") if level and globals else None
+            module_name = importlib.util.resolve_name("." * level + name, package) if level else name
+        except (ImportError, ValueError):
+            module_name = name
+
+        if module_name in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+
+        import_stack = getattr(self._import_local, "stack", None)
+        if import_stack is None:
+            import_stack = self._import_local.stack = []
+
+        frame = {"children_ms": 0.0}
+        import_stack.append(frame)
+        start = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            import_stack.pop()
+            if import_stack:
+                import_stack[-1]["children_ms"] += elapsed
+            self.imports.append({
+                "module": module_name,
+                "depth": len(import_stack),
+                "inclusive_ms": elapsed,
+                "self_ms": max(0.0, elapsed - frame["children_ms"]),
+            })
+
+    def report(self):
+        """Return the collected profile as a JSON-serializable dict."""
+        return {
+            "total_wall_ms": (time.perf_counter() - self._start_wall) * 1000,
+            "total_cpu_ms": (time.process_time() - self._start_cpu) * 1000,
+            "phases": self.phases,
+            "imports": sorted(self.imports, key=lambda entry: entry["self_ms"], reverse=True),
+        }
+
+    def format_table(self, report, top_imports=15):
+        """Format phases and the slowest imports as a plain-text table."""
+        lines = [f"{'Phase':<44}{'Wall ms':>10}{'CPU ms':>10}"]
+        for entry in report["phases"]:
+            label = "  " * entry["depth"] + entry["name"]
+            lines.append(f"{label:<44}{entry['wall_ms']:>10.1f}{entry['cpu_ms']:>10.1f}")
+        lines.append(f"{'Total':<44}{report['total_wall_ms']:>10.1f}{report['total_cpu_ms']:>10.1f}")
+
+        if report["imports"]:
+            lines.append("")
+            lines.append(f"{'Import (slowest self time)':<44}{'Self ms':>10}{'Incl ms':>10}")
+            for entry in report["imports"][:top_imports]:
+                lines.append(f"{entry['module']:<44}{entry['self_ms']:>10.1f}{entry['inclusive_ms']:>10.1f}")
+        return "\n".join(lines)
+
+    def finish(self):
+        """Stop profiling, print the table and save JSON to the app data directory."""
+        if not self.active:
+            return None
+        for token in reversed(list(self._open_phases)):
+            self.end(token)
+        self._remove_import_hook()
+        report = self.report()
+        self.finished = True
+
+        print("[Startup] Startup profile")
+        print(self.format_table(report))
+
+        from src.config.config import get_app_data_dir
+
+        output_path = os.path.join(get_app_data_dir(), PROFILE_FILENAME)
+        try:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            print(f"[Startup] Profile saved to {output_path}")
+        except OSError as e:
+            print(f"[Startup] Could not save profile: {e}")
+        return report
+
+
+startup_profiler = StartupProfiler(enabled=startup_profiling_requested())